@@ -2,6 +2,7 @@
 
 import argparse
 import logging
+import multiprocessing
 import sys
 from pathlib import Path
 from typing import Any
@@ -51,7 +52,12 @@ class LensLogic:
         self.statistics_generator = StatisticsGenerator(self.config)
         self.backup_manager = BackupManager(self.config)
         self.config_wizard = ConfigurationWizard(self.config_manager)
-        self.xmp_analyzer = XMPAnalyzer(console=self.progress_tracker.console)
+        xmp_config = self.config.get("xmp_analysis", {})
+        self.xmp_analyzer = XMPAnalyzer(
+            console=self.progress_tracker.console,
+            skip_dirs=xmp_config.get("skip_dirs"),
+            skip_suffixes=xmp_config.get("skip_suffixes"),
+        )
 
     def setup_logging(self):
         log_file = self.config.get("general", {}).get("log_file", "lenslogic.log")
@@ -429,16 +435,16 @@ class LensLogic:
 
         for session in sessions:
             duration_str = ""
-            if session.get("duration"):
-                duration = session["duration"]
+            if session.duration:
+                duration = session.duration
                 hours = int(duration.total_seconds() // 3600)
                 minutes = int((duration.total_seconds() % 3600) // 60)
                 duration_str = f" ({hours}h {minutes}m)" if hours else f" ({minutes}m)"
 
-            location_str = f" at {session['location_name']}" if session.get("location_name") else ""
+            location_str = f" at {session.location_name}" if session.location_name else ""
 
             self.progress_tracker.print_info(
-                f"  • {session['session_name']}: {session['photo_count']} photos{duration_str}{location_str}"
+                f"  • {session.session_name}: {session.photo_count} photos{duration_str}{location_str}"
             )
 
         # Show session statistics
@@ -878,4 +884,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Worker processes of a PyInstaller build re-enter here and must not start the CLI
+    multiprocessing.freeze_support()
     main()
@@ -1,27 +1,150 @@
 import logging
+import os
 from pathlib import Path
 
 import questionary
 from rich.align import Align
 from rich.columns import Columns
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
 
+from modules.backup_manager import BackupManager
 from utils.branding import LENSLOGIC_LOGO, get_version_info
 
 logger = logging.getLogger(__name__)
 
+# Cursor home followed by "erase to end of screen"; avoids the full clear that wipes scrollback
+_HOME_AND_ERASE_BELOW = "\x1b[H\x1b[J"
+
+_BACKUP_MENU_CHOICES = (
+    "📋 Configure Backup Destinations",
+    "🚀 Start Backup Process",
+    "✅ Verify Existing Backups",
+    "📊 Backup Status & Statistics",
+    "🔄 Restore from Backup",
+    "⚙️  Backup Settings",
+    "⬅️  Back to Main Menu",
+)
+
+_BACKUP_DESTINATION_CHOICES = (
+    "➕ Add New Destination",
+    "➖ Remove Destination",
+    "📝 Edit Destination",
+    "🔄 Clear All Destinations",
+    "⬅️  Back",
+)
+
+_RESTORE_DISPATCH = {
+    "Full restore (restore all files back to organized directory)": "full",
+    "Selective restore (choose specific file patterns)": "selective",
+    "Advanced options (choose different destination)": "advanced",
+    "Cancel": "cancel",
+}
+
+_RESTORE_OPTIONS = tuple(_RESTORE_DISPATCH)
+
+_SECTION_HEADERS = {
+    "configure": (
+        "[bold bright_cyan]⚙️  Configuration Center[/bold bright_cyan]\n"
+        "[dim]Customize LensLogic to match your photo organization workflow[/dim]",
+        "bright_cyan",
+    ),
+    "advanced": (
+        "[bold bright_magenta]🔧 Advanced Options[/bold bright_magenta]\n"
+        "[dim]Power user features for cache management, configuration, and maintenance[/dim]",
+        "bright_magenta",
+    ),
+    "explain": (
+        "[bold bright_blue]📖 Configuration Guide[/bold bright_blue]\n"
+        "[dim]Complete reference for all LensLogic configuration options and their effects[/dim]",
+        "bright_blue",
+    ),
+    "backup": (
+        "[bold bright_green]💾 Backup & Restore Center[/bold bright_green]\n"
+        "[dim]Protect your organized photos with automated backup and restore functionality[/dim]",
+        "bright_green",
+    ),
+}
+
+_SETTINGS_HELP_ROWS: tuple[tuple[str, str, str], ...] = (
+    # Organization settings
+    ("[bold yellow]ORGANIZATION[/bold yellow]", "", ""),
+    ("folder_structure", "Pattern for organizing folders by date/metadata", "{year}/{month:02d}/{day:02d}"),
+    ("separate_raw", "Keep RAW and JPEG files in separate folders", "true (RAW/, JPG/ folders)"),
+    ("raw_folder", "Name of folder for RAW files", "RAW"),
+    ("jpg_folder", "Name of folder for JPEG/processed images", "JPG"),
+    # Naming settings
+    ("[bold yellow]NAMING[/bold yellow]", "", ""),
+    ("pattern", "Template for renaming files with metadata", "{year}{month:02d}{day:02d}_{camera}"),
+    ("include_sequence", "Add sequence numbers for duplicate times", "true (adds _001, _002, etc.)"),
+    ("lowercase_extension", "Convert file extensions to lowercase", "true (.JPG → .jpg)"),
+    # Geolocation settings
+    ("[bold yellow]GEOLOCATION[/bold yellow]", "", ""),
+    ("enabled", "Extract and process GPS coordinates", "true"),
+    ("reverse_geocode", "Convert GPS to location names (city/country)", "true"),
+    ("add_location_to_folder", "Include location in folder structure", "true (adds city folders)"),
+    ("location_components", "Which location parts to use in folders", "city, country, city_country"),
+    # Features
+    ("[bold yellow]FEATURES[/bold yellow]", "", ""),
+    ("remove_duplicates", "Detect and handle duplicate files", "true"),
+    ("create_sidecar", "Generate XMP metadata files", "true (creates .xmp files)"),
+    ("auto_rotate", "Automatically rotate images using EXIF", "true"),
+    # Backup settings
+    ("[bold yellow]BACKUP[/bold yellow]", "", ""),
+    ("destinations", "List of backup locations", "['/backup1', '/backup2']"),
+    ("enable_verification", "Verify backup integrity with checksums", "true"),
+    ("incremental_mode", "Only backup changed files", "true"),
+)
+
+_SETTINGS_PRO_TIPS = Group(
+    Text.from_markup("\n[bold green]💡 Pro Tips:[/bold green]"),
+    Text("• Use {variables} in patterns: {year}, {month}, {day}, {camera}, {lens}, {original_sequence}"),
+    Text("• {original_sequence} preserves sequence from original filename (e.g., ZF0_8151.JPG → 8151)"),
+    Text("• Location folders: Set location_components to 'city' for clean organization"),
+    Text("• XMP sidecars: Enable for professional photo/video workflow compatibility"),
+    Text("• Backup verification: Ensures your backups are not corrupted"),
+    Text("• Duplicate detection: 'hash' method is most reliable"),
+)
+
 
 class InteractiveMenu:
+    _settings_help_table: Table | None = None
+    _section_header_panels: dict[str, Panel] = {}
+
+    _BACKUP_MENU_DISPATCH = {
+        "📋 Configure Backup Destinations": "_configure_backup_destinations",
+        "🚀 Start Backup Process": "_start_backup_process",
+        "✅ Verify Existing Backups": "_verify_backups",
+        "📊 Backup Status & Statistics": "_show_backup_status",
+        "🔄 Restore from Backup": "_restore_from_backup",
+        "⚙️  Backup Settings": "_configure_backup_settings",
+    }
+
+    _BACKUP_DESTINATION_DISPATCH = {
+        "➕ Add New Destination": "_add_backup_destination",
+        "➖ Remove Destination": "_remove_backup_destination",
+        "🔄 Clear All Destinations": "_clear_backup_destinations",
+    }
+
     def __init__(self, config_manager, progress_tracker):
         self.config_manager = config_manager
         self.progress_tracker = progress_tracker
         self.console = Console()
+        self._backup_manager = None
+        self._backup_config_id = None
+        # Destinations already found writable; failures are not kept, so they are probed again
+        self._writable_dests: set[str] = set()
+
+    def _redraw_screen(self):
+        """Return the cursor to the top-left and erase below it so the next menu overwrites in place"""
+        if self.console.is_terminal:
+            self.console.file.write(_HOME_AND_ERASE_BELOW)
+            self.console.file.flush()
 
     def main_menu(self) -> str | None:
-        self.console.clear()
+        self._redraw_screen()
         self._print_header()
 
         # Create organized menu sections
@@ -271,16 +394,9 @@ class InteractiveMenu:
         self.console.print(table)
 
     def configure_menu(self) -> bool:
-        self.console.clear()
+        self._redraw_screen()
 
-        # Enhanced configuration header
-        config_header = Panel(
-            "[bold bright_cyan]⚙️  Configuration Center[/bold bright_cyan]\n"
-            "[dim]Customize LensLogic to match your photo organization workflow[/dim]",
-            border_style="bright_cyan",
-            padding=(1, 2),
-        )
-        self.console.print(config_header)
+        self.console.print(self._get_section_header("configure"))
         self.console.print()
 
         sections = [
@@ -603,16 +719,9 @@ class InteractiveMenu:
         self.console.print("[green]✓[/green] Feature settings updated")
 
     def advanced_menu(self) -> bool:
-        self.console.clear()
+        self._redraw_screen()
 
-        # Enhanced advanced menu header
-        advanced_header = Panel(
-            "[bold bright_magenta]🔧 Advanced Options[/bold bright_magenta]\n"
-            "[dim]Power user features for cache management, configuration, and maintenance[/dim]",
-            border_style="bright_magenta",
-            padding=(1, 2),
-        )
-        self.console.print(advanced_header)
+        self.console.print(self._get_section_header("advanced"))
         self.console.print()
 
         options = [
@@ -702,154 +811,81 @@ class InteractiveMenu:
 
     def explain_config_settings(self):
         """Display comprehensive explanation of all configuration settings"""
-        self.console.clear()
+        self._redraw_screen()
 
-        # Enhanced explanation header
-        explanation_header = Panel(
-            "[bold bright_blue]📖 Configuration Guide[/bold bright_blue]\n"
-            "[dim]Complete reference for all LensLogic configuration options and their effects[/dim]",
-            border_style="bright_blue",
-            padding=(1, 2),
-        )
-        self.console.print(explanation_header)
+        self.console.print(self._get_section_header("explain"))
         self.console.print()
 
-        # Create explanation table
-        table = Table(
-            title="Complete Configuration Guide",
-            show_header=True,
-            header_style="bold cyan",
-        )
-        table.add_column("Setting", style="bold", width=25)
-        table.add_column("Description", style="white", width=50)
-        table.add_column("Example", style="green", width=30)
-
-        # Organization settings
-        table.add_row("[bold yellow]ORGANIZATION[/bold yellow]", "", "")
-        table.add_row(
-            "folder_structure",
-            "Pattern for organizing folders by date/metadata",
-            "{year}/{month:02d}/{day:02d}",
-        )
-        table.add_row(
-            "separate_raw",
-            "Keep RAW and JPEG files in separate folders",
-            "true (RAW/, JPG/ folders)",
-        )
-        table.add_row("raw_folder", "Name of folder for RAW files", "RAW")
-        table.add_row("jpg_folder", "Name of folder for JPEG/processed images", "JPG")
-
-        # Naming settings
-        table.add_row("[bold yellow]NAMING[/bold yellow]", "", "")
-        table.add_row(
-            "pattern",
-            "Template for renaming files with metadata",
-            "{year}{month:02d}{day:02d}_{camera}",
-        )
-        table.add_row(
-            "include_sequence",
-            "Add sequence numbers for duplicate times",
-            "true (adds _001, _002, etc.)",
-        )
-        table.add_row(
-            "lowercase_extension",
-            "Convert file extensions to lowercase",
-            "true (.JPG → .jpg)",
-        )
-
-        # Geolocation settings
-        table.add_row("[bold yellow]GEOLOCATION[/bold yellow]", "", "")
-        table.add_row("enabled", "Extract and process GPS coordinates", "true")
-        table.add_row("reverse_geocode", "Convert GPS to location names (city/country)", "true")
-        table.add_row(
-            "add_location_to_folder",
-            "Include location in folder structure",
-            "true (adds city folders)",
-        )
-        table.add_row(
-            "location_components",
-            "Which location parts to use in folders",
-            "city, country, city_country",
-        )
-
-        # Features
-        table.add_row("[bold yellow]FEATURES[/bold yellow]", "", "")
-        table.add_row("remove_duplicates", "Detect and handle duplicate files", "true")
-        table.add_row("create_sidecar", "Generate XMP metadata files", "true (creates .xmp files)")
-        table.add_row("auto_rotate", "Automatically rotate images using EXIF", "true")
+        self.console.print(self._get_settings_help_table())
+        self.console.print(_SETTINGS_PRO_TIPS)
 
-        # Backup settings
-        table.add_row("[bold yellow]BACKUP[/bold yellow]", "", "")
-        table.add_row("destinations", "List of backup locations", "['/backup1', '/backup2']")
-        table.add_row("enable_verification", "Verify backup integrity with checksums", "true")
-        table.add_row("incremental_mode", "Only backup changed files", "true")
+        self.console.print("\n[dim]Press Enter to return to main menu...[/dim]")
+        input()
 
-        self.console.print(table)
+    @classmethod
+    def _get_section_header(cls, key: str) -> Panel:
+        """Return the header panel for a menu screen, building it on first use"""
+        panel = cls._section_header_panels.get(key)
+        if panel is None:
+            body, border_style = _SECTION_HEADERS[key]
+            panel = Panel(body, border_style=border_style, padding=(1, 2))
+            cls._section_header_panels[key] = panel
+        return panel
+
+    @classmethod
+    def _get_settings_help_table(cls) -> Table:
+        """Build the configuration guide table on first use and reuse it afterwards"""
+        if cls._settings_help_table is None:
+            table = Table(
+                title="Complete Configuration Guide",
+                show_header=True,
+                header_style="bold cyan",
+            )
+            table.add_column("Setting", style="bold", width=25)
+            table.add_column("Description", style="white", width=50)
+            table.add_column("Example", style="green", width=30)
 
-        self.console.print("\n[bold green]💡 Pro Tips:[/bold green]")
-        self.console.print(
-            "• Use {variables} in patterns: {year}, {month}, {day}, {camera}, {lens}, {original_sequence}"
-        )
-        self.console.print(
-            "• {original_sequence} preserves sequence from original filename (e.g., ZF0_8151.JPG → 8151)"
-        )
-        self.console.print("• Location folders: Set location_components to 'city' for clean organization")
-        self.console.print("• XMP sidecars: Enable for professional photo/video workflow compatibility")
-        self.console.print("• Backup verification: Ensures your backups are not corrupted")
-        self.console.print("• Duplicate detection: 'hash' method is most reliable")
+            for row in _SETTINGS_HELP_ROWS:
+                table.add_row(*row)
 
-        self.console.print("\n[dim]Press Enter to return to main menu...[/dim]")
-        input()
+            cls._settings_help_table = table
+        return cls._settings_help_table
 
     def backup_restore_menu(self):
         """Display backup and restore options"""
-        self.console.clear()
+        self._redraw_screen()
 
-        # Enhanced backup menu header
-        backup_header = Panel(
-            "[bold bright_green]💾 Backup & Restore Center[/bold bright_green]\n"
-            "[dim]Protect your organized photos with automated backup and restore functionality[/dim]",
-            border_style="bright_green",
-            padding=(1, 2),
-        )
-        self.console.print(backup_header)
+        self.console.print(self._get_section_header("backup"))
         self.console.print()
 
-        choices = [
-            "📋 Configure Backup Destinations",
-            "🚀 Start Backup Process",
-            "✅ Verify Existing Backups",
-            "📊 Backup Status & Statistics",
-            "🔄 Restore from Backup",
-            "⚙️  Backup Settings",
-            "⬅️  Back to Main Menu",
-        ]
-
         choice = questionary.select(
             "What would you like to do?",
-            choices=choices,
+            choices=list(_BACKUP_MENU_CHOICES),
             use_shortcuts=True,
             instruction="(Choose a backup or restore operation)",
         ).ask()
 
-        if choice:
-            if "Configure Backup Destinations" in choice:
-                self._configure_backup_destinations()
-            elif "Start Backup Process" in choice:
-                self._start_backup_process()
-            elif "Verify Existing Backups" in choice:
-                self._verify_backups()
-            elif "Backup Status" in choice:
-                self._show_backup_status()
-            elif "Restore from Backup" in choice:
-                self._restore_from_backup()
-            elif "Backup Settings" in choice:
-                self._configure_backup_settings()
-            elif "Back to Main Menu" in choice:
-                return False
+        if choice == "⬅️  Back to Main Menu":
+            return False
+
+        handler_name = self._BACKUP_MENU_DISPATCH.get(choice)
+        if handler_name:
+            getattr(self, handler_name)()
 
         return True
 
+    def _get_backup_manager(self) -> BackupManager:
+        """Return a cached BackupManager, rebuilding it when the config has been replaced"""
+        config = self.config_manager.config
+        if self._backup_manager is None or self._backup_config_id != id(config):
+            self._backup_manager = BackupManager(config)
+            self._backup_config_id = id(config)
+        return self._backup_manager
+
+    def _invalidate_backup_manager(self):
+        """Drop the cached BackupManager so the next action picks up new backup settings"""
+        self._backup_manager = None
+
     def _configure_backup_destinations(self):
         """Configure backup destinations"""
         self.console.print("[bold cyan]📋 Configure Backup Destinations[/bold cyan]\n")
@@ -862,45 +898,47 @@ class InteractiveMenu:
                 self.console.print(f"  {i}. {dest}")
             self.console.print()
 
-        choices = [
-            "➕ Add New Destination",
-            "➖ Remove Destination",
-            "📝 Edit Destination",
-            "🔄 Clear All Destinations",
-            "⬅️  Back",
-        ]
+        choice = questionary.select("What would you like to do?", choices=list(_BACKUP_DESTINATION_CHOICES)).ask()
 
-        choice = questionary.select("What would you like to do?", choices=choices).ask()
+        handler_name = self._BACKUP_DESTINATION_DISPATCH.get(choice)
+        if handler_name:
+            getattr(self, handler_name)(current_destinations)
 
-        if choice and "Add New Destination" in choice:
-            destination = questionary.path("Enter backup destination path:", only_directories=True).ask()
+        self._invalidate_backup_manager()
+        self._writable_dests.clear()
+        input("\nPress Enter to continue...")
 
-            if destination:
-                if "backup" not in self.config_manager.config:
-                    self.config_manager.config["backup"] = {}
-                if "destinations" not in self.config_manager.config["backup"]:
-                    self.config_manager.config["backup"]["destinations"] = []
+    def _add_backup_destination(self, current_destinations: list):
+        """Prompt for a new backup destination and append it to the config"""
+        destination = questionary.path("Enter backup destination path:", only_directories=True).ask()
 
-                self.config_manager.config["backup"]["destinations"].append(destination)
-                self.console.print(f"[green]✓[/green] Added backup destination: {destination}")
+        if destination:
+            destination = os.path.normpath(destination)
+            if "backup" not in self.config_manager.config:
+                self.config_manager.config["backup"] = {}
+            if "destinations" not in self.config_manager.config["backup"]:
+                self.config_manager.config["backup"]["destinations"] = []
 
-        elif choice and "Remove Destination" in choice:
-            if current_destinations:
-                dest_choice = questionary.select(
-                    "Select destination to remove:",
-                    choices=current_destinations + ["Cancel"],
-                ).ask()
+            self.config_manager.config["backup"]["destinations"].append(destination)
+            self.console.print(f"[green]✓[/green] Added backup destination: {destination}")
 
-                if dest_choice and dest_choice != "Cancel":
-                    self.config_manager.config["backup"]["destinations"].remove(dest_choice)
-                    self.console.print(f"[green]✓[/green] Removed backup destination: {dest_choice}")
+    def _remove_backup_destination(self, current_destinations: list):
+        """Prompt for a configured backup destination and remove it"""
+        if current_destinations:
+            dest_choice = questionary.select(
+                "Select destination to remove:",
+                choices=current_destinations + ["Cancel"],
+            ).ask()
 
-        elif choice and "Clear All Destinations" in choice:
-            if questionary.confirm("Are you sure you want to clear all backup destinations?").ask():
-                self.config_manager.config["backup"]["destinations"] = []
-                self.console.print("[green]✓[/green] All backup destinations cleared")
+            if dest_choice and dest_choice != "Cancel":
+                self.config_manager.config["backup"]["destinations"].remove(dest_choice)
+                self.console.print(f"[green]✓[/green] Removed backup destination: {dest_choice}")
 
-        input("\nPress Enter to continue...")
+    def _clear_backup_destinations(self, current_destinations: list):
+        """Remove all configured backup destinations after confirmation"""
+        if questionary.confirm("Are you sure you want to clear all backup destinations?").ask():
+            self.config_manager.config["backup"]["destinations"] = []
+            self.console.print("[green]✓[/green] All backup destinations cleared")
 
     def _start_backup_process(self):
         """Start the backup process"""
@@ -928,17 +966,13 @@ class InteractiveMenu:
 
     def _perform_backup(self, source_dir: str, destinations: list):
         """Perform the actual backup process"""
-        from modules.backup_manager import BackupManager
-
         # Initialize backup manager
-        backup_manager = BackupManager(self.config_manager.config)
+        backup_manager = self._get_backup_manager()
 
         self.console.print("\n[bold green]🚀 Starting backup process...[/bold green]")
 
         try:
             # Check if source directory exists
-            from pathlib import Path
-
             if not Path(source_dir).exists():
                 self.console.print(f"[red]❌ Source directory does not exist: {source_dir}[/red]")
                 self.console.print("Please organize your photos first before backing up.")
@@ -947,17 +981,11 @@ class InteractiveMenu:
             # Check destination accessibility
             self.console.print("🔍 Checking destination accessibility...")
             for i, dest in enumerate(destinations, 1):
-                dest_path = Path(dest)
-                try:
-                    # Try to create the directory if it doesn't exist
-                    dest_path.mkdir(parents=True, exist_ok=True)
-                    # Test write access
-                    test_file = dest_path / ".lenslogic_test_write"
-                    test_file.write_text("test")
-                    test_file.unlink()
+                error = self._check_destination_access(dest)
+                if error is None:
                     self.console.print(f"  ✓ Destination {i}: {dest} - [green]Accessible[/green]")
-                except Exception as e:
-                    self.console.print(f"  ❌ Destination {i}: {dest} - [red]Error: {e}[/red]")
+                else:
+                    self.console.print(f"  ❌ Destination {i}: {dest} - [red]Error: {error}[/red]")
 
             self.console.print()
 
@@ -969,15 +997,17 @@ class InteractiveMenu:
             result = backup_manager.incremental_sync(source_dir, destinations, dry_run=dry_run)
 
             # Display results
-            self.console.print("\n[bold green]✅ Backup completed![/bold green]")
-            self.console.print(f"  • Files scanned: {result['source_scanned']}")
-            self.console.print(f"  • Files copied: {result['total_copied']}")
-            self.console.print(f"  • Files updated: {result['total_updated']}")
-            self.console.print(f"  • Files deleted: {result['total_deleted']}")
-            self.console.print(f"  • Sync time: {result['sync_time']:.2f} seconds")
-
+            summary = Table.grid(padding=(0, 1))
+            summary.add_row("Files scanned:", str(result["source_scanned"]))
+            summary.add_row("Files copied:", str(result["total_copied"]))
+            summary.add_row("Files updated:", str(result["total_updated"]))
+            summary.add_row("Files deleted:", str(result["total_deleted"]))
+            summary.add_row("Sync time:", f"{result['sync_time']:.2f} seconds")
             if result["total_errors"] > 0:
-                self.console.print(f"  • [yellow]Errors: {result['total_errors']}[/yellow]")
+                summary.add_row("[yellow]Errors:[/yellow]", f"[yellow]{result['total_errors']}[/yellow]")
+
+            self.console.print()
+            self.console.print(Panel(summary, title="✅ Backup completed!", border_style="green"))
 
             # Show per-destination results
             self.console.print("\n[bold]Per-destination results:[/bold]")
@@ -987,18 +1017,14 @@ class InteractiveMenu:
                 self.console.print(f"    • Updated: {dest_result['files_updated']}")
                 self.console.print(f"    • Deleted: {dest_result['files_deleted']}")
                 self.console.print(f"    • Skipped: {dest_result['files_skipped']}")
-                if dest_result["errors"]:
-                    self.console.print(f"    • [yellow]Errors: {len(dest_result['errors'])}[/yellow]")
+                errors = dest_result["errors"]
+                if errors:
+                    self.console.print(f"    • [yellow]Errors: {len(errors)}[/yellow]")
                     # Show first few errors for debugging
-                    for error in dest_result["errors"][:3]:
-                        self.console.print(f"      - [red]{error}[/red]")
-                    if len(dest_result["errors"]) > 3:
-                        self.console.print(f"      - [dim]... and {len(dest_result['errors']) - 3} more errors[/dim]")
+                    self.console.print(self._format_error_block(errors, "      "), end="")
 
             # Check if any destinations are missing from results
-            expected_destinations = set(destinations)
-            actual_destinations = set(result["destinations"].keys())
-            missing_destinations = expected_destinations - actual_destinations
+            missing_destinations = [d for d in destinations if d not in result["destinations"]]
 
             if missing_destinations:
                 self.console.print("\n[red]⚠️ Some destinations were not processed:[/red]")
@@ -1017,6 +1043,41 @@ class InteractiveMenu:
         except Exception as e:
             self.console.print(f"[red]❌ Backup failed: {e}[/red]")
 
+    def _check_destination_access(self, dest: str) -> str | None:
+        """Return None if a backup destination is writable, otherwise the error message.
+
+        Successful checks are cached for the session and reset when the destination list changes;
+        failures are always rechecked, as a drive may be mounted or permissions fixed in between.
+        """
+        dest_path = Path(dest).resolve()
+        key = str(dest_path)
+        if key in self._writable_dests:
+            return None
+
+        try:
+            # Try to create the directory if it doesn't exist
+            dest_path.mkdir(parents=True, exist_ok=True)
+            if not os.access(dest_path, os.W_OK):
+                raise PermissionError(f"No write permission for {dest_path}")
+        except Exception as e:
+            return str(e)
+
+        self._writable_dests.add(key)
+        return None
+
+    @staticmethod
+    def _format_error_block(errors: list, indent: str, limit: int = 3) -> Text:
+        """Build the first few error lines (plus an overflow note) as one renderable"""
+        error_count = len(errors)
+        block = Text()
+        for error in errors[:limit]:
+            block.append(f"{indent}- ")
+            block.append(f"{error}\n", style="red")
+        if error_count > limit:
+            block.append(f"{indent}- ")
+            block.append(f"... and {error_count - limit} more errors\n", style="dim")
+        return block
+
     def _verify_backup_integrity(self, backup_manager, source_dir: str, destinations: list):
         """Verify backup integrity"""
         self.console.print("\n[bold cyan]🔍 Verifying backup integrity...[/bold cyan]")
@@ -1027,23 +1088,28 @@ class InteractiveMenu:
             try:
                 verification = backup_manager.verify_backup(source_dir, dest, quick_mode=True)
 
-                if verification["integrity_score"] >= 95:
-                    self.console.print(f"[green]✓ {verification['integrity_score']:.1f}% integrity - Excellent[/green]")
-                elif verification["integrity_score"] >= 90:
-                    self.console.print(f"[yellow]⚠ {verification['integrity_score']:.1f}% integrity - Good[/yellow]")
+                score = verification["integrity_score"]
+                if score >= 95:
+                    self.console.print(Text.assemble(("✓ ", "green"), (f"{score:.1f}% integrity - Excellent", "green")))
+                elif score >= 90:
+                    self.console.print(Text.assemble(("⚠ ", "yellow"), (f"{score:.1f}% integrity - Good", "yellow")))
                 else:
-                    self.console.print(f"[red]❌ {verification['integrity_score']:.1f}% integrity - Issues found[/red]")
+                    self.console.print(Text.assemble(("❌ ", "red"), (f"{score:.1f}% integrity - Issues found", "red")))
 
-                self.console.print(f"  • Verified files: {verification['verified_files']}")
+                self.console.print(Text.assemble("  • ", f"Verified files: {verification['verified_files']}"))
 
                 if verification["missing_files"]:
-                    self.console.print(f"  • [yellow]Missing files: {len(verification['missing_files'])}[/yellow]")
+                    self.console.print(
+                        Text.assemble("  • ", (f"Missing files: {len(verification['missing_files'])}", "yellow"))
+                    )
 
                 if verification["corrupted_files"]:
-                    self.console.print(f"  • [red]Corrupted files: {len(verification['corrupted_files'])}[/red]")
+                    self.console.print(
+                        Text.assemble("  • ", (f"Corrupted files: {len(verification['corrupted_files'])}", "red"))
+                    )
 
                 if verification["extra_files"]:
-                    self.console.print(f"  • Extra files: {len(verification['extra_files'])}")
+                    self.console.print(Text.assemble("  • ", f"Extra files: {len(verification['extra_files'])}"))
 
             except Exception as e:
                 self.console.print(f"[red]❌ Verification failed: {e}[/red]")
@@ -1067,9 +1133,7 @@ class InteractiveMenu:
             source_dir = self.config_manager.config.get("general", {}).get("destination_directory", "./organized")
 
             # Initialize backup manager and verify
-            from modules.backup_manager import BackupManager
-
-            backup_manager = BackupManager(self.config_manager.config)
+            backup_manager = self._get_backup_manager()
 
             self._verify_backup_integrity(backup_manager, source_dir, destinations)
 
@@ -1109,9 +1173,7 @@ class InteractiveMenu:
             input("\nPress Enter to continue...")
             return
 
-        from modules.backup_manager import BackupManager
-
-        backup_manager = BackupManager(self.config_manager.config)
+        backup_manager = self._get_backup_manager()
 
         # Get available backups
         self.console.print("🔍 Scanning backup destinations...")
@@ -1123,20 +1185,7 @@ class InteractiveMenu:
             # Show why other destinations weren't usable
             if candidates["unavailable_backups"]:
                 self.console.print("\n[yellow]Checked backup destinations:[/yellow]")
-                for unavailable in candidates["unavailable_backups"]:
-                    backup_dir = unavailable["backup_dir"]
-                    exists = unavailable["exists"]
-                    total_files = unavailable["total_files"]
-                    errors = unavailable["errors"]
-
-                    if not exists:
-                        self.console.print(f"  📁 {backup_dir} - [red]Directory doesn't exist[/red]")
-                    elif total_files == 0:
-                        self.console.print(f"  📁 {backup_dir} - [yellow]No files found[/yellow]")
-                    elif errors:
-                        self.console.print(f"  📁 {backup_dir} - [red]Errors: {', '.join(errors[:2])}[/red]")
-                    else:
-                        self.console.print(f"  📁 {backup_dir} - [yellow]Unknown issue[/yellow]")
+                self.console.print(self._render_unavailable_backups(candidates["unavailable_backups"]))
 
             input("\nPress Enter to continue...")
             return
@@ -1150,44 +1199,33 @@ class InteractiveMenu:
 
             # Show details about unavailable backups
             self.console.print("\n[dim]Unavailable backup destinations:[/dim]")
-            for unavailable in candidates["unavailable_backups"]:
-                backup_dir = unavailable["backup_dir"]
-                exists = unavailable["exists"]
-                total_files = unavailable["total_files"]
-                errors = unavailable["errors"]
-
-                if not exists:
-                    self.console.print(f"  📁 {backup_dir} - [red]Directory doesn't exist[/red]")
-                elif total_files == 0:
-                    self.console.print(f"  📁 {backup_dir} - [yellow]Empty (no files to restore)[/yellow]")
-                elif errors:
-                    self.console.print(f"  📁 {backup_dir} - [red]Access errors[/red]")
-                    for error in errors[:2]:
-                        self.console.print(f"    • [dim]{error}[/dim]")
-                else:
-                    self.console.print(f"  📁 {backup_dir} - [yellow]Unknown issue[/yellow]")
+            self.console.print(
+                self._render_unavailable_backups(candidates["unavailable_backups"], show_error_detail=True)
+            )
         backup_choices = []
+        recommended = candidates["recommended_backup"]
+
+        table = Table(title="Available Backups", show_header=True, header_style="bold cyan")
+        table.add_column("#", justify="right")
+        table.add_column("Status")
+        table.add_column("Path", style="bold")
+        table.add_column("Files", justify="right", style="yellow")
+        table.add_column("Size", justify="right")
+        table.add_column("Last Modified", style="green")
 
         for i, backup_info in enumerate(candidates["available_backups"], 1):
             backup_dir = backup_info["backup_dir"]
             file_count = backup_info["total_files"]
             size_gb = backup_info["total_size"] / (1024**3)
             last_mod = backup_info["last_modified"]
+            mod_str = last_mod.strftime("%Y-%m-%d %H:%M") if last_mod else "Unknown"
+            status = "✅ Recommended" if backup_dir == recommended else "📁 Available"
 
-            if last_mod:
-                mod_str = last_mod.strftime("%Y-%m-%d %H:%M")
-            else:
-                mod_str = "Unknown"
-
-            status = "✅ Recommended" if backup_dir == candidates["recommended_backup"] else "📁 Available"
-
-            self.console.print(f"  {i}. {status}")
-            self.console.print(f"     Path: {backup_dir}")
-            self.console.print(f"     Files: {file_count:,} ({size_gb:.1f} GB)")
-            self.console.print(f"     Last Modified: {mod_str}")
-
+            table.add_row(str(i), status, backup_dir, f"{file_count:,}", f"{size_gb:.1f} GB", mod_str)
             backup_choices.append(f"{i}. {backup_dir} ({file_count:,} files, {mod_str})")
 
+        self.console.print(table)
+
         # Let user select backup
         backup_choices.append("Cancel")
 
@@ -1197,7 +1235,7 @@ class InteractiveMenu:
             return
 
         # Extract backup directory from choice
-        backup_index = int(backup_choice.split(".")[0]) - 1
+        backup_index = int(backup_choice.partition(".")[0]) - 1
         selected_backup_info = candidates["available_backups"][backup_index]
         backup_dir = selected_backup_info["backup_dir"]
 
@@ -1208,23 +1246,17 @@ class InteractiveMenu:
         restore_dir = self.config_manager.config.get("general", {}).get("destination_directory", "./organized")
 
         # Choose restore type
-        restore_options = [
-            "Full restore (restore all files back to organized directory)",
-            "Selective restore (choose specific file patterns)",
-            "Advanced options (choose different destination)",
-            "Cancel",
-        ]
+        restore_choice = questionary.select("Choose restore type:", choices=list(_RESTORE_OPTIONS)).ask()
+        restore_tag = _RESTORE_DISPATCH.get(restore_choice, "cancel")
 
-        restore_choice = questionary.select("Choose restore type:", choices=restore_options).ask()
-
-        if not restore_choice or "Cancel" in restore_choice:
+        if restore_tag == "cancel":
             return
 
-        if "Full restore" in restore_choice:
+        if restore_tag == "full":
             file_patterns = None
             self.console.print(f"[green]✓[/green] Will restore all files to: {restore_dir}")
 
-        elif "Selective restore" in restore_choice:
+        elif restore_tag == "selective":
             # Get file patterns
             pattern_input = questionary.text(
                 "Enter file patterns to restore (comma-separated, e.g., '.jpg,.cr2,2024'):",
@@ -1238,7 +1270,7 @@ class InteractiveMenu:
             else:
                 file_patterns = None
 
-        elif "Advanced options" in restore_choice:
+        elif restore_tag == "advanced":
             # Advanced options for power users
             alt_dest = questionary.confirm(
                 "Restore to a different directory (instead of organized directory)?",
@@ -1273,16 +1305,19 @@ class InteractiveMenu:
         dry_run = questionary.confirm("Run in dry-run mode (preview only)?", default=False).ask()
 
         # Confirm restore
-        self.console.print("\n[bold yellow]⚠️ Restore Summary:[/bold yellow]")
-        self.console.print(f"  • From: {backup_dir}")
-        self.console.print(f"  • To: {restore_dir}")
-        self.console.print(f"  • Files: {selected_backup_info['total_files']:,}")
-        self.console.print(f"  • Size: {selected_backup_info['total_size'] / (1024**3):.1f} GB")
+        summary = Table.grid(padding=(0, 1))
+        summary.add_row("From:", str(backup_dir))
+        summary.add_row("To:", str(restore_dir))
+        summary.add_row("Files:", f"{selected_backup_info['total_files']:,}")
+        summary.add_row("Size:", f"{selected_backup_info['total_size'] / (1024**3):.1f} GB")
         if file_patterns:
-            self.console.print(f"  • Patterns: {', '.join(file_patterns)}")
-        self.console.print(f"  • Preserve structure: {'Yes' if preserve_structure else 'No'}")
-        self.console.print(f"  • Overwrite newer files: {'Yes' if overwrite_newer else 'No'}")
-        self.console.print(f"  • Mode: {'Dry run' if dry_run else 'Live restore'}")
+            summary.add_row("Patterns:", ", ".join(file_patterns))
+        summary.add_row("Preserve structure:", "Yes" if preserve_structure else "No")
+        summary.add_row("Overwrite newer files:", "Yes" if overwrite_newer else "No")
+        summary.add_row("Mode:", "Dry run" if dry_run else "Live restore")
+
+        self.console.print()
+        self.console.print(Panel(summary, title="⚠️ Restore Summary", border_style="yellow"))
 
         if not questionary.confirm("\nProceed with restore?").ask():
             return
@@ -1300,6 +1335,40 @@ class InteractiveMenu:
 
         input("\nPress Enter to continue...")
 
+    def _render_unavailable_backups(self, unavailable: list, show_error_detail: bool = False) -> Table:
+        """Build a table explaining why each backup destination cannot be restored from.
+
+        With show_error_detail the first errors are listed one per line instead of being joined.
+        """
+        empty_status = (
+            "[yellow]Empty (no files to restore)[/yellow]" if show_error_detail else "[yellow]No files found[/yellow]"
+        )
+        error_separator = "\n" if show_error_detail else ", "
+
+        table = Table(show_header=True, header_style="bold yellow")
+        table.add_column("Path", style="bold")
+        table.add_column("Status")
+        table.add_column("Detail", style="dim")
+
+        for info in unavailable:
+            backup_dir, exists, total_files, errors = (
+                info.get("backup_dir"),
+                info.get("exists"),
+                info.get("total_files"),
+                info.get("errors"),
+            )
+
+            if not exists:
+                table.add_row(f"📁 {backup_dir}", "[red]Directory doesn't exist[/red]", "")
+            elif total_files == 0:
+                table.add_row(f"📁 {backup_dir}", empty_status, "")
+            elif errors:
+                table.add_row(f"📁 {backup_dir}", "[red]Access errors[/red]", error_separator.join(errors[:2]))
+            else:
+                table.add_row(f"📁 {backup_dir}", "[yellow]Unknown issue[/yellow]", "")
+
+        return table
+
     def _perform_restore(
         self,
         backup_manager,
@@ -1324,26 +1393,26 @@ class InteractiveMenu:
             )
 
             # Display results
-            if dry_run:
-                self.console.print("\n[bold yellow]🔍 Dry run completed![/bold yellow]")
-            else:
-                self.console.print("\n[bold green]✅ Restore completed![/bold green]")
-
-            self.console.print(f"  • Files restored: {result['files_restored']}")
-            self.console.print(f"  • Files skipped: {result['files_skipped']}")
-
+            summary = Table.grid(padding=(0, 1))
+            summary.add_row("Files restored:", str(result["files_restored"]))
+            summary.add_row("Files skipped:", str(result["files_skipped"]))
             if not dry_run:
                 size_mb = result["total_size_restored"] / (1024**2)
-                self.console.print(f"  • Size restored: {size_mb:.1f} MB")
+                summary.add_row("Size restored:", f"{size_mb:.1f} MB")
+            summary.add_row("Restore time:", f"{result['restore_time']:.2f} seconds")
+
+            if dry_run:
+                title, border_style = "🔍 Dry run completed!", "yellow"
+            else:
+                title, border_style = "✅ Restore completed!", "green"
 
-            self.console.print(f"  • Restore time: {result['restore_time']:.2f} seconds")
+            self.console.print()
+            self.console.print(Panel(summary, title=title, border_style=border_style))
 
-            if result["errors"]:
-                self.console.print(f"\n[yellow]⚠️ Errors encountered: {len(result['errors'])}[/yellow]")
-                for error in result["errors"][:3]:  # Show first 3 errors
-                    self.console.print(f"  - [red]{error}[/red]")
-                if len(result["errors"]) > 3:
-                    self.console.print(f"  - [dim]... and {len(result['errors']) - 3} more errors[/dim]")
+            errors = result["errors"]
+            if errors:
+                self.console.print(f"\n[yellow]⚠️ Errors encountered: {len(errors)}[/yellow]")
+                self.console.print(self._format_error_block(errors, "  "), end="")
             else:
                 self.console.print("[green]✅ No errors encountered[/green]")
 
@@ -1379,6 +1448,7 @@ class InteractiveMenu:
         self.config_manager.config["backup"]["enable_verification"] = enable_verification
         self.config_manager.config["backup"]["incremental_mode"] = incremental_mode
         self.config_manager.config["backup"]["use_trash"] = use_trash
+        self._invalidate_backup_manager()
 
         self.console.print("[green]✓[/green] Backup settings updated")
         input("\nPress Enter to continue...")
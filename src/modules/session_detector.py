@@ -1,10 +1,131 @@
 import logging
-from datetime import datetime, timedelta
+import math
+import re
+import string
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+EARTH_RADIUS_KM = 6371.0
+
+# Up to this threshold the equirectangular approximation is indistinguishable from Haversine
+# for the same-location decision, so the cheaper formula is used
+EQUIRECTANGULAR_MAX_KM = 10.0
+
+# Key under which the parsed capture time is memoized on each metadata dict
+_CAPTURE_TIME_KEY = "_capture_time_cached"
+_SENTINEL = object()
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_UTC = _EPOCH.replace(tzinfo=UTC)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+_TIME_FIELDS = ("datetime_original", "datetime_digitized", "datetime", "file_modified")
+
+_FNAME_STRIP = re.compile(r"[^\w\s-]")
+_FNAME_WS = re.compile(r"\s+")
+
+
+def _haversine_np(lat1, lon1, lat2, lon2):
+    """Great-circle distance in kilometers; accepts scalars or NumPy arrays of degrees"""
+    lat1, lon1, lat2, lon2 = np.radians(lat1), np.radians(lon1), np.radians(lat2), np.radians(lon2)
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+    return EARTH_RADIUS_KM * c
+
+
+def _pattern_fields(pattern: str) -> set[str]:
+    """Top-level field names referenced by a str.format pattern, e.g. "start_time" for "{start_time:%Y}" """
+    fields = set()
+    for _, field_name, _, _ in string.Formatter().parse(pattern):
+        if field_name:
+            fields.add(re.split(r"[.\[]", field_name, maxsplit=1)[0])
+    return fields
+
+
+def _has_coordinates(photo: dict[str, Any]) -> bool:
+    """Whether a photo carries both GPS latitude and longitude"""
+    photo_gps = photo.get("gps")
+    return bool(photo_gps) and "latitude" in photo_gps and "longitude" in photo_gps
+
+
+def _to_epoch_us(times: list[datetime]) -> np.ndarray:
+    """Convert datetimes to int64 microseconds since the epoch without local-timezone conversion.
+
+    Naive values are taken as wall-clock time (matching naive datetime subtraction); aware values are
+    measured from the UTC epoch. Integer timedelta arithmetic is much cheaper than NumPy's per-object
+    datetime64 conversion.
+    """
+    return np.fromiter(
+        ((t - (_EPOCH if t.tzinfo is None else _EPOCH_UTC)) // _ONE_MICROSECOND for t in times),
+        dtype=np.int64,
+        count=len(times),
+    )
+
+
+def _gps_radians(photo: dict[str, Any]) -> tuple[float, float] | None:
+    """A photo's (latitude, longitude) in radians, or None if it has no usable coordinates"""
+    photo_gps = photo.get("gps")
+    if not photo_gps:
+        return None
+    lat = photo_gps.get("latitude")
+    lon = photo_gps.get("longitude")
+    if lat is None or lon is None:
+        return None
+    return math.radians(lat), math.radians(lon)
+
+
+def _hav_rad(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Scalar Haversine distance in kilometers between points given in radians (JIT-compiled when numba is installed)"""
+    a = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+
+    return EARTH_RADIUS_KM * c
+
+
+if NUMBA_AVAILABLE:
+    try:
+        _hav_rad = njit(cache=True, fastmath=True)(_hav_rad)
+    except Exception as e:  # e.g. no writable cache locator in a frozen build
+        logger.debug(f"numba JIT unavailable for distance kernel, using Python fallback: {e}")
+
+
+@dataclass(slots=True)
+class Session:
+    """A detected shooting session"""
+
+    photos: list[dict[str, Any]]
+    photo_count: int
+    start_time: datetime | None
+    end_time: datetime | None
+    duration: timedelta | None
+    cameras_used: tuple[str, ...]
+    lenses_used: tuple[str, ...]
+    location: dict[str, float] | None
+    location_name: str | None
+    total_size_mb: float
+    file_paths: tuple[str, ...]
+    session_number: int = 0
+    session_name: str = ""
+
+    def __getitem__(self, key: str) -> Any:
+        """Allow str.format_map(session) in folder patterns"""
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
 
 class SessionDetector:
     def __init__(self, config: dict[str, Any]):
@@ -14,69 +135,131 @@ class SessionDetector:
         self.min_photos_per_session = self.session_config.get("min_photos_per_session", 3)
         self.same_location_threshold_km = self.session_config.get("same_location_threshold_km", 1.0)
         self.enable_location_grouping = self.session_config.get("enable_location_grouping", True)
+        # Built once rather than per photo in the session-splitting loops
+        self._time_gap = timedelta(minutes=self.time_gap_minutes)
+        self._time_gap_us = self._time_gap // _ONE_MICROSECOND
 
-    def detect_sessions(self, photos_metadata: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    def detect_sessions(self, photos_metadata: list[dict[str, Any]]) -> list[Session]:
         """Detect shooting sessions from a list of photo metadata"""
         if not photos_metadata:
             return []
 
-        # Sort photos by capture time
-        sorted_photos = sorted(photos_metadata, key=lambda x: self._get_capture_time(x) or datetime.min)
+        # Sort photos by capture time, decorating once so each time is looked up a single time;
+        # the index keeps the sort stable without ever comparing the metadata dicts
+        keyed = [(self._get_capture_time(photo), i, photo) for i, photo in enumerate(photos_metadata)]
+        keyed.sort(key=lambda item: (item[0] or datetime.min, item[1]))
 
-        sessions = []
-        current_session = []
-        last_capture_time = None
+        # Photos without timestamps are handled separately
+        timed = [(capture_time, photo) for capture_time, _, photo in keyed if capture_time]
 
-        for photo in sorted_photos:
-            capture_time = self._get_capture_time(photo)
+        if self.enable_location_grouping and any(_has_coordinates(photo) for _, photo in timed):
+            sessions = self._split_sessions_sequential(timed)
+        else:
+            # Without location data the split depends only on time gaps
+            sessions = self._split_sessions_by_time_gap(timed)
 
-            if not capture_time:
-                # Handle photos without timestamps separately
-                continue
+        # Add session numbers and names
+        for i, session in enumerate(sessions, 1):
+            session.session_number = i
+            session.session_name = self._generate_session_name(session, i)
 
-            if last_capture_time is None or self._is_same_session(
-                last_capture_time, capture_time, current_session, photo
-            ):
-                current_session.append(photo)
-            else:
-                # End current session and start new one
-                if len(current_session) >= self.min_photos_per_session:
-                    sessions.append(self._create_session_info(current_session))
+        logger.info(f"Detected {len(sessions)} shooting sessions from {len(photos_metadata)} photos")
+        return sessions
 
-                current_session = [photo]
+    @staticmethod
+    def _new_session_state() -> dict[str, Any]:
+        """Create the mutable state for a session being built, holding its running GPS sums in radians"""
+        return {
+            "sum_lat": 0.0,
+            "sum_lon": 0.0,
+            "gps_count": 0,
+        }
 
-            last_capture_time = capture_time
+    @staticmethod
+    def _add_to_session(state: dict[str, Any], coords: tuple[float, float] | None):
+        """Fold a photo's position (radians) into the session's running centroid"""
+        if coords is not None:
+            state["sum_lat"] += coords[0]
+            state["sum_lon"] += coords[1]
+            state["gps_count"] += 1
+
+    def _split_sessions_sequential(self, timed: list[tuple[datetime, dict[str, Any]]]) -> list[Session]:
+        """Walk time-sorted photos, recording where time gaps or location changes start a new session"""
+        times = [capture_time for capture_time, _ in timed]
+        photos = [photo for _, photo in timed]
+        # Convert each photo's coordinates to radians once, up front
+        coords = [_gps_radians(photo) for photo in photos]
+        breaks = []
+        current_state = self._new_session_state()
+
+        for i, photo_coords in enumerate(coords):
+            if i and not self._is_same_session(times[i - 1], times[i], current_state, photo_coords):
+                breaks.append(i)
+                current_state = self._new_session_state()
+
+            self._add_to_session(current_state, photo_coords)
+
+        return self._sessions_from_breaks(photos, times, breaks)
+
+    def _split_sessions_by_time_gap(self, timed: list[tuple[datetime, dict[str, Any]]]) -> list[Session]:
+        """Split time-sorted photos wherever consecutive capture times exceed the gap, using NumPy"""
+        if not timed:
+            return []
 
-        # Add final session
-        if len(current_session) >= self.min_photos_per_session:
-            sessions.append(self._create_session_info(current_session))
+        times = [capture_time for capture_time, _ in timed]
+        photos = [photo for _, photo in timed]
 
-        # Add session numbers and names
-        for i, session in enumerate(sessions, 1):
-            session["session_number"] = i
-            session["session_name"] = self._generate_session_name(session, i)
+        gaps = np.diff(_to_epoch_us(times))
+        breaks = (np.flatnonzero(gaps > self._time_gap_us) + 1).tolist()
+
+        return self._sessions_from_breaks(photos, times, breaks)
+
+    def _sessions_from_breaks(
+        self, photos: list[dict[str, Any]], times: list[datetime], breaks: list[int]
+    ) -> list[Session]:
+        """Slice time-sorted photos at the break indices, keeping runs large enough to be a session"""
+        sessions = []
+        for start, end in zip([0, *breaks], [*breaks, len(photos)], strict=True):
+            if end - start >= self.min_photos_per_session:
+                sessions.append(self._create_session_info(photos[start:end], times[start], times[end - 1]))
 
-        logger.info(f"Detected {len(sessions)} shooting sessions from {len(photos_metadata)} photos")
         return sessions
 
     def _get_capture_time(self, metadata: dict[str, Any]) -> datetime | None:
-        """Extract capture time from metadata"""
-        time_fields = [
-            "datetime_original",
-            "datetime_digitized",
-            "datetime",
-            "file_modified",
-        ]
-
-        for field in time_fields:
-            if field in metadata and metadata[field]:
-                if isinstance(metadata[field], datetime):
-                    return metadata[field]
-                elif isinstance(metadata[field], str):
-                    try:
-                        return datetime.fromisoformat(metadata[field])
-                    except ValueError:
-                        continue
+        """Extract capture time from metadata, memoizing the result on the metadata dict"""
+        cached = metadata.get(_CAPTURE_TIME_KEY, _SENTINEL)
+        if cached is not _SENTINEL:
+            return cached
+
+        capture_time = self._parse_capture_time(metadata)
+        metadata[_CAPTURE_TIME_KEY] = capture_time
+        return capture_time
+
+    def _parse_capture_time(self, metadata: dict[str, Any]) -> datetime | None:
+        """Parse capture time from the first usable timestamp field"""
+        # Fast path: nearly all EXIF data carries datetime_original as a datetime or ISO string
+        try:
+            value = metadata["datetime_original"]
+            if value.__class__ is datetime:
+                return value
+            return datetime.fromisoformat(value)
+        except (KeyError, TypeError, ValueError):
+            pass
+
+        for field in _TIME_FIELDS:
+            try:
+                value = metadata[field]
+            except KeyError:
+                continue
+            if not value:
+                continue
+            if isinstance(value, datetime):
+                return value
+            if isinstance(value, str):
+                try:
+                    return datetime.fromisoformat(value)
+                except ValueError:
+                    continue
 
         return None
 
@@ -84,128 +267,123 @@ class SessionDetector:
         self,
         last_time: datetime,
         current_time: datetime,
-        current_session: list[dict[str, Any]],
-        current_photo: dict[str, Any],
+        current_state: dict[str, Any],
+        current_coords: tuple[float, float] | None,
     ) -> bool:
         """Determine if current photo belongs to the same session"""
         # Check time gap
-        time_diff = current_time - last_time
-        if time_diff > timedelta(minutes=self.time_gap_minutes):
+        if current_time - last_time > self._time_gap:
             return False
 
         # Check location proximity if enabled and available
-        if self.enable_location_grouping and current_session:
-            if not self._is_same_location(current_session, current_photo):
+        if self.enable_location_grouping:
+            if not self._is_same_location(current_state, current_coords):
                 return False
 
         return True
 
-    def _is_same_location(self, current_session: list[dict[str, Any]], current_photo: dict[str, Any]) -> bool:
-        """Check if current photo is at the same location as session"""
-        current_gps = current_photo.get("gps")
-        if not current_gps:
+    def _is_same_location(self, current_state: dict[str, Any], current_coords: tuple[float, float] | None) -> bool:
+        """Check if current photo (coordinates in radians) is at the same location as session"""
+        if current_coords is None:
             return True  # No GPS data, assume same location
 
-        # Get average location of current session
-        session_locations = []
-        for photo in current_session:
-            photo_gps = photo.get("gps")
-            if photo_gps and "latitude" in photo_gps and "longitude" in photo_gps:
-                session_locations.append((photo_gps["latitude"], photo_gps["longitude"]))
-
-        if not session_locations:
+        gps_count = current_state["gps_count"]
+        if not gps_count:
             return True  # No GPS data in session
 
-        # Calculate average session location
-        avg_lat = sum(lat for lat, lon in session_locations) / len(session_locations)
-        avg_lon = sum(lon for lat, lon in session_locations) / len(session_locations)
-
-        # Check distance from current photo to session average
-        current_lat = current_gps.get("latitude")
-        current_lon = current_gps.get("longitude")
-
-        if current_lat is None or current_lon is None:
-            return True
+        # Average session location from the running sums
+        avg_lat = current_state["sum_lat"] / gps_count
+        avg_lon = current_state["sum_lon"] / gps_count
+        current_lat, current_lon = current_coords
 
-        distance_km = self._calculate_distance(avg_lat, avg_lon, current_lat, current_lon)
+        if self.same_location_threshold_km <= EQUIRECTANGULAR_MAX_KM:
+            # The centroid moves with every located photo, so its cos(latitude) is taken per check
+            distance_km = self._calculate_distance_fast(avg_lat, avg_lon, math.cos(avg_lat), current_lat, current_lon)
+        else:
+            distance_km = _hav_rad(avg_lat, avg_lon, current_lat, current_lon)
         return distance_km <= self.same_location_threshold_km
 
     def _calculate_distance(self, lat1: float, lon1: float, lat2: float, lon2: float) -> float:
         """Calculate distance between two GPS coordinates in kilometers"""
-        import math
-
-        # Haversine formula
-        earth_radius_km = 6371  # Earth radius in km
-
-        lat1_rad = math.radians(lat1)
-        lat2_rad = math.radians(lat2)
-        delta_lat = math.radians(lat2 - lat1)
-        delta_lon = math.radians(lon2 - lon1)
+        return _hav_rad(math.radians(lat1), math.radians(lon1), math.radians(lat2), math.radians(lon2))
 
-        a = math.sin(delta_lat / 2) ** 2 + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(delta_lon / 2) ** 2
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+    def _calculate_distance_fast(
+        self, avg_lat: float, avg_lon: float, cos_avg_lat: float, lat: float, lon: float
+    ) -> float:
+        """Equirectangular distance in kilometers from a centroid (radians), given the cosine of its latitude"""
+        delta_lon = (lon - avg_lon + math.pi) % math.tau - math.pi  # wrap across the antimeridian
+        return EARTH_RADIUS_KM * math.hypot(delta_lon * cos_avg_lat, lat - avg_lat)
 
-        return earth_radius_km * c
-
-    def _create_session_info(self, session_photos: list[dict[str, Any]]) -> dict[str, Any]:
-        """Create session information from list of photos"""
-        start_time = self._get_capture_time(session_photos[0])
-        end_time = self._get_capture_time(session_photos[-1])
+    def _create_session_info(
+        self,
+        session_photos: list[dict[str, Any]],
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+    ) -> Session:
+        """Create session information from list of photos in a single pass"""
+        if start_time is None:
+            start_time = self._get_capture_time(session_photos[0])
+        if end_time is None:
+            end_time = self._get_capture_time(session_photos[-1])
 
         # Calculate session statistics
-        cameras = set()
-        lenses = set()
-        locations = []
+        # Insertion-ordered dicts keep cameras and lenses in first-seen order
+        cameras: dict[str, None] = {}
+        lenses: dict[str, None] = {}
+        sum_lat = sum_lon = 0.0
+        gps_count = 0
         total_size = 0
+        file_paths = []
+        first_location = None
 
         for photo in session_photos:
-            if photo.get("camera_model"):
-                cameras.add(photo["camera_model"])
-            if photo.get("lens_model"):
-                lenses.add(photo["lens_model"])
-            if photo.get("gps"):
-                gps = photo["gps"]
-                if "latitude" in gps and "longitude" in gps:
-                    locations.append((gps["latitude"], gps["longitude"]))
+            if camera_model := photo.get("camera_model"):
+                cameras[camera_model] = None
+            if lens_model := photo.get("lens_model"):
+                lenses[lens_model] = None
+            gps = photo.get("gps")
+            if gps and "latitude" in gps and "longitude" in gps:
+                sum_lat += gps["latitude"]
+                sum_lon += gps["longitude"]
+                gps_count += 1
             if photo.get("file_size"):
                 total_size += photo["file_size"]
+            if first_location is None and photo.get("location"):
+                first_location = photo["location"]
+            file_paths.append(photo["file_path"])
 
         # Calculate session location (average of all GPS points)
         session_location = None
         session_location_name = None
-        if locations:
-            avg_lat = sum(lat for lat, lon in locations) / len(locations)
-            avg_lon = sum(lon for lat, lon in locations) / len(locations)
-            session_location = {"latitude": avg_lat, "longitude": avg_lon}
+        if gps_count:
+            session_location = {"latitude": sum_lat / gps_count, "longitude": sum_lon / gps_count}
 
             # Use location from first photo with location info
-            for photo in session_photos:
-                if photo.get("location"):
-                    session_location_name = photo["location"].get("display_name")
-                    break
+            if first_location is not None:
+                session_location_name = first_location.get("display_name")
 
         duration = None
         if start_time and end_time:
             duration = end_time - start_time
 
-        return {
-            "photos": session_photos,
-            "photo_count": len(session_photos),
-            "start_time": start_time,
-            "end_time": end_time,
-            "duration": duration,
-            "cameras_used": list(cameras),
-            "lenses_used": list(lenses),
-            "location": session_location,
-            "location_name": session_location_name,
-            "total_size_mb": round(total_size / (1024 * 1024), 2) if total_size else 0,
-            "file_paths": [photo["file_path"] for photo in session_photos],
-        }
-
-    def _generate_session_name(self, session: dict[str, Any], session_number: int) -> str:
+        return Session(
+            photos=session_photos,
+            photo_count=len(session_photos),
+            start_time=start_time,
+            end_time=end_time,
+            duration=duration,
+            cameras_used=tuple(cameras),
+            lenses_used=tuple(lenses),
+            location=session_location,
+            location_name=session_location_name,
+            total_size_mb=round(total_size / (1024 * 1024), 2) if total_size else 0,
+            file_paths=tuple(file_paths),
+        )
+
+    def _generate_session_name(self, session: Session, session_number: int) -> str:
         """Generate a descriptive name for the session"""
-        start_time = session["start_time"]
-        location_name = session.get("location_name")
+        start_time = session.start_time
+        location_name = session.location_name
 
         if not start_time:
             return f"Session_{session_number:02d}"
@@ -222,16 +400,55 @@ class SessionDetector:
 
     def _clean_name_for_filename(self, name: str) -> str:
         """Clean name to be suitable for filename"""
-        import re
-
         # Remove special characters and replace spaces with underscores
-        clean = re.sub(r"[^\w\s-]", "", name.strip())
-        clean = re.sub(r"[\s]+", "_", clean)
+        clean = _FNAME_STRIP.sub("", name.strip())
+        clean = _FNAME_WS.sub("_", clean)
         return clean[:30]  # Limit length
 
+    def find_session_for_photo(self, sessions: list[Session], photo: dict[str, Any]) -> Session | None:
+        """Find the detected session a new photo would belong to, e.g. for incremental imports.
+
+        A session qualifies when the photo falls within the time gap of its start/end and, when both
+        sides have GPS, its centroid lies within the location threshold. Among located sessions the
+        nearest centroid wins (distances computed in one vectorized pass); otherwise the session
+        closest in time to the photo does.
+        """
+        capture_time = self._get_capture_time(photo)
+        if capture_time is None:
+            return None
+
+        candidates = [
+            session
+            for session in sessions
+            if session.start_time is not None
+            and session.end_time is not None
+            and session.start_time - self._time_gap <= capture_time <= session.end_time + self._time_gap
+        ]
+        if not candidates:
+            return None
+
+        def time_distance(session: Session) -> timedelta:
+            # Zero inside the session, else the gap to its nearer end
+            return max(session.start_time - capture_time, capture_time - session.end_time, timedelta(0))
+
+        located = [session for session in candidates if session.location]
+        if not (self.enable_location_grouping and _has_coordinates(photo) and located):
+            return min(candidates, key=time_distance)
+
+        photo_gps = photo["gps"]
+        centroids = np.array([(s.location["latitude"], s.location["longitude"]) for s in located])
+        distances = _haversine_np(photo_gps["latitude"], photo_gps["longitude"], centroids[:, 0], centroids[:, 1])
+        nearest = int(np.argmin(distances))
+        if distances[nearest] <= self.same_location_threshold_km:
+            return located[nearest]
+
+        # Sessions without GPS cannot be ruled out by location
+        unlocated = [session for session in candidates if not session.location]
+        return min(unlocated, key=time_distance) if unlocated else None
+
     def organize_by_sessions(
         self,
-        sessions: list[dict[str, Any]],
+        sessions: list[Session],
         base_output_dir: str,
         session_folder_pattern: str = "{session_name}",
         dry_run: bool = False,
@@ -245,48 +462,56 @@ class SessionDetector:
         }
 
         base_path = Path(base_output_dir)
+        try:
+            pattern_fields = _pattern_fields(session_folder_pattern)
+        except ValueError:
+            pattern_fields = set()  # malformed pattern; format_map reports it per session below
 
         for session in sessions:
             try:
-                session_folder_name = session_folder_pattern.format(**session)
+                session_folder_name = session_folder_pattern.format_map(
+                    {field: session[field] for field in pattern_fields}
+                )
                 session_path = base_path / session_folder_name
 
                 if dry_run:
                     logger.info(f"[DRY RUN] Would create session folder: {session_path}")
-                    logger.info(f"[DRY RUN] Would organize {session['photo_count']} photos")
+                    logger.info(f"[DRY RUN] Would organize {session.photo_count} photos")
                 else:
                     session_path.mkdir(parents=True, exist_ok=True)
                     result["folders_created"].append(str(session_path))
 
                 result["sessions_processed"] += 1
-                result["files_organized"] += session["photo_count"]
+                result["files_organized"] += session.photo_count
 
             except Exception as e:
-                error_msg = f"Error organizing session {session.get('session_name', 'unknown')}: {e}"
+                error_msg = f"Error organizing session {session.session_name or 'unknown'}: {e}"
                 result["errors"].append(error_msg)
                 logger.error(error_msg)
 
         return result
 
-    def get_session_statistics(self, sessions: list[dict[str, Any]]) -> dict[str, Any]:
+    def get_session_statistics(self, sessions: list[Session]) -> dict[str, Any]:
         """Generate statistics about detected sessions"""
         if not sessions:
             return {"total_sessions": 0}
 
-        total_photos = sum(session["photo_count"] for session in sessions)
-        total_duration = timedelta()
+        total_photos = sum(session.photo_count for session in sessions)
+        # Sum durations as integer microseconds and build each timedelta once
+        total_duration_us = 0
         cameras = set()
         locations = set()
 
         for session in sessions:
-            if session.get("duration"):
-                total_duration += session["duration"]
-            cameras.update(session.get("cameras_used", []))
-            if session.get("location_name"):
-                locations.add(session["location_name"])
-
-        avg_photos_per_session = total_photos / len(sessions) if sessions else 0
-        avg_duration = total_duration / len(sessions) if sessions else timedelta()
+            if session.duration:
+                total_duration_us += session.duration // _ONE_MICROSECOND
+            cameras.update(session.cameras_used)
+            if session.location_name:
+                locations.add(session.location_name)
+
+        avg_photos_per_session = total_photos / len(sessions)
+        total_duration = timedelta(microseconds=total_duration_us)
+        avg_duration = timedelta(microseconds=total_duration_us / len(sessions))
 
         return {
             "total_sessions": len(sessions),
@@ -1,16 +1,263 @@
+import calendar
 import logging
-from collections import Counter, defaultdict
-from datetime import datetime
+import os
+import sys
+import weakref
+from collections import Counter
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, fields
+from datetime import datetime, timedelta
+from itertools import islice
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import matplotlib.pyplot as plt
 import numpy as np
 from rich.console import Console
 from rich.table import Table
 
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+
 logger = logging.getLogger(__name__)
 
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Libraries at least this large are extracted on several threads when running without the GIL
+PARALLEL_EXTRACT_MIN_PHOTOS = 50_000
+
+# Entries kept in each reported distribution; the full unique counts are reported alongside
+DISTRIBUTION_TOP_K = 10
+
+_DATE_FIELDS = ("datetime_original", "datetime_digitized", "datetime", "file_modified")
+# Key under which the parsed photo date is memoized on each metadata dict
+_PHOTO_DATE_KEY = "_photo_date_cached"
+_SENTINEL = object()
+
+_EPOCH = datetime(1970, 1, 1)
+_ONE_SECOND = timedelta(seconds=1)
+
+# Chart figures keyed by chart name, cleared and reused between renders instead of rebuilt
+_CHART_FIGURES: dict[str, "Figure"] = {}
+
+# Widest value range counted with a dense per-value array in _dense_bin_counts
+MAX_DENSE_BIN_SPAN = 1 << 20
+
+
+def _dense_bin_counts(bins: np.ndarray, lo: int, span: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Count integer bins in one pass, returning (values, first_index, counts) per occupied value in ascending order"""
+    counts = np.zeros(span, dtype=np.int64)
+    first_index = np.zeros(span, dtype=np.int64)
+    for i in range(bins.size):
+        j = bins[i] - lo
+        if counts[j] == 0:
+            first_index[j] = i
+        counts[j] += 1
+    occupied = np.flatnonzero(counts)
+    return occupied + lo, first_index[occupied], counts[occupied]
+
+
+if NUMBA_AVAILABLE:
+    try:
+        _dense_bin_counts = njit(cache=True)(_dense_bin_counts)
+    except Exception as e:  # e.g. no writable cache locator in a frozen build
+        logger.debug(f"numba JIT unavailable for bin counting kernel, using NumPy fallback: {e}")
+        NUMBA_AVAILABLE = False
+
+
+def _bin_counts(bins: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(values, first_index, counts) for each distinct value of a column, in ascending value order.
+
+    Integer columns over a modest range go through the numba-compiled dense kernel when available,
+    anything else through np.unique.
+    """
+    if NUMBA_AVAILABLE and bins.dtype == np.int64:
+        lo = int(bins.min())
+        span = int(bins.max()) - lo + 1
+        if span <= MAX_DENSE_BIN_SPAN:
+            return _dense_bin_counts(bins, lo, span)
+    return np.unique(bins, return_index=True, return_counts=True)
+
+
+def _get_chart_figure(name: str, figsize: tuple[float, float]) -> "Figure":
+    """Return the cached figure for a chart, cleared for redrawing.
+
+    Figures are created directly rather than through pyplot, so no GUI backend or global figure
+    manager is involved and the same Figure can be rendered again. matplotlib is imported here, on
+    first use, so statistics runs that never draw a chart skip its import cost.
+    """
+    from matplotlib.figure import Figure
+
+    fig = _CHART_FIGURES.get(name)
+    if fig is None:
+        fig = _CHART_FIGURES[name] = Figure(figsize=figsize)
+    else:
+        fig.clf()
+    return fig
+
+
+def _render_shooting_patterns_chart(patterns: dict[str, Any], output_path: Path, dpi: int) -> str | None:
+    """Create shooting patterns chart"""
+    try:
+        fig = _get_chart_figure("shooting_patterns", (12, 10))
+        ax1, ax2 = fig.subplots(2, 1)
+
+        # Photos by hour
+        if "photos_by_hour" in patterns:
+            hours = list(patterns["photos_by_hour"].keys())
+            counts = list(patterns["photos_by_hour"].values())
+
+            ax1.bar(hours, counts, color="skyblue", alpha=0.7, rasterized=True)
+            ax1.set_title("Photos by Hour of Day")
+            ax1.set_xlabel("Hour")
+            ax1.set_ylabel("Number of Photos")
+            ax1.set_xticks(range(0, 24, 2))
+
+        # Photos by month
+        if "photos_by_month" in patterns:
+            months = list(patterns["photos_by_month"].keys())
+            counts = list(patterns["photos_by_month"].values())
+
+            ax2.plot(months, counts, marker="o", markersize=3, color="orange", rasterized=True)
+            ax2.set_title("Photos by Month")
+            ax2.set_xlabel("Month")
+            ax2.set_ylabel("Number of Photos")
+            ax2.tick_params(axis="x", rotation=45)
+
+        fig.subplots_adjust(left=0.08, right=0.97, top=0.95, bottom=0.1, hspace=0.35)
+        chart_path = output_path / "shooting_patterns.png"
+        fig.savefig(chart_path, dpi=dpi)
+
+        return str(chart_path)
+
+    except Exception as e:
+        logger.error(f"Error creating shooting patterns chart: {e}")
+        return None
+
+
+def _render_camera_usage_chart(camera_stats: dict[str, Any], output_path: Path, dpi: int) -> str | None:
+    """Create camera usage pie chart"""
+    try:
+        if not camera_stats.get("camera_distribution"):
+            return None
+
+        cameras = list(islice(camera_stats["camera_distribution"].keys(), 5))  # Top 5
+        counts = list(islice(camera_stats["camera_distribution"].values(), 5))
+
+        fig = _get_chart_figure("camera_usage", (10, 8))
+        ax = fig.subplots()
+        ax.pie(counts, labels=cameras, autopct="%1.1f%%", startangle=90)
+        ax.set_title("Camera Usage Distribution")
+        ax.axis("equal")
+
+        chart_path = output_path / "camera_usage.png"
+        fig.savefig(chart_path, dpi=dpi)
+
+        return str(chart_path)
+
+    except Exception as e:
+        logger.error(f"Error creating camera usage chart: {e}")
+        return None
+
+
+def _render_technical_settings_chart(tech_stats: dict[str, Any], output_path: Path, dpi: int) -> str | None:
+    """Create technical settings distribution chart"""
+    try:
+        fig = _get_chart_figure("technical_settings", (18, 6))
+        axes = fig.subplots(1, 3)
+
+        # ISO distribution
+        if "iso" in tech_stats and "distribution" in tech_stats["iso"]:
+            iso_data = tech_stats["iso"]["distribution"]
+            isos = list(islice(iso_data.keys(), 10))
+            counts = list(islice(iso_data.values(), 10))
+
+            axes[0].bar(range(len(isos)), counts, color="lightcoral")
+            axes[0].set_title("ISO Distribution")
+            axes[0].set_xlabel("ISO")
+            axes[0].set_ylabel("Count")
+            axes[0].set_xticks(range(len(isos)))
+            axes[0].set_xticklabels(isos, rotation=45)
+
+        # Aperture distribution
+        if "aperture" in tech_stats and "distribution" in tech_stats["aperture"]:
+            aperture_data = tech_stats["aperture"]["distribution"]
+            apertures = list(islice(aperture_data.keys(), 10))
+            counts = list(islice(aperture_data.values(), 10))
+
+            axes[1].bar(range(len(apertures)), counts, color="lightgreen")
+            axes[1].set_title("Aperture Distribution")
+            axes[1].set_xlabel("f-stop")
+            axes[1].set_ylabel("Count")
+            axes[1].set_xticks(range(len(apertures)))
+            axes[1].set_xticklabels([f"f/{a}" for a in apertures], rotation=45)
+
+        # Placeholder for third chart
+        axes[2].text(0.5, 0.5, "Additional\nMetrics", ha="center", va="center", fontsize=16)
+        axes[2].set_title("Future Metrics")
+
+        fig.subplots_adjust(left=0.05, right=0.98, top=0.92, bottom=0.18, wspace=0.25)
+        chart_path = output_path / "technical_settings.png"
+        fig.savefig(chart_path, dpi=dpi)
+
+        return str(chart_path)
+
+    except Exception as e:
+        logger.error(f"Error creating technical settings chart: {e}")
+        return None
+
+
+# Chart renderers by statistics section, in output order; module-level so worker processes can unpickle them
+_CHART_RENDERERS = {
+    "shooting_patterns": _render_shooting_patterns_chart,
+    "cameras": _render_camera_usage_chart,
+    "technical_settings": _render_technical_settings_chart,
+}
+
+
+@dataclass(slots=True)
+class LibraryColumns:
+    """Per-field values gathered from the photo metadata in one pass, shared by the analyzers"""
+
+    dates: list[datetime]
+    makes: list[str | None]
+    models: list[str | None]
+    lenses: list[str]
+    focal_lengths: list[int | float]
+    iso_values: list[int | float]
+    aperture_values: list[int | float]
+    shutter_speeds: list[int | float]
+    file_sizes: list[int | float]
+    extensions: list[str]
+    dimensions: list[tuple[int, int]]
+    gps_photos: int
+    location_names: list[str]
+    countries: list[str]
+    cities: list[str]
+
+
+def _concat_columns(parts: list[LibraryColumns]) -> LibraryColumns:
+    """Concatenate column chunks in order into the first chunk"""
+    merged = parts[0]
+    for part in parts[1:]:
+        for field in fields(LibraryColumns):
+            if field.name == "gps_photos":
+                merged.gps_photos += part.gps_photos
+            else:
+                getattr(merged, field.name).extend(getattr(part, field.name))
+    return merged
+
+
+def _gil_enabled() -> bool:
+    """Whether the interpreter runs with the GIL (always true before Python 3.13)"""
+    return getattr(sys, "_is_gil_enabled", lambda: True)()
+
 
 class StatisticsGenerator:
     def __init__(self, config: dict[str, Any]):
@@ -19,255 +266,394 @@ class StatisticsGenerator:
         self.console = Console()
         self.enable_charts = self.stats_config.get("enable_charts", True)
         self.chart_output_dir = self.stats_config.get("chart_output_dir", "charts")
+        self.chart_dpi = self.stats_config.get("chart_dpi", 150)
+        # Kept across generate_charts calls so the workers' cached Figures are reused too
+        self._chart_executor: ProcessPoolExecutor | None = None
 
     def generate_library_statistics(self, photos_metadata: list[dict[str, Any]]) -> dict[str, Any]:
         """Generate comprehensive statistics for the photo library"""
         if not photos_metadata:
             return {"error": "No photos provided for analysis"}
 
+        columns = self._extract_columns(photos_metadata)
+
         stats = {
             "total_photos": len(photos_metadata),
-            "date_range": self._calculate_date_range(photos_metadata),
-            "cameras": self._analyze_cameras(photos_metadata),
-            "lenses": self._analyze_lenses(photos_metadata),
-            "technical_settings": self._analyze_technical_settings(photos_metadata),
-            "file_info": self._analyze_file_info(photos_metadata),
-            "location_info": self._analyze_locations(photos_metadata),
-            "shooting_patterns": self._analyze_shooting_patterns(photos_metadata),
+            "date_range": self._calculate_date_range(columns),
+            "cameras": self._analyze_cameras(columns),
+            "lenses": self._analyze_lenses(columns),
+            "technical_settings": self._analyze_technical_settings(columns),
+            "file_info": self._analyze_file_info(columns),
+            "location_info": self._analyze_locations(columns),
+            "shooting_patterns": self._analyze_shooting_patterns(columns),
             "quality_metrics": self._analyze_quality_metrics(photos_metadata),
         }
 
         return stats
 
-    def _calculate_date_range(self, photos_metadata: list[dict[str, Any]]) -> dict[str, Any]:
-        """Calculate date range of photos"""
+    def _extract_columns(self, photos_metadata: list[dict[str, Any]]) -> LibraryColumns:
+        """Walk the metadata once, collecting every field the analyzers need into per-field lists.
+
+        On free-threaded Python builds, large libraries are split into contiguous chunks extracted on
+        worker threads and concatenated in order; with the GIL, threads would only add overhead.
+        """
+        workers = os.process_cpu_count() or 1
+        if workers > 1 and len(photos_metadata) >= PARALLEL_EXTRACT_MIN_PHOTOS and not _gil_enabled():
+            chunk_size = -(-len(photos_metadata) // workers)
+            chunks = [photos_metadata[i : i + chunk_size] for i in range(0, len(photos_metadata), chunk_size)]
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                parts = list(executor.map(self._extract_columns_chunk, chunks))
+            return _concat_columns(parts)
+
+        return self._extract_columns_chunk(photos_metadata)
+
+    def _extract_columns_chunk(self, photos_metadata: list[dict[str, Any]]) -> LibraryColumns:
+        """Collect the analyzer columns from one contiguous run of photos"""
         dates = []
+        makes = []
+        models = []
+        lenses = []
+        focal_lengths = []
+        iso_values = []
+        aperture_values = []
+        shutter_speeds = []
+        file_sizes = []
+        extensions = []
+        dimensions = []
+        location_names = []
+        countries = []
+        cities = []
+        gps_photos = 0
+
         for photo in photos_metadata:
             date = self._get_photo_date(photo)
             if date:
                 dates.append(date)
 
+            makes.append(photo.get("camera_make", "Unknown"))
+            models.append(photo.get("camera_model", "Unknown"))
+
+            lens = photo.get("lens_model")
+            if lens and lens != "Unknown":
+                lenses.append(lens)
+
+            focal_length = photo.get("focal_length")
+            if focal_length and isinstance(focal_length, int | float):
+                focal_lengths.append(focal_length)
+
+            iso = photo.get("iso")
+            if iso and isinstance(iso, int | float):
+                iso_values.append(iso)
+
+            f_number = photo.get("f_number")
+            if f_number and isinstance(f_number, int | float):
+                aperture_values.append(f_number)
+
+            exposure = photo.get("exposure_time")
+            if exposure and isinstance(exposure, int | float):
+                shutter_speeds.append(exposure)
+
+            size = photo.get("file_size")
+            if size and isinstance(size, int | float):
+                file_sizes.append(size)
+
+            ext = photo.get("file_extension", "").lower()
+            if ext:
+                extensions.append(ext)
+
+            width = photo.get("width")
+            height = photo.get("height")
+            if width and height:
+                dimensions.append((width, height))
+
+            if photo.get("gps"):
+                gps_photos += 1
+
+            location = photo.get("location")
+            if location:
+                display_name = location.get("display_name")
+                if display_name:
+                    location_names.append(display_name)
+
+                country = location.get("country")
+                if country:
+                    countries.append(country)
+
+                city = location.get("city")
+                if city:
+                    cities.append(city)
+
+        return LibraryColumns(
+            dates=dates,
+            makes=makes,
+            models=models,
+            lenses=lenses,
+            focal_lengths=focal_lengths,
+            iso_values=iso_values,
+            aperture_values=aperture_values,
+            shutter_speeds=shutter_speeds,
+            file_sizes=file_sizes,
+            extensions=extensions,
+            dimensions=dimensions,
+            gps_photos=gps_photos,
+            location_names=location_names,
+            countries=countries,
+            cities=cities,
+        )
+
+    @staticmethod
+    def _numeric_summary(arr: np.ndarray, values: list[int | float]) -> dict[str, Any]:
+        """Min/max/mean/median of a numeric column given as a float64 array alongside its original values.
+
+        min and max are taken from the original values (via argmin/argmax) so ints stay ints.
+        """
+        return {
+            "min": values[int(arr.argmin())],
+            "max": values[int(arr.argmax())],
+            "mean": arr.mean(),
+            "median": np.median(arr),
+        }
+
+    @staticmethod
+    def _top_counts(bins: np.ndarray, k: int, keys: list[Any] | None = None) -> list[tuple[Any, int]]:
+        """Top-k (value, count) pairs of a numeric column, ordered like Counter.most_common(k).
+
+        Ties keep first-seen order. Each bin is labelled with the first original value that fell
+        into it (or the bin value itself when no keys are given).
+        """
+        _, first_index, counts = _bin_counts(bins)
+        order = np.lexsort((first_index, -counts))[:k]
+        top = zip(first_index[order].tolist(), counts[order].tolist(), strict=True)
+        if keys is None:
+            return [(bins[i].item(), count) for i, count in top]
+        return [(keys[i], count) for i, count in top]
+
+    @staticmethod
+    def _integer_bins(arr: np.ndarray) -> np.ndarray:
+        """The column as int64 when every value is whole (e.g. ISO), so it can use the dense counting kernel"""
+        as_int = arr.astype(np.int64)
+        return as_int if np.array_equal(as_int, arr) else arr
+
+    def _calculate_date_range(self, columns: LibraryColumns) -> dict[str, Any]:
+        """Calculate date range of photos"""
+        dates = columns.dates
+
         if not dates:
             return {"error": "No valid dates found"}
 
-        dates.sort()
-        span = dates[-1] - dates[0]
+        earliest = min(dates)
+        latest = max(dates)
+        span = latest - earliest
 
         return {
-            "earliest": dates[0],
-            "latest": dates[-1],
+            "earliest": earliest,
+            "latest": latest,
             "span_days": span.days,
             "span_years": round(span.days / 365.25, 1),
             "total_photos_with_dates": len(dates),
         }
 
-    def _analyze_cameras(self, photos_metadata: list[dict[str, Any]]) -> dict[str, Any]:
+    def _analyze_cameras(self, columns: LibraryColumns) -> dict[str, Any]:
         """Analyze camera usage statistics"""
-        camera_counts = Counter()
-        camera_models = Counter()
-        camera_makes = Counter()
-
-        for photo in photos_metadata:
-            make = photo.get("camera_make", "Unknown")
-            model = photo.get("camera_model", "Unknown")
-
-            camera_makes[make] += 1
-            camera_models[model] += 1
+        makes = columns.makes
+        models = columns.models
 
-            if make != "Unknown" and model != "Unknown":
-                full_name = f"{make} {model}"
-                camera_counts[full_name] += 1
+        camera_makes = Counter(makes)
+        camera_models = Counter(models)
+        camera_counts = Counter(
+            f"{make} {model}"
+            for make, model in zip(makes, models, strict=True)
+            if make != "Unknown" and model != "Unknown"
+        )
 
         return {
             "total_cameras": len(camera_counts),
             "most_used_camera": (camera_counts.most_common(1)[0] if camera_counts else None),
-            "camera_distribution": dict(camera_counts.most_common()),
-            "make_distribution": dict(camera_makes.most_common()),
-            "model_distribution": dict(camera_models.most_common()),
+            "total_makes": len(camera_makes),
+            "total_models": len(camera_models),
+            "camera_distribution": dict(camera_counts.most_common(DISTRIBUTION_TOP_K)),
+            "make_distribution": dict(camera_makes.most_common(DISTRIBUTION_TOP_K)),
+            "model_distribution": dict(camera_models.most_common(DISTRIBUTION_TOP_K)),
         }
 
-    def _analyze_lenses(self, photos_metadata: list[dict[str, Any]]) -> dict[str, Any]:
+    def _analyze_lenses(self, columns: LibraryColumns) -> dict[str, Any]:
         """Analyze lens usage statistics"""
-        lens_counts = Counter()
-        focal_lengths = []
-
-        for photo in photos_metadata:
-            lens = photo.get("lens_model")
-            if lens and lens != "Unknown":
-                lens_counts[lens] += 1
-
-            focal_length = photo.get("focal_length")
-            if focal_length and isinstance(focal_length, int | float):
-                focal_lengths.append(focal_length)
+        lens_counts = Counter(columns.lenses)
+        focal_lengths = columns.focal_lengths
 
         focal_length_stats = {}
         if focal_lengths:
+            focal_arr = np.asarray(focal_lengths, dtype=np.float64)
+            summary = self._numeric_summary(focal_arr, focal_lengths)
             focal_length_stats = {
-                "min": min(focal_lengths),
-                "max": max(focal_lengths),
-                "avg": round(np.mean(focal_lengths), 1),
-                "median": round(np.median(focal_lengths), 1),
-                "most_common": Counter([int(fl) for fl in focal_lengths]).most_common(5),
+                "min": summary["min"],
+                "max": summary["max"],
+                "avg": round(summary["mean"], 1),
+                "median": round(summary["median"], 1),
+                # astype truncates toward zero like int()
+                "most_common": self._top_counts(focal_arr.astype(np.int64), 5),
             }
 
         return {
             "total_lenses": len(lens_counts),
             "most_used_lens": lens_counts.most_common(1)[0] if lens_counts else None,
-            "lens_distribution": dict(lens_counts.most_common()),
+            "lens_distribution": dict(lens_counts.most_common(DISTRIBUTION_TOP_K)),
             "focal_length_stats": focal_length_stats,
         }
 
-    def _analyze_technical_settings(self, photos_metadata: list[dict[str, Any]]) -> dict[str, Any]:
+    def _analyze_technical_settings(self, columns: LibraryColumns) -> dict[str, Any]:
         """Analyze camera technical settings"""
-        iso_values = []
-        aperture_values = []
-        shutter_speeds = []
-
-        for photo in photos_metadata:
-            iso = photo.get("iso")
-            if iso and isinstance(iso, int | float):
-                iso_values.append(iso)
-
-            f_number = photo.get("f_number")
-            if f_number and isinstance(f_number, int | float):
-                aperture_values.append(f_number)
-
-            exposure = photo.get("exposure_time")
-            if exposure and isinstance(exposure, int | float):
-                shutter_speeds.append(exposure)
+        iso_values = columns.iso_values
+        aperture_values = columns.aperture_values
+        shutter_speeds = columns.shutter_speeds
 
         stats = {}
 
         if iso_values:
+            iso_arr = np.asarray(iso_values, dtype=np.float64)
+            summary = self._numeric_summary(iso_arr, iso_values)
             stats["iso"] = {
-                "min": min(iso_values),
-                "max": max(iso_values),
-                "avg": round(np.mean(iso_values), 0),
-                "median": round(np.median(iso_values), 0),
-                "distribution": dict(Counter(iso_values).most_common(10)),
+                "min": summary["min"],
+                "max": summary["max"],
+                "avg": round(summary["mean"], 0),
+                "median": round(summary["median"], 0),
+                "distribution": dict(self._top_counts(self._integer_bins(iso_arr), 10, iso_values)),
             }
 
         if aperture_values:
+            aperture_arr = np.asarray(aperture_values, dtype=np.float64)
+            summary = self._numeric_summary(aperture_arr, aperture_values)
+            # Bin by tenths of a stop as integers; each bin is labelled with its first value rounded to 0.1
+            scaled = aperture_arr * 10
+            aperture_bins = np.round(scaled).astype(np.int64)
+            # Exact .5 products can round differently from round(f, 1) (e.g. 20.05); defer those few to Python
+            for i in np.flatnonzero(np.abs(scaled - np.trunc(scaled)) == 0.5).tolist():
+                aperture_bins[i] = round(round(aperture_values[i], 1) * 10)
+            aperture_top = self._top_counts(aperture_bins, 10, aperture_values)
             stats["aperture"] = {
-                "min": min(aperture_values),
-                "max": max(aperture_values),
-                "avg": round(np.mean(aperture_values), 1),
-                "median": round(np.median(aperture_values), 1),
-                "distribution": dict(Counter([round(f, 1) for f in aperture_values]).most_common(10)),
+                "min": summary["min"],
+                "max": summary["max"],
+                "avg": round(summary["mean"], 1),
+                "median": round(summary["median"], 1),
+                "distribution": {round(f, 1): count for f, count in aperture_top},
             }
 
         if shutter_speeds:
+            summary = self._numeric_summary(np.asarray(shutter_speeds, dtype=np.float64), shutter_speeds)
             stats["shutter_speed"] = {
-                "fastest": min(shutter_speeds),
-                "slowest": max(shutter_speeds),
-                "avg": round(np.mean(shutter_speeds), 4),
-                "median": round(np.median(shutter_speeds), 4),
+                "fastest": summary["min"],
+                "slowest": summary["max"],
+                "avg": round(summary["mean"], 4),
+                "median": round(summary["median"], 4),
             }
 
         return stats
 
-    def _analyze_file_info(self, photos_metadata: list[dict[str, Any]]) -> dict[str, Any]:
+    def _analyze_file_info(self, columns: LibraryColumns) -> dict[str, Any]:
         """Analyze file information"""
-        file_sizes = []
-        extensions = Counter()
-        dimensions = []
-
-        for photo in photos_metadata:
-            size = photo.get("file_size")
-            if size and isinstance(size, int | float):
-                file_sizes.append(size)
-
-            ext = photo.get("file_extension", "").lower()
-            if ext:
-                extensions[ext] += 1
-
-            width = photo.get("width")
-            height = photo.get("height")
-            if width and height:
-                dimensions.append((width, height))
+        file_sizes = columns.file_sizes
+        dimensions = columns.dimensions
 
         stats = {}
 
         if file_sizes:
             total_size = sum(file_sizes)
+            summary = self._numeric_summary(np.asarray(file_sizes, dtype=np.float64), file_sizes)
             stats["file_sizes"] = {
                 "total_mb": round(total_size / (1024 * 1024), 2),
                 "total_gb": round(total_size / (1024 * 1024 * 1024), 2),
-                "avg_mb": round(np.mean(file_sizes) / (1024 * 1024), 2),
-                "median_mb": round(np.median(file_sizes) / (1024 * 1024), 2),
-                "largest_mb": round(max(file_sizes) / (1024 * 1024), 2),
-                "smallest_mb": round(min(file_sizes) / (1024 * 1024), 2),
+                "avg_mb": round(summary["mean"] / (1024 * 1024), 2),
+                "median_mb": round(summary["median"] / (1024 * 1024), 2),
+                "largest_mb": round(summary["max"] / (1024 * 1024), 2),
+                "smallest_mb": round(summary["min"] / (1024 * 1024), 2),
             }
 
-        stats["file_types"] = dict(extensions.most_common())
+        extension_counts = Counter(columns.extensions)
+        stats["file_types"] = dict(extension_counts.most_common(DISTRIBUTION_TOP_K))
+        stats["unique_file_types"] = len(extension_counts)
 
         if dimensions:
+            dimension_counts = Counter(dimensions)
             stats["dimensions"] = {
-                "most_common": Counter(dimensions).most_common(5),
-                "unique_resolutions": len(set(dimensions)),
+                "most_common": dimension_counts.most_common(5),
+                "unique_resolutions": len(dimension_counts),
             }
 
         return stats
 
-    def _analyze_locations(self, photos_metadata: list[dict[str, Any]]) -> dict[str, Any]:
+    def _analyze_locations(self, columns: LibraryColumns) -> dict[str, Any]:
         """Analyze location information"""
-        locations = Counter()
-        countries = Counter()
-        cities = Counter()
-        gps_photos = 0
-
-        for photo in photos_metadata:
-            if photo.get("gps"):
-                gps_photos += 1
-
-            location = photo.get("location")
-            if location:
-                display_name = location.get("display_name")
-                if display_name:
-                    locations[display_name] += 1
-
-                country = location.get("country")
-                if country:
-                    countries[country] += 1
-
-                city = location.get("city")
-                if city:
-                    cities[city] += 1
+        locations = Counter(columns.location_names)
+        countries = Counter(columns.countries)
+        cities = Counter(columns.cities)
 
         return {
-            "photos_with_gps": gps_photos,
+            "photos_with_gps": columns.gps_photos,
             "photos_with_location_names": len(locations),
             "unique_locations": len(locations),
             "unique_countries": len(countries),
             "unique_cities": len(cities),
             "most_photographed_locations": dict(locations.most_common(10)),
-            "countries_visited": dict(countries.most_common()),
+            "countries_visited": dict(countries.most_common(DISTRIBUTION_TOP_K)),
             "cities_visited": dict(cities.most_common(10)),
         }
 
-    def _analyze_shooting_patterns(self, photos_metadata: list[dict[str, Any]]) -> dict[str, Any]:
+    def _analyze_shooting_patterns(self, columns: LibraryColumns) -> dict[str, Any]:
         """Analyze shooting patterns over time"""
-        photos_by_month = defaultdict(int)
-        photos_by_hour = defaultdict(int)
-        photos_by_weekday = defaultdict(int)
-
-        for photo in photos_metadata:
-            date = self._get_photo_date(photo)
-            if date:
-                month_key = date.strftime("%Y-%m")
-                photos_by_month[month_key] += 1
-                photos_by_hour[date.hour] += 1
-                photos_by_weekday[date.strftime("%A")] += 1
+        photos_by_month = {}
+        photos_by_hour = {}
+        photos_by_weekday = {}
+        most_active_month = most_active_hour = most_active_weekday = None
+
+        dates = columns.dates
+        if dates:
+            # Wall-clock seconds since the epoch; aware datetimes keep their own local time like strftime does
+            seconds = np.fromiter(
+                (
+                    ((date if date.tzinfo is None else date.replace(tzinfo=None)) - _EPOCH) // _ONE_SECOND
+                    for date in dates
+                ),
+                dtype=np.int64,
+                count=len(dates),
+            )
+            days = seconds // 86400
+            # Months since 1970-01 as plain integers, so buckets come back sorted without a string sort
+            months = days.astype("datetime64[D]").astype("datetime64[M]").astype(np.int64)
+            hours = seconds // 3600 % 24
+            weekdays = (days + 3) % 7  # 1970-01-01 was a Thursday (Monday == 0)
+
+            month_values, month_first, month_counts = _bin_counts(months)
+            month_keys = [f"{1970 + month // 12}-{month % 12 + 1:02d}" for month in month_values.tolist()]
+            photos_by_month = dict(zip(month_keys, month_counts.tolist(), strict=True))
+            i = self._most_active_index(month_first, month_counts)
+            most_active_month = (month_keys[i], int(month_counts[i]))
+
+            hour_values, hour_first, hour_counts = _bin_counts(hours)
+            photos_by_hour = dict(zip(hour_values.tolist(), hour_counts.tolist(), strict=True))
+            i = self._most_active_index(hour_first, hour_counts)
+            most_active_hour = (int(hour_values[i]), int(hour_counts[i]))
+
+            # Weekdays are listed in first-seen order
+            weekday_values, weekday_first, weekday_counts = _bin_counts(weekdays)
+            for i in np.argsort(weekday_first).tolist():
+                photos_by_weekday[calendar.day_name[weekday_values[i]]] = int(weekday_counts[i])
+            i = self._most_active_index(weekday_first, weekday_counts)
+            most_active_weekday = (calendar.day_name[weekday_values[i]], int(weekday_counts[i]))
 
         return {
-            "photos_by_month": dict(sorted(photos_by_month.items())),
-            "photos_by_hour": dict(sorted(photos_by_hour.items())),
-            "photos_by_weekday": dict(photos_by_weekday),
-            "most_active_month": (max(photos_by_month.items(), key=lambda x: x[1]) if photos_by_month else None),
-            "most_active_hour": (max(photos_by_hour.items(), key=lambda x: x[1]) if photos_by_hour else None),
-            "most_active_weekday": (max(photos_by_weekday.items(), key=lambda x: x[1]) if photos_by_weekday else None),
+            "photos_by_month": photos_by_month,
+            "photos_by_hour": photos_by_hour,
+            "photos_by_weekday": photos_by_weekday,
+            "most_active_month": most_active_month,
+            "most_active_hour": most_active_hour,
+            "most_active_weekday": most_active_weekday,
         }
 
+    @staticmethod
+    def _most_active_index(first_index: np.ndarray, counts: np.ndarray) -> int:
+        """Index of the largest bucket, breaking ties by first appearance like max() over a counting dict"""
+        return int(np.lexsort((first_index, -counts))[0])
+
     def _analyze_quality_metrics(self, photos_metadata: list[dict[str, Any]]) -> dict[str, Any]:
         """Analyze image quality metrics"""
         # This is a placeholder for quality analysis
@@ -283,15 +669,27 @@ class StatisticsGenerator:
         }
 
     def _get_photo_date(self, photo: dict[str, Any]) -> datetime | None:
-        """Extract photo date from metadata"""
-        date_fields = [
-            "datetime_original",
-            "datetime_digitized",
-            "datetime",
-            "file_modified",
-        ]
-
-        for field in date_fields:
+        """Extract photo date from metadata, memoizing the result on the metadata dict"""
+        cached = photo.get(_PHOTO_DATE_KEY, _SENTINEL)
+        if cached is not _SENTINEL:
+            return cached
+
+        date = self._parse_photo_date(photo)
+        photo[_PHOTO_DATE_KEY] = date
+        return date
+
+    def _parse_photo_date(self, photo: dict[str, Any]) -> datetime | None:
+        """Parse photo date from the first usable date field"""
+        # Fast path: nearly all EXIF data carries datetime_original as a datetime or ISO string
+        try:
+            value = photo["datetime_original"]
+            if value.__class__ is datetime:
+                return value
+            return datetime.fromisoformat(value)
+        except (KeyError, TypeError, ValueError):
+            pass
+
+        for field in _DATE_FIELDS:
             if field in photo and photo[field]:
                 if isinstance(photo[field], datetime):
                     return photo[field]
@@ -340,7 +738,7 @@ class StatisticsGenerator:
             camera_table.add_column("Photos", justify="right", style="green")
             camera_table.add_column("Percentage", justify="right", style="yellow")
 
-            for camera, count in list(camera_stats["camera_distribution"].items())[:5]:
+            for camera, count in islice(camera_stats["camera_distribution"].items(), 5):
                 percentage = (count / stats["total_photos"]) * 100
                 camera_table.add_row(camera, str(count), f"{percentage:.1f}%")
 
@@ -381,7 +779,7 @@ class StatisticsGenerator:
                 shutter = tech_stats["shutter_speed"]
                 tech_table.add_row(
                     "Shutter Speed",
-                    f"1/{int(1/shutter['fastest'])}",
+                    f"1/{int(1 / shutter['fastest'])}",
                     f"{shutter['slowest']:.3f}s",
                     f"{shutter['avg']:.3f}s",
                 )
@@ -418,136 +816,52 @@ class StatisticsGenerator:
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
 
-        charts_created = []
+        jobs = [(renderer, stats[section]) for section, renderer in _CHART_RENDERERS.items() if section in stats]
+        if not jobs:
+            return []
 
         try:
-            # Shooting patterns chart
-            if "shooting_patterns" in stats:
-                chart_path = self._create_shooting_patterns_chart(stats["shooting_patterns"], output_path)
-                if chart_path:
-                    charts_created.append(chart_path)
-
-            # Camera usage chart
-            if "cameras" in stats:
-                chart_path = self._create_camera_usage_chart(stats["cameras"], output_path)
-                if chart_path:
-                    charts_created.append(chart_path)
-
-            # Technical settings chart
-            if "technical_settings" in stats:
-                chart_path = self._create_technical_settings_chart(stats["technical_settings"], output_path)
-                if chart_path:
-                    charts_created.append(chart_path)
-
+            chart_paths = self._render_charts(jobs, output_path)
         except Exception as e:
             logger.error(f"Error generating charts: {e}")
+            return []
 
-        return charts_created
+        return [chart_path for chart_path in chart_paths if chart_path]
+
+    def _render_charts(self, jobs: list[tuple[Callable, dict[str, Any]]], output_path: Path) -> list[str | None]:
+        """Render charts in parallel worker processes, falling back to in-process rendering.
+
+        The worker pool is created on first use and kept for later calls: each worker keeps its own
+        _CHART_FIGURES, so a pool per call would throw the cached Figures away every time.
+        """
+        max_workers = min(len(_CHART_RENDERERS), os.process_cpu_count() or 1)
+        if len(jobs) > 1 and max_workers > 1:
+            try:
+                if self._chart_executor is None:
+                    self._chart_executor = ProcessPoolExecutor(max_workers=max_workers)
+                    # Stop the workers with the generator, or at exit before interpreter teardown
+                    weakref.finalize(self, self._chart_executor.shutdown, wait=False, cancel_futures=True)
+                futures = [
+                    self._chart_executor.submit(renderer, section_stats, output_path, self.chart_dpi)
+                    for renderer, section_stats in jobs
+                ]
+                return [future.result() for future in futures]
+            except (OSError, BrokenProcessPool) as e:
+                logger.debug(f"Parallel chart rendering unavailable, rendering in-process: {e}")
+                if self._chart_executor is not None:
+                    self._chart_executor.shutdown(wait=False, cancel_futures=True)
+                    self._chart_executor = None
+
+        return [renderer(section_stats, output_path, self.chart_dpi) for renderer, section_stats in jobs]
 
     def _create_shooting_patterns_chart(self, patterns: dict[str, Any], output_path: Path) -> str | None:
         """Create shooting patterns chart"""
-        try:
-            fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 10))
-
-            # Photos by hour
-            if "photos_by_hour" in patterns:
-                hours = list(patterns["photos_by_hour"].keys())
-                counts = list(patterns["photos_by_hour"].values())
-
-                ax1.bar(hours, counts, color="skyblue", alpha=0.7)
-                ax1.set_title("Photos by Hour of Day")
-                ax1.set_xlabel("Hour")
-                ax1.set_ylabel("Number of Photos")
-                ax1.set_xticks(range(0, 24, 2))
-
-            # Photos by month
-            if "photos_by_month" in patterns:
-                months = list(patterns["photos_by_month"].keys())
-                counts = list(patterns["photos_by_month"].values())
-
-                ax2.plot(months, counts, marker="o", color="orange")
-                ax2.set_title("Photos by Month")
-                ax2.set_xlabel("Month")
-                ax2.set_ylabel("Number of Photos")
-                ax2.tick_params(axis="x", rotation=45)
-
-            plt.tight_layout()
-            chart_path = output_path / "shooting_patterns.png"
-            plt.savefig(chart_path, dpi=300, bbox_inches="tight")
-            plt.close()
-
-            return str(chart_path)
-
-        except Exception as e:
-            logger.error(f"Error creating shooting patterns chart: {e}")
-            return None
+        return _render_shooting_patterns_chart(patterns, output_path, self.chart_dpi)
 
     def _create_camera_usage_chart(self, camera_stats: dict[str, Any], output_path: Path) -> str | None:
         """Create camera usage pie chart"""
-        try:
-            if not camera_stats.get("camera_distribution"):
-                return None
-
-            cameras = list(camera_stats["camera_distribution"].keys())[:5]  # Top 5
-            counts = list(camera_stats["camera_distribution"].values())[:5]
-
-            plt.figure(figsize=(10, 8))
-            plt.pie(counts, labels=cameras, autopct="%1.1f%%", startangle=90)
-            plt.title("Camera Usage Distribution")
-            plt.axis("equal")
-
-            chart_path = output_path / "camera_usage.png"
-            plt.savefig(chart_path, dpi=300, bbox_inches="tight")
-            plt.close()
-
-            return str(chart_path)
-
-        except Exception as e:
-            logger.error(f"Error creating camera usage chart: {e}")
-            return None
+        return _render_camera_usage_chart(camera_stats, output_path, self.chart_dpi)
 
     def _create_technical_settings_chart(self, tech_stats: dict[str, Any], output_path: Path) -> str | None:
         """Create technical settings distribution chart"""
-        try:
-            fig, axes = plt.subplots(1, 3, figsize=(18, 6))
-
-            # ISO distribution
-            if "iso" in tech_stats and "distribution" in tech_stats["iso"]:
-                iso_data = tech_stats["iso"]["distribution"]
-                isos = list(iso_data.keys())[:10]
-                counts = list(iso_data.values())[:10]
-
-                axes[0].bar(range(len(isos)), counts, color="lightcoral")
-                axes[0].set_title("ISO Distribution")
-                axes[0].set_xlabel("ISO")
-                axes[0].set_ylabel("Count")
-                axes[0].set_xticks(range(len(isos)))
-                axes[0].set_xticklabels(isos, rotation=45)
-
-            # Aperture distribution
-            if "aperture" in tech_stats and "distribution" in tech_stats["aperture"]:
-                aperture_data = tech_stats["aperture"]["distribution"]
-                apertures = list(aperture_data.keys())[:10]
-                counts = list(aperture_data.values())[:10]
-
-                axes[1].bar(range(len(apertures)), counts, color="lightgreen")
-                axes[1].set_title("Aperture Distribution")
-                axes[1].set_xlabel("f-stop")
-                axes[1].set_ylabel("Count")
-                axes[1].set_xticks(range(len(apertures)))
-                axes[1].set_xticklabels([f"f/{a}" for a in apertures], rotation=45)
-
-            # Placeholder for third chart
-            axes[2].text(0.5, 0.5, "Additional\nMetrics", ha="center", va="center", fontsize=16)
-            axes[2].set_title("Future Metrics")
-
-            plt.tight_layout()
-            chart_path = output_path / "technical_settings.png"
-            plt.savefig(chart_path, dpi=300, bbox_inches="tight")
-            plt.close()
-
-            return str(chart_path)
-
-        except Exception as e:
-            logger.error(f"Error creating technical settings chart: {e}")
-            return None
+        return _render_technical_settings_chart(tech_stats, output_path, self.chart_dpi)
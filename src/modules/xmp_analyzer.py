@@ -2,21 +2,250 @@
 XMP Library Analyzer - Generate comprehensive reports from XMP sidecar files
 """
 
+import io
 import json
+import logging
+import math
+import mmap
+import os
 import re
+import sys
 import xml.etree.ElementTree as ET
-from collections import Counter
-from dataclasses import asdict, dataclass
+from bisect import bisect_right
+from collections import Counter, defaultdict
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import closing
+from dataclasses import dataclass, fields
 from datetime import datetime
+from functools import partial
+from itertools import chain, islice
+from operator import attrgetter
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO, TextIO
 
-from rich.console import Console
+import numpy as np
+from rich.console import Console, Group
 from rich.progress import Progress
 from rich.table import Table
 
-
-@dataclass
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Upper bounds (exclusive, mm) of the focal length ranges below
+_FOCAL_RANGE_BOUNDS = (20, 35, 85, 200)
+_FOCAL_RANGE_LABELS = (
+    "Ultra-wide (< 20mm)",
+    "Wide (20-35mm)",
+    "Standard (35-85mm)",
+    "Telephoto (85-200mm)",
+    "Super-telephoto (> 200mm)",
+)
+_ASCII_DIGITS = "0123456789"
+# First number in a focal length string that does not start with one; patterns are compiled here, once
+_FOCAL_RE = re.compile(r"(\d+(?:\.\d+)?)")
+
+# Columns whose non-empty values are counted for the distributions
+_COUNTED_FIELDS = (
+    "lens_model",
+    "focal_length",
+    "f_number",
+    "iso",
+    "exposure_time",
+    "bit_depth",
+    "color_space",
+    "video_codec",
+    "video_framerate",
+    "audio_codec",
+    "software",
+    "artist",
+)
+# Columns counted together as value pairs, under the name of the pair
+_COUNTED_PAIRS = {
+    "camera": ("camera_make", "camera_model"),
+    "location": ("location_city", "location_country"),
+    "gps": ("gps_latitude", "gps_longitude"),
+    "resolution": ("width", "height"),
+}
+
+# Proleptic Gregorian ordinal of 1970-01-01, day zero of numpy's datetime64[D]
+_UNIX_EPOCH_ORDINAL = datetime(1970, 1, 1).toordinal()
+
+# Media file extensions an XMP sidecar may belong to, in lookup order
+MEDIA_EXTENSIONS = (
+    ".jpg",
+    ".jpeg",
+    ".tiff",
+    ".tif",
+    ".png",
+    ".heic",
+    ".heif",
+    ".nef",
+    ".cr2",
+    ".cr3",
+    ".arw",
+    ".orf",
+    ".dng",
+    ".raf",
+    ".rw2",
+    ".mp4",
+    ".mov",
+    ".avi",
+    ".mkv",
+    ".webm",
+    ".mxf",
+    ".r3d",
+    ".braw",
+)
+
+# XMP namespace mappings
+XMP_NAMESPACES = {
+    "x": "adobe:ns:meta/",
+    "rdf": "http://www.w3.org/1999/02/22-rdf-syntax-ns#",
+    "dc": "http://purl.org/dc/elements/1.1/",
+    "exif": "http://ns.adobe.com/exif/1.0/",
+    "tiff": "http://ns.adobe.com/tiff/1.0/",
+    "xmp": "http://ns.adobe.com/xap/1.0/",
+    "aux": "http://ns.adobe.com/exif/1.0/aux/",
+    "crs": "http://ns.adobe.com/camera-raw-settings/1.0/",
+    "photoshop": "http://ns.adobe.com/photoshop/1.0/",
+    "lr": "http://ns.adobe.com/lightroom/1.0/",
+    "xmpMM": "http://ns.adobe.com/xap/1.0/mm/",
+}
+
+# Entries kept in the free-text distributions (cameras, lenses, places, software, ...); the full
+# unique counts are reported alongside
+DISTRIBUTION_TOP_K = 50
+
+# Title, header style and (header, style, justify) columns of each analysis table
+_TABLE_SPECS = {
+    "summary": (
+        "📊 Library Summary",
+        "bold cyan",
+        (
+            ("Metric", "bold", "left"),
+            ("Value", "green", "right"),
+        ),
+    ),
+    "cameras": (
+        "📸 Camera Usage",
+        "bold magenta",
+        (
+            ("Camera", "cyan", "left"),
+            ("Photos", "green", "right"),
+            ("Percentage", "yellow", "right"),
+        ),
+    ),
+    "lenses": (
+        "🔍 Lens Usage",
+        "bold blue",
+        (
+            ("Lens", "cyan", "left"),
+            ("Photos", "green", "right"),
+        ),
+    ),
+    "focal_lengths": (
+        "📏 Focal Length Distribution",
+        "bold blue",
+        (
+            ("Range", "cyan", "left"),
+            ("Photos", "green", "right"),
+        ),
+    ),
+    "locations": (
+        "🗺️  Location Distribution",
+        "bold green",
+        (
+            ("Country", "cyan", "left"),
+            ("Photos", "green", "right"),
+        ),
+    ),
+    "exposure": (
+        "📷 Exposure Settings",
+        "bold yellow",
+        (
+            ("Setting", "bold", "left"),
+            ("Most Used Value", "cyan", "left"),
+            ("Count", "green", "right"),
+        ),
+    ),
+    "temporal": (
+        "📅 Temporal Patterns",
+        "bold purple",
+        (
+            ("Period", "bold", "left"),
+            ("Most Active", "cyan", "left"),
+            ("Count", "green", "right"),
+        ),
+    ),
+    "technical": (
+        "⚙️  Technical Specifications",
+        "bold red",
+        (
+            ("Metric", "bold", "left"),
+            ("Value", "cyan", "left"),
+        ),
+    ),
+    "video": (
+        "🎬 Video Content",
+        "bold cyan",
+        (
+            ("Metric", "bold", "left"),
+            ("Value", "cyan", "left"),
+        ),
+    ),
+}
+
+# Fixed metric rows per table: (label, str.format template over the section's values)
+_ROW_SPECS = {
+    "summary": (
+        ("Total Files", "{total_files}"),
+        ("XMP Files Found", "{xmp_files_found}"),
+        ("Image Files", "{image_files}"),
+        ("Video Files", "{video_files}"),
+        ("Files with GPS", "{photos_with_gps}"),
+        ("GPS Coverage", "{gps_coverage_percentage:.1f}%"),
+        ("Location Coverage", "{location_coverage_percentage:.1f}%"),
+    ),
+    "technical": (
+        ("Average File Size", "{average_file_size_mb:.1f} MB"),
+        ("Total Library Size", "{total_library_size_gb:.1f} GB"),
+        ("Largest File", "{largest_file_size_mb:.1f} MB"),
+    ),
+    "video": (
+        ("Total Video Duration", "{total_video_duration_hours:.1f} hours"),
+        ("Average Video Length", "{average_video_length_seconds:.1f} seconds"),
+    ),
+}
+
+# Parsed sidecars between progress bar updates; the bar redraws on its own timer regardless
+PROGRESS_UPDATE_INTERVAL = 256
+
+# Default directories never searched for sidecars: version control, caches and thumbnail stores
+SKIP_DIRS = frozenset({".git", ".cache", "node_modules", "@eaDir"})
+# Default suffixes of Lightroom preview and catalog data directories, which can hold huge nested trees
+SKIP_SUFFIXES = (".lrdata", ".lrcat-data")
+
+# Bytes fed to the XML parser at a time; typical sidecars fit in a single chunk
+XMP_READ_CHUNK_SIZE = 64 * 1024
+# Sidecars at least this large (e.g. with embedded edit history) are memory-mapped instead of read;
+# for typical few-KiB files the extra mapping syscalls cost more than the copy they save
+XMP_MMAP_MIN_SIZE = 1024 * 1024
+
+# Libraries with at least this many sidecars are parsed in worker processes
+PARALLEL_PARSE_MIN_FILES = 1_000
+# Sidecars handed to a worker process per task
+PARSE_BATCH_SIZE = 64
+
+
+@dataclass(slots=True)
 class PhotoMetadata:
     """Structured photo metadata from XMP"""
 
@@ -53,30 +282,315 @@ class PhotoMetadata:
             self.keywords = []
 
 
+def _clark_tag(name: str) -> str:
+    """Convert a "prefix:local" name to the "{uri}local" form used as ElementTree tags"""
+    prefix, local = name.split(":", 1)
+    return f"{{{XMP_NAMESPACES[prefix]}}}{local}"
+
+
+# XMP properties each metadata field is read from, in order of preference
+_FIELD_PROPERTIES = {
+    "camera_make": ("tiff:Make", "exif:Make", "aux:Make"),
+    "camera_model": ("tiff:Model", "exif:Model", "aux:Model"),
+    "lens_model": ("aux:LensModel", "exif:LensModel", "aux:Lens", "exif:LensInfo"),
+    "focal_length": ("exif:FocalLength",),
+    "f_number": ("exif:FNumber",),
+    "iso": ("exif:ISOSpeedRatings", "exif:ISO", "aux:ISO"),
+    "exposure_time": ("exif:ExposureTime",),
+    "datetime_original": ("exif:DateTimeOriginal", "xmp:CreateDate", "xmp:ModifyDate"),
+    "gps_latitude": ("exif:GPSLatitude", "aux:GPSLatitude"),
+    "gps_longitude": ("exif:GPSLongitude", "aux:GPSLongitude"),
+    "location_city": ("photoshop:City",),
+    "location_country": ("photoshop:Country",),
+    "width": ("tiff:ImageWidth",),
+    "height": ("tiff:ImageLength",),
+    "bit_depth": ("tiff:BitsPerSample",),
+    "color_space": ("exif:ColorSpace",),
+    "video_codec": ("aux:VideoCodec",),
+    "video_framerate": ("aux:VideoFrameRate",),
+    "video_duration": ("aux:Duration",),
+    "audio_codec": ("aux:AudioCodec",),
+    "software": ("tiff:Software",),
+    "artist": ("dc:creator", "photoshop:AuthorsPosition", "tiff:Artist"),
+    "copyright": ("dc:rights",),
+}
+# Clark-notation tag ("{uri}local") of each candidate property -> (field, preference rank)
+_TAG2FIELD = {
+    _clark_tag(name): (field, rank) for field, names in _FIELD_PROPERTIES.items() for rank, name in enumerate(names)
+}
+# Low-cardinality fields, interned so that every photo with the same value shares one string
+_INTERNED_FIELDS = frozenset(
+    {
+        "camera_make",
+        "camera_model",
+        "lens_model",
+        "software",
+        "artist",
+        "copyright",
+        "location_city",
+        "location_country",
+        "color_space",
+        "bit_depth",
+        "video_codec",
+        "audio_codec",
+        "video_framerate",
+        "f_number",
+        "iso",
+    }
+)
+
+# Structural tags read while streaming
+_Q = {
+    name: _clark_tag(name)
+    for name in ("dc:creator", "dc:rights", "dc:subject", "rdf:Seq", "rdf:Alt", "rdf:Bag", "rdf:li")
+}
+_RDF_LIST_TAGS = frozenset(_Q[name] for name in ("rdf:Seq", "rdf:Alt", "rdf:Bag", "rdf:li"))
+# Properties whose value is the first item of an RDF list
+_LIST_ITEM_PATHS = {
+    _Q["dc:creator"]: f"{_Q['rdf:Seq']}/{_Q['rdf:li']}",
+    _Q["dc:rights"]: f"{_Q['rdf:Alt']}/{_Q['rdf:li']}",
+}
+
+
+def _parse_xmp_file(xmp_path: Path, media_file: Path | None) -> PhotoMetadata:
+    """Parse an XMP file and extract metadata"""
+    try:
+        # Get associated media file info
+        file_size = 0
+        if media_file is not None:
+            try:
+                file_size = media_file.stat().st_size
+            except OSError:
+                pass
+
+        metadata = PhotoMetadata(
+            file_path=str(media_file) if media_file else str(xmp_path),
+            file_size=file_size,
+        )
+
+        try:
+            values, keywords = _read_sidecar_properties(xmp_path)
+        except ET.ParseError:
+            # Fix unescaped ampersands (common in tool names) and parse again
+            with open(xmp_path, encoding="utf-8") as f:
+                content = f.read().replace(" & ", " &amp; ")
+            values, keywords = _read_properties(_stream_chunks(io.StringIO(content)))
+
+        for field, (_, text) in values.items():
+            text = text.strip()
+            setattr(metadata, field, sys.intern(text) if field in _INTERNED_FIELDS else text)
+        if keywords is not None:
+            metadata.keywords = keywords
+
+        return metadata
+
+    except Exception as e:
+        raise Exception(f"Failed to parse XMP file: {e}") from e
+
+
+def _stream_chunks(stream: BinaryIO | TextIO) -> Iterator[bytes | str]:
+    """Read a stream in chunks of XMP_READ_CHUNK_SIZE"""
+    return iter(partial(stream.read, XMP_READ_CHUNK_SIZE), stream.read(0))
+
+
+def _read_sidecar_properties(xmp_path: Path) -> tuple[dict[str, tuple[int, str]], list[str] | None]:
+    """Read the properties of a sidecar, through a read-only memory map when the file is large"""
+    with open(xmp_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < XMP_MMAP_MIN_SIZE:
+            return _read_properties(_stream_chunks(f))
+
+        with (
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+            memoryview(mapped) as view,
+            closing(_view_chunks(view)) as chunks,
+        ):
+            return _read_properties(chunks)
+
+
+def _view_chunks(view: memoryview) -> Iterator[memoryview]:
+    """Slice a view into chunks without copying, releasing each one once it has been consumed"""
+    for start in range(0, len(view), XMP_READ_CHUNK_SIZE):
+        with view[start : start + XMP_READ_CHUNK_SIZE] as chunk:
+            yield chunk
+
+
+def _read_properties(chunks: Iterable[bytes | str | memoryview]) -> tuple[dict[str, tuple[int, str]], list[str] | None]:
+    """Parse an XMP document, returning the (rank, text) chosen for each metadata field and the keywords.
+
+    Only the first element of each tag counts, and a field takes the text of its most preferred
+    property that has any. The document is fed to the parser chunk by chunk and every element is
+    cleared once it has been read, so the parsed tree is never held in memory as a whole.
+    dc:creator and dc:rights map to the text of their first list item.
+    """
+    values: dict[str, tuple[int, str]] = {}
+    seen: set[str] = set()
+    keywords = None
+    subject_tag = _Q["dc:subject"]
+    parser = ET.XMLPullParser(events=("end",))
+    for chunk in chunks:
+        parser.feed(chunk)
+        for _, elem in parser.read_events():
+            tag = elem.tag
+            if tag in _RDF_LIST_TAGS:
+                continue  # read and cleared together with the property that contains them
+            if tag not in seen:
+                text = None
+                if tag in _LIST_ITEM_PATHS:
+                    item = elem.find(_LIST_ITEM_PATHS[tag])
+                    if item is not None:
+                        seen.add(tag)
+                        text = item.text
+                elif tag == subject_tag:
+                    bag = elem.find(_Q["rdf:Bag"])
+                    if keywords is None and bag is not None:
+                        keywords = [li.text.strip() for li in bag.iter(_Q["rdf:li"]) if li.text]
+                else:
+                    seen.add(tag)
+                    text = elem.text
+                if text and tag in _TAG2FIELD:
+                    field, rank = _TAG2FIELD[tag]
+                    current = values.get(field)
+                    if current is None or rank < current[0]:
+                        values[field] = (rank, text)
+            elem.clear()
+    parser.close()
+    return values, keywords
+
+
+def _index_names(names: list[str]) -> dict[str, str]:
+    """Map each file name, and its lowercase form, to the name on disk; exact names take precedence"""
+    index = {name: name for name in names}
+    for name in names:
+        index.setdefault(name.lower(), name)
+    return index
+
+
+def _list_directory(directory: str) -> dict[str, str]:
+    """Index the names of the non-directory entries in a directory, empty if it cannot be read"""
+    try:
+        with os.scandir(directory) as entries:
+            return _index_names([entry.name for entry in entries if not entry.is_dir(follow_symlinks=False)])
+    except OSError:
+        return {}
+
+
+def _find_associated_media_file(xmp_path: Path, names: dict[str, str]) -> Path | None:
+    """Find the media file associated with an XMP sidecar among the indexed names of its directory"""
+    base_name = xmp_path.stem
+    for ext in MEDIA_EXTENSIONS:
+        candidate = f"{base_name}{ext}"
+        name = names.get(candidate) or names.get(candidate.lower())
+        if name is not None:
+            return xmp_path.with_name(name)
+
+    return None
+
+
+def _focal_length_mm(text: str) -> float | None:
+    """Numeric focal length of strings such as "35/1" or "24.0 mm": the first number in the text"""
+    rest = text.lstrip(_ASCII_DIGITS)
+    end = len(text) - len(rest)
+    if end and rest[:1] == ".":
+        fraction = rest[1:].lstrip(_ASCII_DIGITS)
+        if len(fraction) < len(rest) - 1:
+            end = len(text) - len(fraction)
+    if end and text.isascii():
+        return float(text[:end])
+
+    # Text that does not start with a plain number
+    focal_match = _FOCAL_RE.search(text)
+    return float(focal_match.group(1)) if focal_match else None
+
+
+def _parse_float(text: str) -> float:
+    """Float value of numeric XMP text, NaN when the text is not a number"""
+    try:
+        return float(text)
+    except ValueError:
+        return math.nan
+
+
+def _ranked_counts(values: np.ndarray) -> dict[int, int]:
+    """Count each distinct value, ordered like Counter.most_common(): by count, ties by first occurrence"""
+    distinct, first_index, counts = np.unique(values, return_index=True, return_counts=True)
+    order = np.lexsort((first_index, -counts))
+    return dict(zip(distinct[order].tolist(), counts[order].tolist(), strict=True))
+
+
+def _dump_json(report: dict[str, Any]) -> bytes:
+    """Serialize a report as indented JSON, with orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            report, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
+    return json.dumps(report, indent=2, default=str).encode()
+
+
+def _make_table(spec_key: str) -> Table:
+    """Build an empty analysis table from its spec in _TABLE_SPECS"""
+    title, header_style, columns = _TABLE_SPECS[spec_key]
+    table = Table(title=title, show_header=True, header_style=header_style)
+    for header, style, justify in columns:
+        table.add_column(header, style=style, justify=justify)
+    return table
+
+
+def _count_rows(distribution: dict[str, int], limit: int | None = None) -> list[tuple[str, str]]:
+    """Pre-formatted (name, count) rows for the first limit entries of a distribution"""
+    return [(name, str(count)) for name, count in islice(distribution.items(), limit)]
+
+
+def _add_rows(table: Table, rows: Iterable[tuple[str, ...]]) -> None:
+    """Add pre-formatted rows to a table"""
+    for row in rows:
+        table.add_row(*row)
+
+
+def _add_spec_rows(table: Table, spec_key: str, values: dict[str, Any]) -> None:
+    """Add the fixed rows from _ROW_SPECS, treating missing values as 0"""
+    values = defaultdict(int, values)
+    for label, template in _ROW_SPECS[spec_key]:
+        table.add_row(label, template.format_map(values))
+
+
+def _intern_fields(metadata: PhotoMetadata) -> None:
+    """Intern the low-cardinality string fields of a PhotoMetadata in this process"""
+    for field in _INTERNED_FIELDS:
+        setattr(metadata, field, sys.intern(getattr(metadata, field)))
+
+
+def _parse_xmp_task(xmp_path: Path, media_file: Path | None) -> tuple[PhotoMetadata | None, str | None]:
+    """Parse one sidecar in a worker, returning (metadata, None) or (None, error message)"""
+    try:
+        return _parse_xmp_file(xmp_path, media_file), None
+    except Exception as e:
+        return None, str(e)
+
+
 class XMPAnalyzer:
     """Analyzes photo libraries using XMP sidecar files"""
 
-    def __init__(self, console: Console | None = None):
+    def __init__(
+        self,
+        console: Console | None = None,
+        skip_dirs: Iterable[str] | None = None,
+        skip_suffixes: Iterable[str] | None = None,
+    ):
         self.console = console or Console()
+        # Directory names and name suffixes the sidecar search does not descend into
+        self.skip_dirs = frozenset(SKIP_DIRS if skip_dirs is None else skip_dirs)
+        self.skip_suffixes = tuple(
+            os.path.normcase(suffix) for suffix in (SKIP_SUFFIXES if skip_suffixes is None else skip_suffixes)
+        )
         self.photos: list[PhotoMetadata] = []
         self.total_files_processed = 0
         self.xmp_files_found = 0
         self.errors: list[tuple[str, str]] = []
+        # File names of each scanned directory, indexed by _index_names
+        self._directory_names: dict[str, dict[str, str]] = {}
 
         # XMP namespace mappings
-        self.namespaces = {
-            "x": "adobe:ns:meta/",
-            "rdf": "http://www.w3.org/1999/02/22-rdf-syntax-ns#",
-            "dc": "http://purl.org/dc/elements/1.1/",
-            "exif": "http://ns.adobe.com/exif/1.0/",
-            "tiff": "http://ns.adobe.com/tiff/1.0/",
-            "xmp": "http://ns.adobe.com/xap/1.0/",
-            "aux": "http://ns.adobe.com/exif/1.0/aux/",
-            "crs": "http://ns.adobe.com/camera-raw-settings/1.0/",
-            "photoshop": "http://ns.adobe.com/photoshop/1.0/",
-            "lr": "http://ns.adobe.com/lightroom/1.0/",
-            "xmpMM": "http://ns.adobe.com/xap/1.0/mm/",
-        }
+        self.namespaces = dict(XMP_NAMESPACES)
 
     def analyze_library(self, root_directory: str, output_dir: str | None = None) -> dict[str, Any]:
         """
@@ -108,19 +622,26 @@ class XMPAnalyzer:
         with Progress() as progress:
             task = progress.add_task("[cyan]Processing XMP files...", total=len(xmp_files))
 
-            for xmp_file in xmp_files:
-                try:
-                    metadata = self._parse_xmp_file(xmp_file)
+            media_files = [self._find_associated_media_file(xmp_file) for xmp_file in xmp_files]
+            results = self._parse_xmp_files(xmp_files, media_files)
+            pending = 0
+            for xmp_file, (metadata, error) in zip(xmp_files, results, strict=True):
+                if error is None:
                     if metadata:
                         self.photos.append(metadata)
                     self.total_files_processed += 1
-                except Exception as e:
-                    self.errors.append((str(xmp_file), str(e)))
+                else:
+                    self.errors.append((str(xmp_file), error))
                     # Debug: print errors to console for troubleshooting
                     if self.console:
-                        self.console.print(f"[yellow]Error parsing {xmp_file.name}: {e}[/yellow]")
+                        self.console.print(f"[yellow]Error parsing {xmp_file.name}: {error}[/yellow]")
+
+                pending += 1
+                if pending == PROGRESS_UPDATE_INTERVAL:
+                    progress.update(task, advance=pending)
+                    pending = 0
 
-                progress.update(task, advance=1)
+            progress.update(task, advance=pending)
 
         self.xmp_files_found = len(xmp_files)
 
@@ -134,291 +655,116 @@ class XMPAnalyzer:
         return analysis
 
     def _find_xmp_files(self, root_path: Path) -> list[Path]:
-        """Find all XMP files in the directory tree"""
+        """Find all XMP files in the directory tree, indexing each directory's file names for media lookups.
+
+        Directories named in skip_dirs or ending with one of skip_suffixes are not descended into.
+        """
+        self._directory_names = {}
+        skip_dirs = self.skip_dirs
+        skip_suffixes = self.skip_suffixes
         xmp_files = []
-        for path in root_path.rglob("*.xmp"):
-            xmp_files.append(path)
-        return sorted(xmp_files)
+        pending = [str(root_path)]
+        while pending:
+            directory = pending.pop()
+            names = []
+            xmp_count = len(xmp_files)
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in skip_dirs and not os.path.normcase(entry.name).endswith(skip_suffixes):
+                                pending.append(entry.path)
+                        else:
+                            names.append(entry.name)
+                            if os.path.normcase(entry.name).endswith(".xmp"):
+                                xmp_files.append(entry.path)
+            except OSError:
+                continue
+            if len(xmp_files) > xmp_count:
+                self._directory_names[str(Path(directory))] = _index_names(names)
+
+        # Same order as sorting Path objects, which compare component by component
+        xmp_files.sort(key=lambda path: os.path.normcase(path).split(os.sep))
+        return [Path(xmp_file) for xmp_file in xmp_files]
+
+    def _parse_xmp_files(
+        self, xmp_files: list[Path], media_files: list[Path | None]
+    ) -> Iterator[tuple[PhotoMetadata | None, str | None]]:
+        """Parse sidecars in order, in worker processes for large libraries and in-process otherwise"""
+        parsed = 0
+        max_workers = os.process_cpu_count() or 1
+        if len(xmp_files) >= PARALLEL_PARSE_MIN_FILES and max_workers > 1:
+            try:
+                with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                    for result in executor.map(_parse_xmp_task, xmp_files, media_files, chunksize=PARSE_BATCH_SIZE):
+                        # Unpickling gives each batch fresh string copies, so intern them here again
+                        if result[0] is not None:
+                            _intern_fields(result[0])
+                        yield result
+                        parsed += 1
+            except (OSError, BrokenProcessPool) as e:
+                logger.debug(f"Parallel XMP parsing unavailable, parsing in-process: {e}")
+
+        for xmp_file, media_file in zip(xmp_files[parsed:], media_files[parsed:], strict=True):
+            yield _parse_xmp_task(xmp_file, media_file)
 
     def _parse_xmp_file(self, xmp_path: Path) -> PhotoMetadata | None:
         """Parse an XMP file and extract metadata"""
-        try:
-            # Get associated media file info
-            media_file = self._find_associated_media_file(xmp_path)
-            file_size = media_file.stat().st_size if media_file and media_file.exists() else 0
-
-            # Read and fix common XML issues in XMP content
-            with open(xmp_path, encoding="utf-8") as f:
-                content = f.read()
-
-            # Fix unescaped ampersands (common in tool names)
-            content = content.replace(" & ", " &amp; ")
-
-            # Parse XMP content
-            root = ET.fromstring(content)
-
-            # Register namespaces
-            for prefix, uri in self.namespaces.items():
-                ET.register_namespace(prefix, uri)
-
-            metadata = PhotoMetadata(
-                file_path=str(media_file) if media_file else str(xmp_path),
-                file_size=file_size,
-            )
-
-            # Extract metadata from XMP
-            self._extract_camera_info(root, metadata)
-            self._extract_lens_info(root, metadata)
-            self._extract_exposure_info(root, metadata)
-            self._extract_datetime_info(root, metadata)
-            self._extract_gps_info(root, metadata)
-            self._extract_location_info(root, metadata)
-            self._extract_image_info(root, metadata)
-            self._extract_video_info(root, metadata)
-            self._extract_creator_info(root, metadata)
-            self._extract_keywords(root, metadata)
-
-            return metadata
-
-        except Exception as e:
-            raise Exception(f"Failed to parse XMP file: {e}") from e
+        return _parse_xmp_file(xmp_path, self._find_associated_media_file(xmp_path))
 
     def _find_associated_media_file(self, xmp_path: Path) -> Path | None:
         """Find the media file associated with an XMP sidecar"""
-        base_name = xmp_path.stem
-        parent_dir = xmp_path.parent
-
-        # Common media file extensions
-        media_extensions = [
-            ".jpg",
-            ".jpeg",
-            ".tiff",
-            ".tif",
-            ".png",
-            ".heic",
-            ".heif",
-            ".nef",
-            ".cr2",
-            ".cr3",
-            ".arw",
-            ".orf",
-            ".dng",
-            ".raf",
-            ".rw2",
-            ".mp4",
-            ".mov",
-            ".avi",
-            ".mkv",
-            ".webm",
-            ".mxf",
-            ".r3d",
-            ".braw",
-        ]
-
-        for ext in media_extensions:
-            media_file = parent_dir / f"{base_name}{ext}"
-            if media_file.exists():
-                return media_file
-
-        return None
-
-    def _extract_camera_info(self, root: ET.Element, metadata: PhotoMetadata):
-        """Extract camera information"""
-        # Try multiple XMP paths for camera info
-        camera_paths = [".//tiff:Make", ".//exif:Make", ".//aux:Make"]
-
-        model_paths = [".//tiff:Model", ".//exif:Model", ".//aux:Model"]
-
-        for path in camera_paths:
-            elem = root.find(path, self.namespaces)
-            if elem is not None and elem.text:
-                metadata.camera_make = elem.text.strip()
-                break
-
-        for path in model_paths:
-            elem = root.find(path, self.namespaces)
-            if elem is not None and elem.text:
-                metadata.camera_model = elem.text.strip()
-                break
-
-    def _extract_lens_info(self, root: ET.Element, metadata: PhotoMetadata):
-        """Extract lens information"""
-        lens_paths = [
-            ".//aux:LensModel",
-            ".//exif:LensModel",
-            ".//aux:Lens",
-            ".//exif:LensInfo",
-        ]
-
-        for path in lens_paths:
-            elem = root.find(path, self.namespaces)
-            if elem is not None and elem.text:
-                metadata.lens_model = elem.text.strip()
-                break
-
-    def _extract_exposure_info(self, root: ET.Element, metadata: PhotoMetadata):
-        """Extract exposure settings"""
-        # Focal length
-        focal_elem = root.find(".//exif:FocalLength", self.namespaces)
-        if focal_elem is not None and focal_elem.text:
-            metadata.focal_length = focal_elem.text.strip()
-
-        # F-number
-        f_elem = root.find(".//exif:FNumber", self.namespaces)
-        if f_elem is not None and f_elem.text:
-            metadata.f_number = f_elem.text.strip()
-
-        # ISO - try multiple field names
-        iso_paths = [".//exif:ISOSpeedRatings", ".//exif:ISO", ".//aux:ISO"]
-        for path in iso_paths:
-            iso_elem = root.find(path, self.namespaces)
-            if iso_elem is not None and iso_elem.text:
-                metadata.iso = iso_elem.text.strip()
-                break
-
-        # Exposure time
-        exposure_elem = root.find(".//exif:ExposureTime", self.namespaces)
-        if exposure_elem is not None and exposure_elem.text:
-            metadata.exposure_time = exposure_elem.text.strip()
-
-    def _extract_datetime_info(self, root: ET.Element, metadata: PhotoMetadata):
-        """Extract datetime information"""
-        datetime_paths = [
-            ".//exif:DateTimeOriginal",
-            ".//xmp:CreateDate",
-            ".//xmp:ModifyDate",
-        ]
-
-        for path in datetime_paths:
-            elem = root.find(path, self.namespaces)
-            if elem is not None and elem.text:
-                metadata.datetime_original = elem.text.strip()
-                break
-
-    def _extract_gps_info(self, root: ET.Element, metadata: PhotoMetadata):
-        """Extract GPS coordinates"""
-        # Try multiple GPS field formats
-        gps_lat_paths = [".//exif:GPSLatitude", ".//aux:GPSLatitude"]
-        gps_lon_paths = [".//exif:GPSLongitude", ".//aux:GPSLongitude"]
-
-        for path in gps_lat_paths:
-            lat_elem = root.find(path, self.namespaces)
-            if lat_elem is not None and lat_elem.text:
-                metadata.gps_latitude = lat_elem.text.strip()
-                break
-
-        for path in gps_lon_paths:
-            lon_elem = root.find(path, self.namespaces)
-            if lon_elem is not None and lon_elem.text:
-                metadata.gps_longitude = lon_elem.text.strip()
-                break
-
-    def _extract_location_info(self, root: ET.Element, metadata: PhotoMetadata):
-        """Extract location information"""
-        city_elem = root.find(".//photoshop:City", self.namespaces)
-        if city_elem is not None and city_elem.text:
-            metadata.location_city = city_elem.text.strip()
-
-        country_elem = root.find(".//photoshop:Country", self.namespaces)
-        if country_elem is not None and country_elem.text:
-            metadata.location_country = country_elem.text.strip()
-
-    def _extract_image_info(self, root: ET.Element, metadata: PhotoMetadata):
-        """Extract image technical information"""
-        width_elem = root.find(".//tiff:ImageWidth", self.namespaces)
-        if width_elem is not None and width_elem.text:
-            metadata.width = width_elem.text.strip()
-
-        height_elem = root.find(".//tiff:ImageLength", self.namespaces)
-        if height_elem is not None and height_elem.text:
-            metadata.height = height_elem.text.strip()
-
-        bits_elem = root.find(".//tiff:BitsPerSample", self.namespaces)
-        if bits_elem is not None and bits_elem.text:
-            metadata.bit_depth = bits_elem.text.strip()
-
-        colorspace_elem = root.find(".//exif:ColorSpace", self.namespaces)
-        if colorspace_elem is not None and colorspace_elem.text:
-            metadata.color_space = colorspace_elem.text.strip()
-
-    def _extract_video_info(self, root: ET.Element, metadata: PhotoMetadata):
-        """Extract video-specific information"""
-        codec_elem = root.find(".//aux:VideoCodec", self.namespaces)
-        if codec_elem is not None and codec_elem.text:
-            metadata.video_codec = codec_elem.text.strip()
-
-        framerate_elem = root.find(".//aux:VideoFrameRate", self.namespaces)
-        if framerate_elem is not None and framerate_elem.text:
-            metadata.video_framerate = framerate_elem.text.strip()
-
-        duration_elem = root.find(".//aux:Duration", self.namespaces)
-        if duration_elem is not None and duration_elem.text:
-            metadata.video_duration = duration_elem.text.strip()
-
-        audio_elem = root.find(".//aux:AudioCodec", self.namespaces)
-        if audio_elem is not None and audio_elem.text:
-            metadata.audio_codec = audio_elem.text.strip()
-
-    def _extract_creator_info(self, root: ET.Element, metadata: PhotoMetadata):
-        """Extract creator and software information"""
-        software_elem = root.find(".//tiff:Software", self.namespaces)
-        if software_elem is not None and software_elem.text:
-            metadata.software = software_elem.text.strip()
-
-        # Try multiple paths for creator/artist
-        creator_paths = [
-            ".//dc:creator/rdf:Seq/rdf:li",
-            ".//photoshop:AuthorsPosition",
-            ".//tiff:Artist",
-        ]
-
-        for path in creator_paths:
-            elem = root.find(path, self.namespaces)
-            if elem is not None and elem.text:
-                metadata.artist = elem.text.strip()
-                break
-
-        copyright_elem = root.find(".//dc:rights/rdf:Alt/rdf:li", self.namespaces)
-        if copyright_elem is not None and copyright_elem.text:
-            metadata.copyright = copyright_elem.text.strip()
-
-    def _extract_keywords(self, root: ET.Element, metadata: PhotoMetadata):
-        """Extract keywords/tags"""
-        keywords_elem = root.find(".//dc:subject/rdf:Bag", self.namespaces)
-        if keywords_elem is not None:
-            keywords = []
-            for li in keywords_elem.findall(".//rdf:li", self.namespaces):
-                if li.text:
-                    keywords.append(li.text.strip())
-            metadata.keywords = keywords
+        directory = str(xmp_path.parent)
+        names = self._directory_names.get(directory)
+        if names is None:
+            names = self._directory_names[directory] = _list_directory(directory)
+        return _find_associated_media_file(xmp_path, names)
 
     def _generate_analysis(self) -> dict[str, Any]:
         """Generate comprehensive analysis from collected metadata"""
         if not self.photos:
             return self._create_empty_report()
 
+        columns = self._build_columns()
+        counts = self._count_columns(columns)
+
         analysis = {
-            "summary": self._analyze_summary(),
-            "cameras": self._analyze_cameras(),
-            "lenses": self._analyze_lenses(),
-            "locations": self._analyze_locations(),
-            "exposure_settings": self._analyze_exposure_settings(),
-            "temporal_analysis": self._analyze_temporal_patterns(),
-            "technical_specs": self._analyze_technical_specs(),
-            "video_analysis": self._analyze_video_content(),
-            "creator_analysis": self._analyze_creators(),
-            "keywords_analysis": self._analyze_keywords(),
-            "file_analysis": self._analyze_files(),
+            "summary": self._analyze_summary(counts),
+            "cameras": self._analyze_cameras(counts),
+            "lenses": self._analyze_lenses(counts),
+            "locations": self._analyze_locations(counts),
+            "exposure_settings": self._analyze_exposure_settings(counts),
+            "temporal_analysis": self._analyze_temporal_patterns(columns),
+            "technical_specs": self._analyze_technical_specs(columns, counts),
+            "video_analysis": self._analyze_video_content(columns, counts),
+            "creator_analysis": self._analyze_creators(counts),
+            "keywords_analysis": self._analyze_keywords(columns),
+            "file_analysis": self._analyze_files(columns),
         }
 
         return analysis
 
-    def _analyze_summary(self) -> dict[str, Any]:
+    def _build_columns(self) -> dict[str, list]:
+        """Transpose the parsed photos into one list per PhotoMetadata field"""
+        names = [field.name for field in fields(PhotoMetadata)]
+        if not self.photos:
+            return {name: [] for name in names}
+        rows = map(attrgetter(*names), self.photos)
+        return dict(zip(names, map(list, zip(*rows, strict=True)), strict=True))
+
+    def _count_columns(self, columns: dict[str, list]) -> dict[str, Counter]:
+        """Count every categorical column in a single pass; the analyzers assemble their results from these"""
+        counts = {field: Counter(filter(None, columns[field])) for field in _COUNTED_FIELDS}
+        for name, (first, second) in _COUNTED_PAIRS.items():
+            counts[name] = Counter(zip(columns[first], columns[second], strict=True))
+        return counts
+
+    def _analyze_summary(self, counts: dict[str, Counter]) -> dict[str, Any]:
         """Generate summary statistics"""
         total_photos = len(self.photos)
-        photos_with_gps = len([p for p in self.photos if p.gps_latitude and p.gps_longitude])
-        photos_with_location = len([p for p in self.photos if p.location_city or p.location_country])
-        video_files = len([p for p in self.photos if p.video_codec])
+        photos_with_gps = sum(count for (lat, lon), count in counts["gps"].items() if lat and lon)
+        photos_with_location = sum(count for (city, country), count in counts["location"].items() if city or country)
+        video_files = counts["video_codec"].total()
 
         return {
             "total_files": total_photos,
@@ -433,109 +779,85 @@ class XMPAnalyzer:
             "location_coverage_percentage": ((photos_with_location / total_photos * 100) if total_photos > 0 else 0),
         }
 
-    def _analyze_cameras(self) -> dict[str, Any]:
+    def _analyze_cameras(self, counts: dict[str, Counter]) -> dict[str, Any]:
         """Analyze camera usage patterns"""
         camera_counts = Counter()
         make_counts = Counter()
         model_counts = Counter()
 
-        for photo in self.photos:
-            make = photo.camera_make or "Unknown"
-            model = photo.camera_model or "Unknown"
+        # Fold each distinct (make, model) pair into all three distributions
+        for (make, model), count in counts["camera"].items():
+            make = make or "Unknown"
+            model = model or "Unknown"
 
-            make_counts[make] += 1
-            model_counts[model] += 1
+            make_counts[make] += count
+            model_counts[model] += count
 
             if make != "Unknown" and model != "Unknown":
-                full_name = f"{make} {model}"
-                camera_counts[full_name] += 1
+                camera_counts[f"{make} {model}"] += count
 
         return {
             "total_unique_cameras": len(camera_counts),
-            "camera_distribution": dict(camera_counts.most_common()),
+            "total_unique_models": len(model_counts),
+            "photos_with_camera": camera_counts.total(),
+            "camera_distribution": dict(camera_counts.most_common(DISTRIBUTION_TOP_K)),
             "make_distribution": dict(make_counts.most_common()),
-            "model_distribution": dict(model_counts.most_common()),
+            "model_distribution": dict(model_counts.most_common(DISTRIBUTION_TOP_K)),
             "most_used_camera": (camera_counts.most_common(1)[0] if camera_counts else None),
             "most_used_make": make_counts.most_common(1)[0] if make_counts else None,
         }
 
-    def _analyze_lenses(self) -> dict[str, Any]:
+    def _analyze_lenses(self, counts: dict[str, Counter]) -> dict[str, Any]:
         """Analyze lens usage patterns"""
-        lens_counts = Counter()
+        lens_counts = counts["lens_model"]
         focal_length_counts = Counter()
 
-        for photo in self.photos:
-            if photo.lens_model:
-                lens_counts[photo.lens_model] += 1
-
-            if photo.focal_length:
-                # Extract numeric focal length
-                focal_match = re.search(r"(\d+(?:\.\d+)?)", photo.focal_length)
-                if focal_match:
-                    focal_mm = float(focal_match.group(1))
-                    # Group into ranges
-                    if focal_mm < 20:
-                        focal_range = "Ultra-wide (< 20mm)"
-                    elif focal_mm < 35:
-                        focal_range = "Wide (20-35mm)"
-                    elif focal_mm < 85:
-                        focal_range = "Standard (35-85mm)"
-                    elif focal_mm < 200:
-                        focal_range = "Telephoto (85-200mm)"
-                    else:
-                        focal_range = "Super-telephoto (> 200mm)"
-
-                    focal_length_counts[focal_range] += 1
+        # Group into ranges, classifying each distinct focal length string once
+        for focal_length, count in counts["focal_length"].items():
+            focal_mm = _focal_length_mm(focal_length)
+            if focal_mm is not None:
+                focal_length_counts[_FOCAL_RANGE_LABELS[bisect_right(_FOCAL_RANGE_BOUNDS, focal_mm)]] += count
 
         return {
             "total_unique_lenses": len(lens_counts),
-            "lens_distribution": dict(lens_counts.most_common()),
+            "lens_distribution": dict(lens_counts.most_common(DISTRIBUTION_TOP_K)),
             "focal_length_ranges": dict(focal_length_counts.most_common()),
             "most_used_lens": lens_counts.most_common(1)[0] if lens_counts else None,
         }
 
-    def _analyze_locations(self) -> dict[str, Any]:
+    def _analyze_locations(self, counts: dict[str, Counter]) -> dict[str, Any]:
         """Analyze location patterns"""
         city_counts = Counter()
         country_counts = Counter()
-        gps_coordinates = []
-
-        for photo in self.photos:
-            if photo.location_city:
-                city_counts[photo.location_city] += 1
-            if photo.location_country:
-                country_counts[photo.location_country] += 1
-            if photo.gps_latitude and photo.gps_longitude:
-                try:
-                    lat = float(photo.gps_latitude)
-                    lon = float(photo.gps_longitude)
-                    gps_coordinates.append((lat, lon))
-                except ValueError:
-                    pass
+        for (city, country), count in counts["location"].items():
+            if city:
+                city_counts[city] += count
+            if country:
+                country_counts[country] += count
+
+        # Parse each distinct coordinate pair once, weighted by how many photos share it
+        gps_coordinates = [(lat, lon, count) for (lat, lon), count in counts["gps"].items() if lat and lon]
+        size = len(gps_coordinates)
+        latitudes = np.fromiter((_parse_float(lat) for lat, _, _ in gps_coordinates), dtype=np.float64, count=size)
+        longitudes = np.fromiter((_parse_float(lon) for _, lon, _ in gps_coordinates), dtype=np.float64, count=size)
+        weights = np.fromiter((count for _, _, count in gps_coordinates), dtype=np.int64, count=size)
+        gps_available = int(weights[~(np.isnan(latitudes) | np.isnan(longitudes))].sum())
 
         return {
             "total_unique_cities": len(city_counts),
             "total_unique_countries": len(country_counts),
-            "city_distribution": dict(city_counts.most_common()),
-            "country_distribution": dict(country_counts.most_common()),
-            "gps_coordinates_available": len(gps_coordinates),
+            "city_distribution": dict(city_counts.most_common(DISTRIBUTION_TOP_K)),
+            "country_distribution": dict(country_counts.most_common(DISTRIBUTION_TOP_K)),
+            "gps_coordinates_available": gps_available,
             "most_photographed_city": (city_counts.most_common(1)[0] if city_counts else None),
             "most_photographed_country": (country_counts.most_common(1)[0] if country_counts else None),
         }
 
-    def _analyze_exposure_settings(self) -> dict[str, Any]:
+    def _analyze_exposure_settings(self, counts: dict[str, Counter]) -> dict[str, Any]:
         """Analyze exposure settings patterns"""
-        f_number_counts = Counter()
-        iso_counts = Counter()
-        exposure_counts = Counter()
-
-        for photo in self.photos:
-            if photo.f_number:
-                f_number_counts[photo.f_number] += 1
-            if photo.iso:
-                iso_counts[photo.iso] += 1
-            if photo.exposure_time:
-                exposure_counts[photo.exposure_time] += 1
+        f_number_counts = counts["f_number"]
+        iso_counts = counts["iso"]
+        exposure_counts = counts["exposure_time"]
 
         return {
             "f_number_distribution": dict(f_number_counts.most_common()),
@@ -545,153 +867,128 @@ class XMPAnalyzer:
             "most_used_iso": iso_counts.most_common(1)[0] if iso_counts else None,
         }
 
-    def _analyze_temporal_patterns(self) -> dict[str, Any]:
+    def _analyze_temporal_patterns(self, columns: dict[str, list]) -> dict[str, Any]:
         """Analyze temporal shooting patterns"""
-        years = Counter()
-        months = Counter()
-        days_of_week = Counter()
-        hours = Counter()
-
-        for photo in self.photos:
-            if photo.datetime_original:
-                try:
-                    # Parse various datetime formats
-                    dt_str = photo.datetime_original
-                    # Handle ISO format with timezone
-                    if "T" in dt_str:
-                        dt_str = (
-                            dt_str.split("T")[0] + " " + dt_str.split("T")[1].split("+")[0].split("-")[0].split("Z")[0]
-                        )
-
-                    dt = datetime.fromisoformat(dt_str.replace("Z", ""))
-
-                    years[dt.year] += 1
-                    months[dt.strftime("%B")] += 1
-                    days_of_week[dt.strftime("%A")] += 1
-                    hours[dt.hour] += 1
-                except Exception:
-                    continue
+        ordinals = []
+        hours = []
+
+        for dt_str in filter(None, columns["datetime_original"]):
+            try:
+                # Parse various datetime formats
+                # Handle ISO format with timezone
+                if "T" in dt_str:
+                    date_part, _, time_part = dt_str.partition("T")
+                    time_part = time_part.partition("T")[0].split("+")[0].split("-")[0].split("Z")[0]
+                    dt_str = f"{date_part} {time_part}"
+
+                dt = datetime.fromisoformat(dt_str.replace("Z", ""))
+            except ValueError:
+                continue
+            ordinals.append(dt.toordinal())
+            hours.append(dt.hour)
+
+        # Calendar fields by integer arithmetic on day numbers rather than strftime per photo
+        ordinals = np.array(ordinals, dtype=np.int64)
+        days = (ordinals - _UNIX_EPOCH_ORDINAL).astype("datetime64[D]")
+        years = days.astype("datetime64[Y]").astype(np.int64) + 1970
+        months = days.astype("datetime64[M]").astype(np.int64) % 12
+        weekdays = (ordinals - 1) % 7  # ordinal 1 (0001-01-01) is a Monday
+
+        # Names in the current locale, as strftime("%B") / ("%A") would give them
+        month_names = [datetime(2000, month, 1).strftime("%B") for month in range(1, 13)]
+        day_names = [datetime(2000, 1, 3 + weekday).strftime("%A") for weekday in range(7)]
+
+        year_distribution = _ranked_counts(years)
+        month_distribution = {month_names[month]: count for month, count in _ranked_counts(months).items()}
+        day_distribution = {day_names[weekday]: count for weekday, count in _ranked_counts(weekdays).items()}
 
         return {
-            "year_distribution": dict(years.most_common()),
-            "month_distribution": dict(months.most_common()),
-            "day_of_week_distribution": dict(days_of_week.most_common()),
-            "hour_distribution": dict(hours.most_common()),
-            "most_active_year": years.most_common(1)[0] if years else None,
-            "most_active_month": months.most_common(1)[0] if months else None,
-            "most_active_day": days_of_week.most_common(1)[0] if days_of_week else None,
+            "year_distribution": year_distribution,
+            "month_distribution": month_distribution,
+            "day_of_week_distribution": day_distribution,
+            "hour_distribution": _ranked_counts(np.array(hours, dtype=np.int64)),
+            "most_active_year": next(iter(year_distribution.items()), None),
+            "most_active_month": next(iter(month_distribution.items()), None),
+            "most_active_day": next(iter(day_distribution.items()), None),
         }
 
-    def _analyze_technical_specs(self) -> dict[str, Any]:
+    def _analyze_technical_specs(self, columns: dict[str, list], counts: dict[str, Counter]) -> dict[str, Any]:
         """Analyze technical specifications"""
         resolutions = Counter()
-        bit_depths = Counter()
-        color_spaces = Counter()
-        file_sizes = []
-
-        for photo in self.photos:
-            if photo.width and photo.height:
-                resolution = f"{photo.width}x{photo.height}"
-                resolutions[resolution] += 1
-
-            if photo.bit_depth:
-                bit_depths[photo.bit_depth] += 1
-
-            if photo.color_space:
-                color_spaces[photo.color_space] += 1
-
-            if photo.file_size > 0:
-                file_sizes.append(photo.file_size)
+        for (width, height), count in counts["resolution"].items():
+            if width and height:
+                resolutions[f"{width}x{height}"] += count
+        bit_depths = counts["bit_depth"]
+        color_spaces = counts["color_space"]
 
-        avg_file_size = sum(file_sizes) / len(file_sizes) if file_sizes else 0
-        total_file_size = sum(file_sizes)
+        file_sizes = np.array(columns["file_size"], dtype=np.int64)
+        file_sizes = file_sizes[file_sizes > 0]
+        total_file_size = int(file_sizes.sum())
+        avg_file_size = total_file_size / file_sizes.size if file_sizes.size else 0
 
         return {
-            "resolution_distribution": dict(resolutions.most_common()),
+            "total_unique_resolutions": len(resolutions),
+            "resolution_distribution": dict(resolutions.most_common(DISTRIBUTION_TOP_K)),
             "bit_depth_distribution": dict(bit_depths.most_common()),
             "color_space_distribution": dict(color_spaces.most_common()),
             "average_file_size_mb": avg_file_size / (1024 * 1024),
             "total_library_size_gb": total_file_size / (1024 * 1024 * 1024),
-            "largest_file_size_mb": (max(file_sizes) / (1024 * 1024) if file_sizes else 0),
+            "largest_file_size_mb": (int(file_sizes.max()) / (1024 * 1024) if file_sizes.size else 0),
         }
 
-    def _analyze_video_content(self) -> dict[str, Any]:
+    def _analyze_video_content(self, columns: dict[str, list], counts: dict[str, Counter]) -> dict[str, Any]:
         """Analyze video-specific content"""
-        video_codecs = Counter()
-        framerates = Counter()
-        audio_codecs = Counter()
-        durations = []
+        video_codecs = counts["video_codec"]
+        framerates = counts["video_framerate"]
+        audio_codecs = counts["audio_codec"]
+        durations = list(filter(None, columns["video_duration"]))
 
-        for photo in self.photos:
-            if photo.video_codec:
-                video_codecs[photo.video_codec] += 1
-
-            if photo.video_framerate:
-                framerates[photo.video_framerate] += 1
-
-            if photo.audio_codec:
-                audio_codecs[photo.audio_codec] += 1
-
-            if photo.video_duration:
-                try:
-                    duration = float(photo.video_duration)
-                    durations.append(duration)
-                except ValueError:
-                    pass
-
-        total_video_duration = sum(durations)
+        seconds = np.fromiter(map(_parse_float, durations), dtype=np.float64, count=len(durations))
+        seconds = seconds[~np.isnan(seconds)]
+        total_video_duration = float(seconds.sum())
 
         return {
             "video_codec_distribution": dict(video_codecs.most_common()),
             "framerate_distribution": dict(framerates.most_common()),
             "audio_codec_distribution": dict(audio_codecs.most_common()),
             "total_video_duration_hours": total_video_duration / 3600,
-            "average_video_length_seconds": (sum(durations) / len(durations) if durations else 0),
+            "average_video_length_seconds": (total_video_duration / seconds.size if seconds.size else 0),
         }
 
-    def _analyze_creators(self) -> dict[str, Any]:
+    def _analyze_creators(self, counts: dict[str, Counter]) -> dict[str, Any]:
         """Analyze creator and software information"""
-        software_counts = Counter()
-        creator_counts = Counter()
-
-        for photo in self.photos:
-            if photo.software:
-                software_counts[photo.software] += 1
-            if photo.artist:
-                creator_counts[photo.artist] += 1
+        software_counts = counts["software"]
+        creator_counts = counts["artist"]
 
         return {
-            "software_distribution": dict(software_counts.most_common()),
-            "creator_distribution": dict(creator_counts.most_common()),
+            "total_unique_software": len(software_counts),
+            "total_unique_creators": len(creator_counts),
+            "software_distribution": dict(software_counts.most_common(DISTRIBUTION_TOP_K)),
+            "creator_distribution": dict(creator_counts.most_common(DISTRIBUTION_TOP_K)),
             "most_used_software": (software_counts.most_common(1)[0] if software_counts else None),
         }
 
-    def _analyze_keywords(self) -> dict[str, Any]:
+    def _analyze_keywords(self, columns: dict[str, list]) -> dict[str, Any]:
         """Analyze keywords and tags"""
-        all_keywords = []
-        for photo in self.photos:
-            if photo.keywords:
-                all_keywords.extend(photo.keywords)
-
-        keyword_counts = Counter(all_keywords)
+        keyword_counts = Counter(chain.from_iterable(filter(None, columns["keywords"])))
 
         return {
             "total_unique_keywords": len(keyword_counts),
-            "total_keyword_instances": len(all_keywords),
-            "keyword_distribution": dict(keyword_counts.most_common(50)),  # Top 50
+            "total_keyword_instances": keyword_counts.total(),
+            "keyword_distribution": dict(keyword_counts.most_common(DISTRIBUTION_TOP_K)),
             "most_used_keyword": (keyword_counts.most_common(1)[0] if keyword_counts else None),
         }
 
-    def _analyze_files(self) -> dict[str, Any]:
+    def _analyze_files(self, columns: dict[str, list]) -> dict[str, Any]:
         """Analyze file organization patterns"""
         folder_counts = Counter()
         file_extensions = Counter()
 
-        for photo in self.photos:
-            folder = str(Path(photo.file_path).parent)
-            folder_counts[folder] += 1
+        for file_path in columns["file_path"]:
+            folder, name = os.path.split(file_path)
+            folder_counts[folder or "."] += 1
 
-            extension = Path(photo.file_path).suffix.lower()
+            extension = os.path.splitext(name)[1].lower()
             if extension:
                 file_extensions[extension] += 1
 
@@ -724,8 +1021,7 @@ class XMPAnalyzer:
 
         # Save JSON report
         json_path = output_path / "library_analysis.json"
-        with open(json_path, "w") as f:
-            json.dump(analysis, f, indent=2, default=str)
+        json_path.write_bytes(_dump_json(analysis))
 
         # Save detailed CSV exports
         self._save_csv_reports(output_path)
@@ -740,198 +1036,148 @@ class XMPAnalyzer:
         csv_path = output_path / "photos_metadata.csv"
         with open(csv_path, "w", newline="", encoding="utf-8") as f:
             if self.photos:
-                writer = csv.DictWriter(f, fieldnames=asdict(self.photos[0]).keys())
-                writer.writeheader()
-                for photo in self.photos:
-                    row = asdict(photo)
-                    row["keywords"] = "; ".join(row["keywords"]) if row["keywords"] else ""
-                    writer.writerow(row)
+                names = [field.name for field in fields(PhotoMetadata)]
+                writer = csv.writer(f)
+                writer.writerow(names)
+                writer.writerows(self._csv_rows(names, names.index("keywords")))
+
+    def _csv_rows(self, names: list[str], keywords_index: int) -> Iterator[list]:
+        """CSV rows of the photo fields in the given order, with the keywords joined into one value"""
+        # One attrgetter call reads all of a photo's fields
+        for row in map(list, map(attrgetter(*names), self.photos)):
+            keywords = row[keywords_index]
+            row[keywords_index] = "; ".join(keywords) if keywords else ""
+            yield row
 
     def display_analysis(self, analysis: dict[str, Any]):
         """Display analysis results in a formatted way"""
-        self._display_summary(analysis["summary"])
-        self._display_cameras(analysis["cameras"])
-        self._display_lenses(analysis["lenses"])
-        self._display_locations(analysis["locations"])
-        self._display_exposure_settings(analysis["exposure_settings"])
-        self._display_temporal_analysis(analysis["temporal_analysis"])
-        self._display_technical_specs(analysis["technical_specs"])
+        tables = [
+            *self._summary_tables(analysis["summary"]),
+            *self._camera_tables(analysis["cameras"]),
+            *self._lens_tables(analysis["lenses"]),
+            *self._location_tables(analysis["locations"]),
+            *self._exposure_tables(analysis["exposure_settings"]),
+            *self._temporal_tables(analysis["temporal_analysis"]),
+            *self._technical_tables(analysis["technical_specs"]),
+        ]
 
         if analysis["video_analysis"].get("video_codec_distribution"):
-            self._display_video_analysis(analysis["video_analysis"])
-
-    def _display_summary(self, summary: dict[str, Any]):
-        """Display summary statistics"""
-        table = Table(title="📊 Library Summary", show_header=True, header_style="bold cyan")
-        table.add_column("Metric", style="bold")
-        table.add_column("Value", justify="right", style="green")
-
-        table.add_row("Total Files", str(summary.get("total_files", 0)))
-        table.add_row("XMP Files Found", str(summary.get("xmp_files_found", 0)))
-        table.add_row("Image Files", str(summary.get("image_files", 0)))
-        table.add_row("Video Files", str(summary.get("video_files", 0)))
-        table.add_row("Files with GPS", str(summary.get("photos_with_gps", 0)))
-        table.add_row("GPS Coverage", f"{summary.get('gps_coverage_percentage', 0):.1f}%")
-        table.add_row(
-            "Location Coverage",
-            f"{summary.get('location_coverage_percentage', 0):.1f}%",
-        )
+            tables.extend(self._video_tables(analysis["video_analysis"]))
+
+        # Render every table, each followed by a blank line, in a single print
+        self.console.print(Group(*chain.from_iterable((table, "") for table in tables)))
+
+    def _summary_tables(self, summary: dict[str, Any]) -> list[Table]:
+        """Build the summary statistics table"""
+        table = _make_table("summary")
+        _add_spec_rows(table, "summary", summary)
 
-        self.console.print(table)
-        self.console.print()
+        return [table]
 
-    def _display_cameras(self, cameras: dict[str, Any]):
-        """Display camera statistics"""
+    def _camera_tables(self, cameras: dict[str, Any]) -> list[Table]:
+        """Build the camera statistics table"""
         if not cameras.get("camera_distribution"):
-            return
+            return []
 
-        table = Table(title="📸 Camera Usage", show_header=True, header_style="bold magenta")
-        table.add_column("Camera", style="cyan")
-        table.add_column("Photos", justify="right", style="green")
-        table.add_column("Percentage", justify="right", style="yellow")
+        table = _make_table("cameras")
 
-        total_photos = sum(cameras["camera_distribution"].values())
+        # The distribution only holds the top cameras, so percentages are of the stored total
+        total_photos = cameras["photos_with_camera"]
 
-        for camera, count in list(cameras["camera_distribution"].items())[:10]:
-            percentage = (count / total_photos * 100) if total_photos > 0 else 0
-            table.add_row(camera, str(count), f"{percentage:.1f}%")
+        if total_photos > 0:
+            rows = [
+                (camera, str(count), f"{count / total_photos * 100:.1f}%")
+                for camera, count in islice(cameras["camera_distribution"].items(), 10)
+            ]
+        else:
+            rows = [
+                (camera, str(count), "0.0%") for camera, count in islice(cameras["camera_distribution"].items(), 10)
+            ]
+        _add_rows(table, rows)
 
-        self.console.print(table)
-        self.console.print()
+        return [table]
 
-    def _display_lenses(self, lenses: dict[str, Any]):
-        """Display lens statistics"""
+    def _lens_tables(self, lenses: dict[str, Any]) -> list[Table]:
+        """Build the lens and focal length tables"""
         if not lenses.get("lens_distribution"):
-            return
+            return []
 
-        table = Table(title="🔍 Lens Usage", show_header=True, header_style="bold blue")
-        table.add_column("Lens", style="cyan")
-        table.add_column("Photos", justify="right", style="green")
+        table = _make_table("lenses")
 
-        for lens, count in list(lenses["lens_distribution"].items())[:10]:
-            table.add_row(lens, str(count))
+        _add_rows(table, _count_rows(lenses["lens_distribution"], 10))
 
-        self.console.print(table)
-        self.console.print()
+        tables = [table]
 
         # Focal length ranges
         if lenses.get("focal_length_ranges"):
-            focal_table = Table(
-                title="📏 Focal Length Distribution",
-                show_header=True,
-                header_style="bold blue",
-            )
-            focal_table.add_column("Range", style="cyan")
-            focal_table.add_column("Photos", justify="right", style="green")
-
-            for range_name, count in lenses["focal_length_ranges"].items():
-                focal_table.add_row(range_name, str(count))
-
-            self.console.print(focal_table)
-            self.console.print()
-
-    def _display_locations(self, locations: dict[str, Any]):
-        """Display location statistics"""
-        if locations.get("country_distribution"):
-            table = Table(
-                title="🗺️  Location Distribution",
-                show_header=True,
-                header_style="bold green",
-            )
-            table.add_column("Country", style="cyan")
-            table.add_column("Photos", justify="right", style="green")
-
-            for country, count in list(locations["country_distribution"].items())[:10]:
-                table.add_row(country, str(count))
-
-            self.console.print(table)
-            self.console.print()
-
-    def _display_exposure_settings(self, exposure: dict[str, Any]):
-        """Display exposure settings statistics"""
-        if exposure.get("most_used_aperture"):
-            table = Table(
-                title="📷 Exposure Settings",
-                show_header=True,
-                header_style="bold yellow",
-            )
-            table.add_column("Setting", style="bold")
-            table.add_column("Most Used Value", style="cyan")
-            table.add_column("Count", justify="right", style="green")
-
-            if exposure.get("most_used_aperture"):
-                aperture, count = exposure["most_used_aperture"]
-                table.add_row("Aperture", aperture, str(count))
-
-            if exposure.get("most_used_iso"):
-                iso, count = exposure["most_used_iso"]
-                table.add_row("ISO", iso, str(count))
-
-            self.console.print(table)
-            self.console.print()
-
-    def _display_temporal_analysis(self, temporal: dict[str, Any]):
-        """Display temporal analysis"""
-        if temporal.get("most_active_year"):
-            table = Table(
-                title="📅 Temporal Patterns",
-                show_header=True,
-                header_style="bold purple",
-            )
-            table.add_column("Period", style="bold")
-            table.add_column("Most Active", style="cyan")
-            table.add_column("Count", justify="right", style="green")
-
-            if temporal.get("most_active_year"):
-                year, count = temporal["most_active_year"]
-                table.add_row("Year", str(year), str(count))
-
-            if temporal.get("most_active_month"):
-                month, count = temporal["most_active_month"]
-                table.add_row("Month", month, str(count))
-
-            if temporal.get("most_active_day"):
-                day, count = temporal["most_active_day"]
-                table.add_row("Day of Week", day, str(count))
-
-            self.console.print(table)
-            self.console.print()
-
-    def _display_technical_specs(self, technical: dict[str, Any]):
-        """Display technical specifications"""
-        table = Table(
-            title="⚙️  Technical Specifications",
-            show_header=True,
-            header_style="bold red",
-        )
-        table.add_column("Metric", style="bold")
-        table.add_column("Value", style="cyan")
+            focal_table = _make_table("focal_lengths")
 
-        table.add_row("Average File Size", f"{technical.get('average_file_size_mb', 0):.1f} MB")
-        table.add_row("Total Library Size", f"{technical.get('total_library_size_gb', 0):.1f} GB")
-        table.add_row("Largest File", f"{technical.get('largest_file_size_mb', 0):.1f} MB")
+            _add_rows(focal_table, _count_rows(lenses["focal_length_ranges"]))
 
-        self.console.print(table)
-        self.console.print()
+            tables.append(focal_table)
 
-    def _display_video_analysis(self, video: dict[str, Any]):
-        """Display video analysis"""
-        table = Table(title="🎬 Video Content", show_header=True, header_style="bold cyan")
-        table.add_column("Metric", style="bold")
-        table.add_column("Value", style="cyan")
+        return tables
 
-        table.add_row(
-            "Total Video Duration",
-            f"{video.get('total_video_duration_hours', 0):.1f} hours",
-        )
-        table.add_row(
-            "Average Video Length",
-            f"{video.get('average_video_length_seconds', 0):.1f} seconds",
-        )
+    def _location_tables(self, locations: dict[str, Any]) -> list[Table]:
+        """Build the location statistics table"""
+        if not locations.get("country_distribution"):
+            return []
+
+        table = _make_table("locations")
+
+        _add_rows(table, _count_rows(locations["country_distribution"], 10))
+
+        return [table]
+
+    def _exposure_tables(self, exposure: dict[str, Any]) -> list[Table]:
+        """Build the exposure settings table"""
+        if not exposure.get("most_used_aperture"):
+            return []
+
+        table = _make_table("exposure")
+
+        aperture, count = exposure["most_used_aperture"]
+        table.add_row("Aperture", aperture, str(count))
+
+        if exposure.get("most_used_iso"):
+            iso, count = exposure["most_used_iso"]
+            table.add_row("ISO", iso, str(count))
+
+        return [table]
+
+    def _temporal_tables(self, temporal: dict[str, Any]) -> list[Table]:
+        """Build the temporal patterns table"""
+        if not temporal.get("most_active_year"):
+            return []
+
+        table = _make_table("temporal")
+
+        year, count = temporal["most_active_year"]
+        table.add_row("Year", str(year), str(count))
+
+        if temporal.get("most_active_month"):
+            month, count = temporal["most_active_month"]
+            table.add_row("Month", month, str(count))
+
+        if temporal.get("most_active_day"):
+            day, count = temporal["most_active_day"]
+            table.add_row("Day of Week", day, str(count))
+
+        return [table]
+
+    def _technical_tables(self, technical: dict[str, Any]) -> list[Table]:
+        """Build the technical specifications table"""
+        table = _make_table("technical")
+        _add_spec_rows(table, "technical", technical)
+
+        return [table]
+
+    def _video_tables(self, video: dict[str, Any]) -> list[Table]:
+        """Build the video content table"""
+        table = _make_table("video")
+        _add_spec_rows(table, "video", video)
 
         if video.get("video_codec_distribution"):
-            codecs = list(video["video_codec_distribution"].keys())[:3]
-            table.add_row("Common Codecs", ", ".join(codecs))
+            table.add_row("Common Codecs", ", ".join(islice(video["video_codec_distribution"], 3)))
 
-        self.console.print(table)
-        self.console.print()
+        return [table]
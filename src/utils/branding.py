@@ -5,29 +5,31 @@ This module provides branding elements including ASCII logos and version informa
 for display in the interactive interface and command-line output.
 """
 
-LENSLOGIC_LOGO = r"""
+# Block-letter art shared by the full and compact logos
+_LOGO_ART = r"""
  ___       _______   ________   ________  ___       ________  ________  ___  ________
 |\  \     |\  ___ \ |\   ___  \|\   ____\|\  \     |\   __  \|\   ____\|\  \|\   ____\
 \ \  \    \ \   __/|\ \  \\ \  \ \  \___|\ \  \    \ \  \|\  \ \  \___|\ \  \ \  \___|
  \ \  \    \ \  \_|/_\ \  \\ \  \ \_____  \ \  \    \ \  \\\  \ \  \  __\ \  \ \  \
   \ \  \____\ \  \_|\ \ \  \\ \  \|____|\  \ \  \____\ \  \\\  \ \  \|\  \ \  \ \  \____
    \ \_______\ \_______\ \__\\ \__\____\_\  \ \_______\ \_______\ \_______\ \__\ \_______\
-    \|_______|\|_______|\|__| \|__|\_________\|_______|\|_______|\|_______|\|__|\|_______|
+    \|_______|\|_______|\|__| \|__|\_________\|_______|\|_______|\|_______|\|__|\|_______|"""
+
+LENSLOGIC_LOGO = (
+    _LOGO_ART
+    + r"""
                                   \|_________|
 
     Smart photo & video organization powered by metadata
 """
+)
 
-LENSLOGIC_COMPACT = r"""
- ___       _______   ________   ________  ___       ________  ________  ___  ________
-|\  \     |\  ___ \ |\   ___  \|\   ____\|\  \     |\   __  \|\   ____\|\  \|\   ____\
-\ \  \    \ \   __/|\ \  \\ \  \ \  \___|\ \  \    \ \  \|\  \ \  \___|\ \  \ \  \___|
- \ \  \    \ \  \_|/_\ \  \\ \  \ \_____  \ \  \    \ \  \\\  \ \  \  __\ \  \ \  \
-  \ \  \____\ \  \_|\ \ \  \\ \  \|____|\  \ \  \____\ \  \\\  \ \  \|\  \ \  \ \  \____
-   \ \_______\ \_______\ \__\\ \__\____\_\  \ \_______\ \_______\ \_______\ \__\ \_______\
-    \|_______|\|_______|\|__| \|__|\_________\|_______|\|_______|\|_______|\|__|\|_______|
+LENSLOGIC_COMPACT = (
+    _LOGO_ART
+    + """
     Smart photo & video organization powered by metadata
 """
+)
 
 CAMERA_ASCII = """
     ╔══════════════════════════════════════╗
@@ -3,6 +3,125 @@ Camera name slugification utilities for professional photo organization
 """
 
 import re
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
+
+# Built-in mappings for common camera patterns, tried in order
+BUILT_IN_MAPPINGS = {
+    # iPhone models
+    r"iPhone\s+(\d+)\s+Pro\s+Max": r"iphone\1promax",
+    r"iPhone\s+(\d+)\s+Pro": r"iphone\1pro",
+    r"iPhone\s+(\d+)\s+Plus": r"iphone\1plus",
+    r"iPhone\s+(\d+)\s+mini": r"iphone\1mini",
+    r"iPhone\s+(\d+)": r"iphone\1",
+    r"iPhone\s+SE\s+\((\d+)\w+\s+generation\)": r"iphonese\1",
+    r"iPhone\s+SE": r"iphonese",
+    r"iPhone\s+XS\s+Max": r"iphonexsmax",
+    r"iPhone\s+XS": r"iphonexs",
+    r"iPhone\s+XR": r"iphonexr",
+    r"iPhone\s+X": r"iphonex",
+    # Canon models
+    r"Canon\s+EOS\s+(\w+)": r"canon\1",
+    r"Canon\s+PowerShot\s+(\w+)": r"canpwr\1",
+    r"Canon\s+EOS\s+R(\d+)": r"canonr\1",
+    r"Canon\s+EOS\s+(\d+)D": r"canon\1d",
+    # Nikon models
+    r"Nikon\s+D(\d+)": r"nikond\1",
+    r"Nikon\s+Z\s?(\d+)": r"nikonz\1",
+    r"Nikon\s+COOLPIX\s+(\w+)": r"nikcpx\1",
+    # Sony models
+    r"Sony\s+ILCE-(\d+\w*)": r"sonya\1",  # Alpha series
+    r"Sony\s+DSC-(\w+)": r"sonydsc\1",
+    r"Sony\s+Alpha\s+(\w+)": r"sonya\1",
+    r"Sony\s+FX(\d+)": r"sonyfx\1",
+    # Fujifilm models
+    r"Fujifilm\s+X-(\w+)": r"fujix\1",
+    r"Fujifilm\s+FinePix\s+(\w+)": r"fujifp\1",
+    r"Fujifilm\s+GFX\s?(\d+\w*)": r"fujigfx\1",
+    # Panasonic models
+    r"Panasonic\s+DMC-(\w+)": r"pandmc\1",
+    r"Panasonic\s+DC-(\w+)": r"pandc\1",
+    r"Panasonic\s+LUMIX\s+(\w+)": r"panlx\1",
+    # GoPro models
+    r"GoPro\s+HERO(\d+)": r"gopro\1",
+    r"GoPro\s+(\w+)": r"gopro\1",
+    # DJI models
+    r"DJI\s+(\w+)": r"dji\1",
+    # Generic smartphone patterns
+    r"Samsung\s+Galaxy\s+(\w+)": r"galaxy\1",
+    r"Google\s+Pixel\s+(\d+\w*)": r"pixel\1",
+    r"OnePlus\s+(\d+\w*)": r"oneplus\1",
+    r"Xiaomi\s+(\w+)": r"xiaomi\1",
+    # Action cameras
+    r"Insta360\s+(\w+)": r"insta\1",
+    r"Garmin\s+VIRB\s+(\w+)": r"garmin\1",
+}
+# Read-only view handed out by CameraSlugger.built_in_mappings
+_BUILT_IN_MAPPINGS_VIEW = MappingProxyType(BUILT_IN_MAPPINGS)
+# The same mappings with their patterns compiled once at import
+_COMPILED_MAPPINGS = [
+    (re.compile(pattern, re.IGNORECASE), replacement) for pattern, replacement in BUILT_IN_MAPPINGS.items()
+]
+
+# Manufacturer prefix removed from names that match no mapping
+_MANUFACTURER_PREFIX_RE = re.compile(
+    r"^(canon|nikon|sony|fujifilm|panasonic|olympus|pentax|leica|samsung|apple|google|oneplus|xiaomi|huawei|oppo|vivo|realme|motorola|lg|htc|nokia|blackberry)\s+",
+    re.IGNORECASE,
+)
+_NON_SLUG_CHARS_RE = re.compile(r"[^\w\d\-]")
+_HYPHEN_RUN_RE = re.compile(r"\-+")
+
+
+@lru_cache(maxsize=1024)
+def _built_in_slug(camera_make: str, camera_model: str) -> str:
+    """Slug from the built-in mappings or the fallback; memoized, as a library repeats a few cameras"""
+    full_name = f"{camera_make} {camera_model}".strip()
+
+    # Check built-in pattern mappings
+    for pattern, replacement in _COMPILED_MAPPINGS:
+        match = pattern.search(full_name)
+        if match:
+            # Replace capture groups in the replacement string
+            return _clean_slug(match.expand(replacement))
+
+    # Fallback: create slug from model name
+    return _create_fallback_slug(camera_model or camera_make)
+
+
+def _create_fallback_slug(name: str) -> str:
+    """Create a fallback slug when no patterns match"""
+    if not name:
+        return "unknown"
+
+    # Remove manufacturer prefix if present
+    name = _MANUFACTURER_PREFIX_RE.sub("", name)
+
+    # Basic cleanup
+    slug = name.lower()
+    slug = _NON_SLUG_CHARS_RE.sub("", slug)  # Remove special chars except hyphens
+    slug = _HYPHEN_RUN_RE.sub("-", slug)  # Collapse multiple hyphens
+    slug = slug.strip("-")  # Remove leading/trailing hyphens
+
+    # Truncate if too long
+    if len(slug) > 15:
+        slug = slug[:15].rstrip("-")
+
+    return slug or "unknown"
+
+
+def _clean_slug(slug: str) -> str:
+    """Clean and validate a slug"""
+    if not slug:
+        return "unknown"
+
+    # Ensure lowercase and clean
+    slug = slug.lower()
+    slug = _NON_SLUG_CHARS_RE.sub("", slug)
+    slug = _HYPHEN_RUN_RE.sub("-", slug)
+    slug = slug.strip("-")
+
+    return slug or "unknown"
 
 
 class CameraSlugger:
@@ -17,56 +136,16 @@ class CameraSlugger:
         """
         self.custom_mappings = custom_mappings or {}
 
-        # Built-in mappings for common camera patterns
-        self.built_in_mappings = {
-            # iPhone models
-            r"iPhone\s+(\d+)\s+Pro\s+Max": r"iphone\1promax",
-            r"iPhone\s+(\d+)\s+Pro": r"iphone\1pro",
-            r"iPhone\s+(\d+)\s+Plus": r"iphone\1plus",
-            r"iPhone\s+(\d+)\s+mini": r"iphone\1mini",
-            r"iPhone\s+(\d+)": r"iphone\1",
-            r"iPhone\s+SE\s+\((\d+)\w+\s+generation\)": r"iphonese\1",
-            r"iPhone\s+SE": r"iphonese",
-            r"iPhone\s+XS\s+Max": r"iphonexsmax",
-            r"iPhone\s+XS": r"iphonexs",
-            r"iPhone\s+XR": r"iphonexr",
-            r"iPhone\s+X": r"iphonex",
-            # Canon models
-            r"Canon\s+EOS\s+(\w+)": r"canon\1",
-            r"Canon\s+PowerShot\s+(\w+)": r"canpwr\1",
-            r"Canon\s+EOS\s+R(\d+)": r"canonr\1",
-            r"Canon\s+EOS\s+(\d+)D": r"canon\1d",
-            # Nikon models
-            r"Nikon\s+D(\d+)": r"nikond\1",
-            r"Nikon\s+Z\s?(\d+)": r"nikonz\1",
-            r"Nikon\s+COOLPIX\s+(\w+)": r"nikcpx\1",
-            # Sony models
-            r"Sony\s+ILCE-(\d+\w*)": r"sonya\1",  # Alpha series
-            r"Sony\s+DSC-(\w+)": r"sonydsc\1",
-            r"Sony\s+Alpha\s+(\w+)": r"sonya\1",
-            r"Sony\s+FX(\d+)": r"sonyfx\1",
-            # Fujifilm models
-            r"Fujifilm\s+X-(\w+)": r"fujix\1",
-            r"Fujifilm\s+FinePix\s+(\w+)": r"fujifp\1",
-            r"Fujifilm\s+GFX\s?(\d+\w*)": r"fujigfx\1",
-            # Panasonic models
-            r"Panasonic\s+DMC-(\w+)": r"pandmc\1",
-            r"Panasonic\s+DC-(\w+)": r"pandc\1",
-            r"Panasonic\s+LUMIX\s+(\w+)": r"panlx\1",
-            # GoPro models
-            r"GoPro\s+HERO(\d+)": r"gopro\1",
-            r"GoPro\s+(\w+)": r"gopro\1",
-            # DJI models
-            r"DJI\s+(\w+)": r"dji\1",
-            # Generic smartphone patterns
-            r"Samsung\s+Galaxy\s+(\w+)": r"galaxy\1",
-            r"Google\s+Pixel\s+(\d+\w*)": r"pixel\1",
-            r"OnePlus\s+(\d+\w*)": r"oneplus\1",
-            r"Xiaomi\s+(\w+)": r"xiaomi\1",
-            # Action cameras
-            r"Insta360\s+(\w+)": r"insta\1",
-            r"Garmin\s+VIRB\s+(\w+)": r"garmin\1",
-        }
+        # Custom mappings by lowercase name, for case-insensitive exact lookups; the first of
+        # several names that differ only in case wins
+        self._custom_slugs: dict[str, str] = {}
+        for name, slug in self.custom_mappings.items():
+            self._custom_slugs.setdefault(name.lower(), slug)
+
+    @property
+    def built_in_mappings(self) -> Mapping[str, str]:
+        """Built-in pattern mappings, read-only: they are compiled once for every slugger"""
+        return _BUILT_IN_MAPPINGS_VIEW
 
     def create_slug(self, camera_make: str = "", camera_model: str = "") -> str:
         """
@@ -86,60 +165,11 @@ class CameraSlugger:
             return "unknown"
 
         # Check custom mappings first (exact match only)
-        for pattern, replacement in self.custom_mappings.items():
-            if pattern.lower() == full_name.lower():
-                return self._clean_slug(replacement)
-
-        # Check built-in pattern mappings
-        for pattern, replacement in self.built_in_mappings.items():
-            match = re.search(pattern, full_name, re.IGNORECASE)
-            if match:
-                # Replace capture groups in the replacement string
-                result = replacement
-                for i, group in enumerate(match.groups(), 1):
-                    result = result.replace(f"\\{i}", group.lower())
-                return self._clean_slug(result)
-
-        # Fallback: create slug from model name
-        return self._create_fallback_slug(camera_model or camera_make)
-
-    def _create_fallback_slug(self, name: str) -> str:
-        """Create a fallback slug when no patterns match"""
-        if not name:
-            return "unknown"
-
-        # Remove manufacturer prefix if present
-        name = re.sub(
-            r"^(canon|nikon|sony|fujifilm|panasonic|olympus|pentax|leica|samsung|apple|google|oneplus|xiaomi|huawei|oppo|vivo|realme|motorola|lg|htc|nokia|blackberry)\s+",
-            "",
-            name,
-            flags=re.IGNORECASE,
-        )
-
-        # Basic cleanup
-        slug = name.lower()
-        slug = re.sub(r"[^\w\d\-]", "", slug)  # Remove special chars except hyphens
-        slug = re.sub(r"\-+", "-", slug)  # Collapse multiple hyphens
-        slug = slug.strip("-")  # Remove leading/trailing hyphens
-
-        # Truncate if too long
-        if len(slug) > 15:
-            slug = slug[:15].rstrip("-")
-
-        return slug or "unknown"
-
-    def _clean_slug(self, slug: str) -> str:
-        """Clean and validate a slug"""
-        if not slug:
-            return "unknown"
-
-        # Ensure lowercase and clean
-        slug = slug.lower()
-        slug = re.sub(r"[^\w\d\-]", "", slug)
-        slug = re.sub(r"\-+", "-", slug)
-        slug = slug.strip("-")
+        lower_name = full_name.lower()
+        if lower_name in self._custom_slugs:
+            return _clean_slug(self._custom_slugs[lower_name])
 
-        return slug or "unknown"
+        return _built_in_slug(camera_make, camera_model)
 
     def get_examples(self) -> dict[str, str]:
         """Get examples of camera name to slug conversions"""
@@ -1,18 +1,186 @@
+import copy
+import json
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 logger = logging.getLogger(__name__)
 
+# Bundled defaults and the per-user overrides; both fixed for the life of the process
+DEFAULT_CONFIG_PATH = Path(__file__).parent.parent.parent / "config" / "default_config.yaml"
+USER_CONFIG_PATH = Path.home() / ".lenslogic" / "config.yaml"
+
+# Parsed YAML files by (path, mtime_ns, size), shared by every ConfigManager in the process
+_YAML_CACHE: dict[tuple[str, int, int], Any] = {}
+
+
+# PyYAML is imported on first use so that --help and other config-free paths never load it
+@lru_cache(maxsize=1)
+def _yaml_loader_dumper() -> tuple[type, type]:
+    try:
+        from yaml import CSafeDumper, CSafeLoader
+
+        return CSafeLoader, CSafeDumper
+    except ImportError:
+        from yaml import SafeDumper, SafeLoader
+
+        return SafeLoader, SafeDumper
+
+
+def _load_yaml(path: Path | str) -> Any:
+    import yaml
+
+    stat = Path(path).stat()
+    key = (str(path), stat.st_mtime_ns, stat.st_size)
+    if key not in _YAML_CACHE:
+        with open(path) as f:
+            _YAML_CACHE[key] = yaml.load(f, Loader=_yaml_loader_dumper()[0])
+    # Callers merge and set() into the result, so they must never share the cached objects
+    return copy.deepcopy(_YAML_CACHE[key])
+
+
+def _user_cache_path(config_path: Path) -> Path:
+    return config_path.with_name(f".{config_path.name}.cache.json")
+
+
+def _read_json_cache(cache_path: Path, stamp: list[int]) -> dict[str, Any] | None:
+    try:
+        with open(cache_path, "rb") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if isinstance(cached, dict) and cached.get("stamp") == stamp:
+        return cached.get("config")
+    return None
+
+
+def _write_json_cache(cache_path: Path, stamp: list[int], config: dict[str, Any]) -> None:
+    try:
+        payload = json.dumps({"stamp": stamp, "config": config})
+    except (TypeError, ValueError):
+        return
+
+    # YAML-only values (dates, non-string keys) would come back changed, so those configs are never cached
+    if json.loads(payload)["config"] != config:
+        return
+
+    try:
+        cache_path.write_text(payload)
+    except OSError as e:
+        logger.debug(f"Could not write config cache {cache_path}: {e}")
+
+
+# Used when config/default_config.yaml is missing or invalid; copied for each manager that needs it
+_HARDCODED_DEFAULTS: dict[str, Any] = {
+    "general": {
+        "source_directory": ".",
+        "destination_directory": "./organized",
+        "dry_run": False,
+        "verbose": True,
+        "preserve_originals": True,
+        "skip_duplicates": True,
+        "log_file": "lenslogic.log",
+    },
+    "file_types": {
+        "images": [
+            "jpg",
+            "jpeg",
+            "png",
+            "gif",
+            "bmp",
+            "tiff",
+            "webp",
+            "heic",
+            "heif",
+        ],
+        "raw": [
+            "raw",
+            "cr2",
+            "cr3",
+            "nef",
+            "arw",
+            "orf",
+            "dng",
+            "raf",
+            "rw2",
+            "pef",
+            "srw",
+            "x3f",
+        ],
+        "videos": [
+            "mp4",
+            "avi",
+            "mov",
+            "mkv",
+            "wmv",
+            "flv",
+            "webm",
+            "m4v",
+            "mpg",
+            "mpeg",
+        ],
+    },
+    "organization": {
+        "folder_structure": "{year}/{month:02d}/{day:02d}",
+        "separate_raw": True,
+        "raw_folder": "RAW",
+        "jpg_folder": "JPG",
+        "video_folder": "VIDEOS",
+        "unknown_folder": "UNKNOWN",
+    },
+    "naming": {
+        "pattern": "{year}{month:02d}{day:02d}_{hour:02d}{minute:02d}{second:02d}_{camera}_{original_name}",
+        "include_sequence": True,
+        "sequence_padding": 3,
+        "lowercase_extension": True,
+    },
+    "features": {
+        "extract_gps": True,
+        "create_sidecar": True,
+        "generate_thumbnails": False,
+        "detect_faces": False,
+        "auto_rotate": True,
+        "remove_duplicates": True,
+    },
+    "geolocation": {
+        "enabled": True,
+        "reverse_geocode": True,
+        "add_location_to_folder": False,
+        "cache_lookups": True,
+    },
+    "duplicate_detection": {
+        "method": "hash",
+        "threshold": 0.95,
+        "action": "skip",
+        "duplicate_folder": "DUPLICATES",
+    },
+}
+
+
+@lru_cache(maxsize=256)
+def _split_key_path(key_path: str) -> tuple[str, ...]:
+    return tuple(key_path.split("."))
+
 
 class ConfigManager:
+    # Command-line argument -> config key path, and whether a falsy value (rather than only None) is ignored
+    _ARG_TO_PATH: dict[str, tuple[tuple[str, ...], bool]] = {
+        "source": (("general", "source_directory"), True),
+        "destination": (("general", "destination_directory"), True),
+        "dry_run": (("general", "dry_run"), False),
+        "verbose": (("general", "verbose"), False),
+        "pattern": (("naming", "pattern"), True),
+        "folder_structure": (("organization", "folder_structure"), True),
+        "create_xmp": (("features", "create_sidecar"), False),
+    }
+
     def __init__(self, config_path: str | None = None):
         self.config_path = config_path
         self.config: dict[str, Any] = {}
-        self.default_config_path = Path(__file__).parent.parent.parent / "config" / "default_config.yaml"
-        self.user_config_path = Path.home() / ".lenslogic" / "config.yaml"
+        self.default_config_path = DEFAULT_CONFIG_PATH
+        self.user_config_path = USER_CONFIG_PATH
         self.load_config()
 
     def load_config(self) -> None:
@@ -28,9 +196,10 @@ class ConfigManager:
                 self.config = self._merge_configs(self.config, custom_config)
 
     def _load_default_config(self) -> dict[str, Any]:
+        import yaml
+
         try:
-            with open(self.default_config_path) as f:
-                return yaml.safe_load(f) or {}
+            return _load_yaml(self.default_config_path) or {}
         except FileNotFoundError:
             logger.warning(f"Default config not found at {self.default_config_path}")
             return self._get_hardcoded_defaults()
@@ -39,129 +208,62 @@ class ConfigManager:
             return self._get_hardcoded_defaults()
 
     def _load_user_config(self) -> dict[str, Any] | None:
+        import yaml
+
         if not self.user_config_path.exists():
             return None
 
+        # A JSON copy of the last parse, stamped with the YAML file's mtime and size, skips PyYAML on later runs
+        stat = self.user_config_path.stat()
+        stamp = [stat.st_mtime_ns, stat.st_size]
+        cache_path = _user_cache_path(self.user_config_path)
+        cached = _read_json_cache(cache_path, stamp)
+        if cached is not None:
+            return cached
+
         try:
-            with open(self.user_config_path) as f:
-                return yaml.safe_load(f)
+            user_config = _load_yaml(self.user_config_path)
         except yaml.YAMLError as e:
             logger.error(f"Error parsing user config: {e}")
             return None
 
+        if isinstance(user_config, dict):
+            _write_json_cache(cache_path, stamp, user_config)
+        return user_config
+
     def _load_custom_config(self) -> dict[str, Any] | None:
+        import yaml
+
         if not self.config_path or not Path(self.config_path).exists():
             return None
 
         try:
-            with open(self.config_path) as f:
-                return yaml.safe_load(f)
+            return _load_yaml(self.config_path)
         except yaml.YAMLError as e:
             logger.error(f"Error parsing custom config: {e}")
             return None
 
     def _merge_configs(self, base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any]:
-        result = base.copy()
-
-        for key, value in override.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = self._merge_configs(result[key], value)
-            else:
-                result[key] = value
+        # Merges into base in place; every loaded config is a private copy, so nothing is shared
+        pending = [(base, override)]
+        while pending:
+            target, changes = pending.pop()
+            for key, value in changes.items():
+                if key in target and isinstance(target[key], dict) and isinstance(value, dict):
+                    pending.append((target[key], value))
+                else:
+                    target[key] = value
 
-        return result
+        return base
 
     def _get_hardcoded_defaults(self) -> dict[str, Any]:
-        return {
-            "general": {
-                "source_directory": ".",
-                "destination_directory": "./organized",
-                "dry_run": False,
-                "verbose": True,
-                "preserve_originals": True,
-                "skip_duplicates": True,
-                "log_file": "lenslogic.log",
-            },
-            "file_types": {
-                "images": [
-                    "jpg",
-                    "jpeg",
-                    "png",
-                    "gif",
-                    "bmp",
-                    "tiff",
-                    "webp",
-                    "heic",
-                    "heif",
-                ],
-                "raw": [
-                    "raw",
-                    "cr2",
-                    "cr3",
-                    "nef",
-                    "arw",
-                    "orf",
-                    "dng",
-                    "raf",
-                    "rw2",
-                    "pef",
-                    "srw",
-                    "x3f",
-                ],
-                "videos": [
-                    "mp4",
-                    "avi",
-                    "mov",
-                    "mkv",
-                    "wmv",
-                    "flv",
-                    "webm",
-                    "m4v",
-                    "mpg",
-                    "mpeg",
-                ],
-            },
-            "organization": {
-                "folder_structure": "{year}/{month:02d}/{day:02d}",
-                "separate_raw": True,
-                "raw_folder": "RAW",
-                "jpg_folder": "JPG",
-                "video_folder": "VIDEOS",
-                "unknown_folder": "UNKNOWN",
-            },
-            "naming": {
-                "pattern": "{year}{month:02d}{day:02d}_{hour:02d}{minute:02d}{second:02d}_{camera}_{original_name}",
-                "include_sequence": True,
-                "sequence_padding": 3,
-                "lowercase_extension": True,
-            },
-            "features": {
-                "extract_gps": True,
-                "create_sidecar": True,
-                "generate_thumbnails": False,
-                "detect_faces": False,
-                "auto_rotate": True,
-                "remove_duplicates": True,
-            },
-            "geolocation": {
-                "enabled": True,
-                "reverse_geocode": True,
-                "add_location_to_folder": False,
-                "cache_lookups": True,
-            },
-            "duplicate_detection": {
-                "method": "hash",
-                "threshold": 0.95,
-                "action": "skip",
-                "duplicate_folder": "DUPLICATES",
-            },
-        }
+        return copy.deepcopy(_HARDCODED_DEFAULTS)
 
     def get(self, key_path: str, default: Any = None) -> Any:
-        keys = key_path.split(".")
+        # Looked up in the live dict on every call, as callers also edit self.config directly
         value = self.config
 
-        for key in keys:
+        for key in _split_key_path(key_path):
             if isinstance(value, dict) and key in value:
                 value = value[key]
             else:
@@ -170,7 +272,9 @@ class ConfigManager:
         return value
 
     def set(self, key_path: str, value: Any) -> None:
-        keys = key_path.split(".")
+        self._set_path(_split_key_path(key_path), value)
+
+    def _set_path(self, keys: tuple[str, ...], value: Any) -> None:
         config = self.config
 
         for key in keys[:-1]:
@@ -181,33 +285,29 @@ class ConfigManager:
         config[keys[-1]] = value
 
     def save_user_config(self) -> None:
+        import yaml
+
         self.user_config_path.parent.mkdir(parents=True, exist_ok=True)
+        _user_cache_path(self.user_config_path).unlink(missing_ok=True)
 
         with open(self.user_config_path, "w") as f:
-            yaml.dump(self.config, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(self.config, f, Dumper=_yaml_loader_dumper()[1], default_flow_style=False, sort_keys=False)
 
         logger.info(f"Configuration saved to {self.user_config_path}")
 
     def export_config(self, path: str) -> None:
+        import yaml
+
         with open(path, "w") as f:
-            yaml.dump(self.config, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(self.config, f, Dumper=_yaml_loader_dumper()[1], default_flow_style=False, sort_keys=False)
 
         logger.info(f"Configuration exported to {path}")
 
     def update_from_args(self, args: dict[str, Any]) -> None:
-        if args.get("source"):
-            self.set("general.source_directory", args["source"])
-        if args.get("destination"):
-            self.set("general.destination_directory", args["destination"])
-        if args.get("dry_run") is not None:
-            self.set("general.dry_run", args["dry_run"])
-        if args.get("verbose") is not None:
-            self.set("general.verbose", args["verbose"])
-        if args.get("pattern"):
-            self.set("naming.pattern", args["pattern"])
-        if args.get("folder_structure"):
-            self.set("organization.folder_structure", args["folder_structure"])
-        if args.get("create_xmp") is not None:
-            self.set("features.create_sidecar", args["create_xmp"])
+        for arg, (path, skip_falsy) in self._ARG_TO_PATH.items():
+            value = args.get(arg)
+            if value is None or (skip_falsy and not value):
+                continue
+            self._set_path(path, value)
         if args.get("no_xmp") is not None:
-            self.set("features.create_sidecar", not args["no_xmp"])
+            self._set_path(("features", "create_sidecar"), not args["no_xmp"])
@@ -1,65 +1,196 @@
 import logging
+import os
 import time
-from pathlib import Path
-from typing import Any
+from dataclasses import asdict, dataclass, fields
+from typing import TYPE_CHECKING, Any
 
 from rich.console import Console
-from rich.panel import Panel
-from rich.progress import (
-    BarColumn,
-    Progress,
-    SpinnerColumn,
-    TaskProgressColumn,
-    TextColumn,
-    TimeRemainingColumn,
-)
-from rich.table import Table
+
+if TYPE_CHECKING:
+    from rich.table import Table
 
 logger = logging.getLogger(__name__)
 
+# Processed files buffered before the count is pushed to the progress bar
+PROGRESS_FLUSH_FILES = 64
+# Longest the progress bar's count or current file may lag behind, in seconds
+PROGRESS_FLUSH_SECONDS = 0.1
+
+# File preview panel body, filled with str.format_map from the file's metadata
+_PREVIEW_TEMPLATE = """
+[bold]Original:[/bold] {original_name}
+[bold]New Name:[/bold] {new_name}
+[bold]Destination:[/bold] {destination}
+
+[bold cyan]Metadata:[/bold cyan]
+• Date: {datetime_original}
+• Camera: {camera_model}
+• Dimensions: {width}x{height}
+• ISO: {iso}
+• F-Stop: {f_number}
+"""
+# Shown for metadata fields missing from the preview
+_PREVIEW_DEFAULTS = {
+    "datetime_original": "Unknown",
+    "camera_model": "Unknown",
+    "width": "?",
+    "height": "?",
+    "iso": "N/A",
+    "f_number": "N/A",
+}
+
+# (header, style, justify) for the processing summary and library statistics tables
+_SUMMARY_COLUMNS = (
+    ("Metric", "cyan", "left"),
+    ("Value", "green", "right"),
+)
+_STATISTICS_COLUMNS = (
+    ("File Type", "cyan", "left"),
+    ("Count", "green", "right"),
+    ("Size (MB)", "yellow", "right"),
+)
+# (stats key, label) for the per-type rows of the library statistics table
+_STATISTICS_ROWS = (
+    ("images", "Images"),
+    ("raw_files", "RAW Files"),
+    ("videos", "Videos"),
+    ("unknown", "Unknown"),
+)
+
+
+def _make_table(columns: tuple[tuple[str, str, str], ...], title: str | None = None) -> "Table":
+    from rich.table import Table
+
+    table = Table(title=title, show_header=True, header_style="bold magenta")
+    for header, style, justify in columns:
+        table.add_column(header, style=style, justify=justify)
+    return table
+
+
+def _noop(*args, **kwargs):
+    pass
+
+
+@dataclass(slots=True)
+class ProcessingStats:
+    total_files: int = 0
+    processed_files: int = 0
+    skipped_files: int = 0
+    failed_files: int = 0
+    copied_files: int = 0
+    moved_files: int = 0
+    renamed_files: int = 0
+    duplicates_found: int = 0
+    total_size: int = 0
+    processed_size: int = 0
+    elapsed_time: float | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        stats = asdict(self)
+        if self.elapsed_time is None:
+            del stats["elapsed_time"]
+        return stats
+
+    def record(
+        self,
+        success: bool = True,
+        action: str = None,
+        size: int = 0,
+        skipped: bool = False,
+    ):
+        self.processed_files += 1
+        self.processed_size += size
+
+        if skipped:
+            self.skipped_files += 1
+        elif not success:
+            self.failed_files += 1
+        elif action == "copy":
+            self.copied_files += 1
+        elif action == "move":
+            self.moved_files += 1
+        elif action == "rename":
+            self.renamed_files += 1
+
+    def merge(self, other: "ProcessingStats"):
+        for name in _MERGED_FIELDS:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+
+
+# Counters summed when a worker's tallies are merged; the total and elapsed time belong to the run
+_MERGED_FIELDS = tuple(f.name for f in fields(ProcessingStats) if f.name not in ("total_files", "elapsed_time"))
+
 
 class ProgressTracker:
-    def __init__(self, verbose: bool = True):
-        self.console = Console()
+    def __init__(self, verbose: bool = True, console: Console | None = None):
+        self.console = console or Console()
         self.verbose = verbose
         self.start_time = None
-        self.stats = {
-            "total_files": 0,
-            "processed_files": 0,
-            "skipped_files": 0,
-            "failed_files": 0,
-            "copied_files": 0,
-            "moved_files": 0,
-            "renamed_files": 0,
-            "duplicates_found": 0,
-            "total_size": 0,
-            "processed_size": 0,
-        }
+        self.stats = ProcessingStats()
         self.current_file = None
         self.progress = None
         self.task_id = None
+        self._pending_advance = 0
+        self._last_flush = 0.0
+        self._last_description = 0.0
+        # Progress bar hooks; start_processing binds the real ones once a bar is shown
+        self._advance = _noop
+        self._show_file = _noop
+
+        # Quiet trackers never show info messages, so skip the verbose check on each call
+        if not verbose:
+            self.print_info = _noop
 
     def start_processing(self, total_files: int, operation: str = "Processing"):
-        self.start_time = time.time()
-        self.stats["total_files"] = total_files
+        self.start_time = time.perf_counter()
+        self.stats.total_files = total_files
 
         if self.verbose:
-            self.progress = Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                BarColumn(),
-                TaskProgressColumn(),
-                TimeRemainingColumn(),
-                console=self.console,
+            # The progress bar classes are only imported once a bar is actually shown
+            from rich.progress import (
+                BarColumn,
+                Progress,
+                SpinnerColumn,
+                TaskProgressColumn,
+                TextColumn,
+                TimeRemainingColumn,
             )
+
+            if self.console.is_terminal:
+                self.progress = Progress(
+                    SpinnerColumn(),
+                    TextColumn("[progress.description]{task.description}"),
+                    BarColumn(),
+                    TaskProgressColumn(),
+                    TimeRemainingColumn(),
+                    console=self.console,
+                )
+            else:
+                # Redirected output only gets the final state written at stop, so skip the
+                # animated columns and the background refresh that would rebuild them
+                self.progress = Progress(
+                    TextColumn("[progress.description]{task.description}"),
+                    BarColumn(),
+                    TaskProgressColumn(),
+                    console=self.console,
+                    auto_refresh=False,
+                )
             self.task_id = self.progress.add_task(f"[cyan]{operation} files...", total=total_files)
+            self._pending_advance = 0
+            self._last_flush = self._last_description = time.monotonic()
+            self._advance = self._advance_progress
+            self._show_file = self._show_file_progress
             self.progress.start()
 
     def update_file(self, file_path: str, status: str = "processing"):
         self.current_file = file_path
+        self._show_file(file_path, status)
 
-        if self.verbose and self.progress:
-            self.progress.update(self.task_id, description=f"[cyan]{status}: {Path(file_path).name}")
+    def _show_file_progress(self, file_path: str, status: str):
+        now = time.monotonic()
+        if now - self._last_description >= PROGRESS_FLUSH_SECONDS:
+            self._last_description = now
+            self.progress.update(self.task_id, description=f"[cyan]{status}: {os.path.basename(file_path)}")
 
     def file_processed(
         self,
@@ -68,71 +199,73 @@ class ProgressTracker:
         size: int = 0,
         skipped: bool = False,
     ):
-        self.stats["processed_files"] += 1
-        self.stats["processed_size"] += size
-
-        if skipped:
-            self.stats["skipped_files"] += 1
-        elif not success:
-            self.stats["failed_files"] += 1
-        elif action == "copy":
-            self.stats["copied_files"] += 1
-        elif action == "move":
-            self.stats["moved_files"] += 1
-        elif action == "rename":
-            self.stats["renamed_files"] += 1
-
-        if self.verbose and self.progress:
-            self.progress.advance(self.task_id)
+        self.stats.record(success, action, size, skipped)
+        self._advance(1)
+
+    def file_processed_batch(self, batch: ProcessingStats):
+        # For workers that tally into their own ProcessingStats and hand them over together
+        self.stats.merge(batch)
+        self._advance(batch.processed_files)
+
+    def _advance_progress(self, count: int):
+        self._pending_advance += count
+        if (
+            self._pending_advance >= PROGRESS_FLUSH_FILES
+            or time.monotonic() - self._last_flush >= PROGRESS_FLUSH_SECONDS
+        ):
+            self._flush_progress()
+
+    def _flush_progress(self):
+        if self._pending_advance:
+            self.progress.advance(self.task_id, self._pending_advance)
+            self._pending_advance = 0
+        self._last_flush = time.monotonic()
 
     def duplicate_found(self):
-        self.stats["duplicates_found"] += 1
+        self.stats.duplicates_found += 1
 
     def stop_processing(self):
         if self.progress:
+            self._flush_progress()
             self.progress.stop()
 
-        if self.start_time:
-            elapsed_time = time.time() - self.start_time
-            self.stats["elapsed_time"] = elapsed_time
+        if self.start_time is not None:
+            # perf_counter is monotonic, so clock adjustments during a run cannot skew the elapsed time
+            elapsed_time = time.perf_counter() - self.start_time
+            self.stats.elapsed_time = elapsed_time
 
     def print_summary(self):
         self.console.print("\n[bold cyan]═══ Processing Summary ═══[/bold cyan]\n")
 
-        table = Table(show_header=True, header_style="bold magenta")
-        table.add_column("Metric", style="cyan")
-        table.add_column("Value", justify="right", style="green")
-
-        table.add_row("Total Files", str(self.stats["total_files"]))
-        table.add_row("Processed", str(self.stats["processed_files"]))
-        table.add_row("Copied", str(self.stats["copied_files"]))
-        table.add_row("Moved", str(self.stats["moved_files"]))
-        table.add_row("Renamed", str(self.stats["renamed_files"]))
-        table.add_row("Skipped", str(self.stats["skipped_files"]))
-        table.add_row("Failed", str(self.stats["failed_files"]))
-        table.add_row("Duplicates", str(self.stats["duplicates_found"]))
-
-        if self.stats["processed_size"] > 0:
-            size_mb = self.stats["processed_size"] / (1024 * 1024)
+        table = _make_table(_SUMMARY_COLUMNS)
+
+        table.add_row("Total Files", str(self.stats.total_files))
+        table.add_row("Processed", str(self.stats.processed_files))
+        table.add_row("Copied", str(self.stats.copied_files))
+        table.add_row("Moved", str(self.stats.moved_files))
+        table.add_row("Renamed", str(self.stats.renamed_files))
+        table.add_row("Skipped", str(self.stats.skipped_files))
+        table.add_row("Failed", str(self.stats.failed_files))
+        table.add_row("Duplicates", str(self.stats.duplicates_found))
+
+        if self.stats.processed_size > 0:
+            size_mb = self.stats.processed_size / (1024 * 1024)
             table.add_row("Processed Size", f"{size_mb:.2f} MB")
 
-        if "elapsed_time" in self.stats:
-            elapsed = self.stats["elapsed_time"]
-            minutes = int(elapsed // 60)
-            seconds = int(elapsed % 60)
+        if self.stats.elapsed_time is not None:
+            elapsed = self.stats.elapsed_time
+            minutes, seconds = divmod(int(elapsed), 60)
             table.add_row("Time Elapsed", f"{minutes}m {seconds}s")
 
-            if self.stats["processed_files"] > 0:
-                rate = self.stats["processed_files"] / elapsed
+            if self.stats.processed_files > 0:
+                rate = self.stats.processed_files / elapsed
                 table.add_row("Processing Rate", f"{rate:.1f} files/sec")
 
         self.console.print(table)
 
         success_rate = 0
-        if self.stats["processed_files"] > 0:
-            success_rate = (
-                (self.stats["processed_files"] - self.stats["failed_files"]) / self.stats["processed_files"] * 100
-            )
+        if self.stats.processed_files > 0:
+            success_rate = (self.stats.processed_files - self.stats.failed_files) / self.stats.processed_files * 100
 
         if success_rate >= 95:
             status_color = "green"
@@ -163,22 +296,20 @@ class ProgressTracker:
         self.console.print(f"[cyan][DRY RUN][/cyan] {message}")
 
     def display_file_preview(self, original: str, new_name: str, destination: str, metadata: dict[str, Any]):
-        panel_content = f"""
-[bold]Original:[/bold] {Path(original).name}
-[bold]New Name:[/bold] {new_name}
-[bold]Destination:[/bold] {destination}
-
-[bold cyan]Metadata:[/bold cyan]
-• Date: {metadata.get('datetime_original', 'Unknown')}
-• Camera: {metadata.get('camera_model', 'Unknown')}
-• Dimensions: {metadata.get('width', '?')}x{metadata.get('height', '?')}
-• ISO: {metadata.get('iso', 'N/A')}
-• F-Stop: {metadata.get('f_number', 'N/A')}
-"""
+        values = {
+            **_PREVIEW_DEFAULTS,
+            **metadata,
+            "original_name": os.path.basename(original),
+            "new_name": new_name,
+            "destination": destination,
+        }
+        panel_content = _PREVIEW_TEMPLATE.format_map(values)
 
         if metadata.get("location"):
             panel_content += f"• Location: {metadata['location']['display_name']}\n"
 
+        from rich.panel import Panel
+
         panel = Panel(
             panel_content.strip(),
             title="[bold blue]File Preview[/bold blue]",
@@ -187,21 +318,13 @@ class ProgressTracker:
 
         self.console.print(panel)
 
-    def create_statistics_table(self, stats: dict[str, Any]) -> Table:
-        table = Table(title="Library Statistics", show_header=True, header_style="bold magenta")
-
-        table.add_column("File Type", style="cyan")
-        table.add_column("Count", justify="right", style="green")
-        table.add_column("Size (MB)", justify="right", style="yellow")
-
-        if stats.get("images"):
-            table.add_row("Images", str(stats["images"]), "-")
-        if stats.get("raw_files"):
-            table.add_row("RAW Files", str(stats["raw_files"]), "-")
-        if stats.get("videos"):
-            table.add_row("Videos", str(stats["videos"]), "-")
-        if stats.get("unknown"):
-            table.add_row("Unknown", str(stats["unknown"]), "-")
+    def create_statistics_table(self, stats: dict[str, Any]) -> "Table":
+        table = _make_table(_STATISTICS_COLUMNS, title="Library Statistics")
+
+        for key, label in _STATISTICS_ROWS:
+            count = stats.get(key)
+            if count:
+                table.add_row(label, str(count), "-")
 
         table.add_row("", "", "")
         table.add_row(
@@ -114,3 +114,44 @@ class TestConfigManager:
         # This should work for existing nested keys
         result = manager.get("general.source_directory")
         assert result is not None
+
+    def test_set_does_not_leak_into_new_managers(self):
+        """Test that changes to one manager's config do not affect managers created later"""
+        manager = ConfigManager()
+        original = manager.get("general.source_directory")
+
+        manager.set("general.source_directory", "/changed")
+        assert ConfigManager().get("general.source_directory") == original
+
+    def test_custom_config_reloaded_after_change(self, tmp_path):
+        """Test that an edited config file is parsed again rather than served from cache"""
+        config_file = tmp_path / "custom.yaml"
+        config_file.write_text("general:\n  source_directory: /first\n")
+        assert ConfigManager(str(config_file)).get("general.source_directory") == "/first"
+
+        config_file.write_text("general:\n  source_directory: /second/path\n")
+        assert ConfigManager(str(config_file)).get("general.source_directory") == "/second/path"
+
+    def test_custom_config_merges_nested_sections(self, tmp_path):
+        """Test that a custom config overrides nested keys and keeps the other defaults"""
+        config_file = tmp_path / "custom.yaml"
+        config_file.write_text("general:\n  dry_run: true\nnew_section:\n  key: value\n")
+        manager = ConfigManager(str(config_file))
+
+        assert manager.get("general.dry_run") is True
+        assert manager.get("general.source_directory") == ConfigManager().get("general.source_directory")
+        assert manager.get("new_section.key") == "value"
+        assert isinstance(manager.get("file_types.images"), list)
+
+    def test_user_config_cached_as_json(self, tmp_path):
+        """Test that the user config is served from its JSON cache until the YAML changes"""
+        manager = ConfigManager()
+        manager.user_config_path = tmp_path / "config.yaml"
+        manager.user_config_path.write_text("general:\n  source_directory: /first\n")
+
+        assert manager._load_user_config() == {"general": {"source_directory": "/first"}}
+        assert (tmp_path / ".config.yaml.cache.json").exists()
+        assert manager._load_user_config() == {"general": {"source_directory": "/first"}}
+
+        manager.user_config_path.write_text("general:\n  source_directory: /second/path\n")
+        assert manager._load_user_config() == {"general": {"source_directory": "/second/path"}}
@@ -2,14 +2,17 @@
 Tests for Progress Tracker utility
 """
 
+import io
 import os
 import sys
 from unittest.mock import Mock, patch
 
+from rich.console import Console
+
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
-from utils.progress_tracker import ProgressTracker
+from utils.progress_tracker import ProcessingStats, ProgressTracker
 
 
 class TestProgressTracker:
@@ -145,3 +148,80 @@ class TestProgressTracker:
         # Should not raise exception
         tracker.update_file("test_file.jpg", "Processing")
         assert True
+
+    def test_progress_count_complete_after_stop(self):
+        """Test that buffered progress advances are all applied by stop_processing"""
+        tracker = ProgressTracker()
+        tracker.start_processing(100, "Testing")
+
+        for _ in range(100):
+            tracker.file_processed(success=True)
+
+        tracker.stop_processing()
+        assert tracker.progress.tasks[0].completed == 100
+
+    def test_file_processed_counts_actions(self):
+        """Test that file_processed tallies each outcome in the stats"""
+        tracker = ProgressTracker(verbose=False)
+        tracker.file_processed(action="copy", size=10)
+        tracker.file_processed(action="move", size=5)
+        tracker.file_processed(success=False)
+        tracker.file_processed(skipped=True)
+
+        stats = tracker.stats.to_dict()
+        assert stats["processed_files"] == 4
+        assert stats["processed_size"] == 15
+        assert stats["copied_files"] == stats["moved_files"] == 1
+        assert stats["failed_files"] == stats["skipped_files"] == 1
+        assert "elapsed_time" not in stats
+
+    def test_print_info_silent_when_quiet(self):
+        """Test that print_info prints nothing for a non-verbose tracker"""
+        tracker = ProgressTracker(verbose=False)
+        tracker.console = Mock()
+
+        tracker.print_info("Info message")
+        tracker.console.print.assert_not_called()
+
+    def test_progress_tracker_uses_given_console(self):
+        """Test that a console passed to ProgressTracker is shared rather than replaced"""
+        console = Mock()
+        tracker = ProgressTracker(console=console)
+        assert tracker.console is console
+
+        tracker.print_error("Error message")
+        console.print.assert_called_once()
+
+    def test_file_processed_batch_merges_tallies(self):
+        """Test that a batch of worker tallies is added to the stats and the progress bar"""
+        tracker = ProgressTracker()
+        tracker.start_processing(10, "Testing")
+        tracker.file_processed(action="copy", size=1)
+
+        batch = ProcessingStats()
+        for _ in range(3):
+            batch.record(action="rename", size=2)
+        batch.record(success=False)
+        batch.duplicates_found += 1
+        tracker.file_processed_batch(batch)
+        tracker.stop_processing()
+
+        assert tracker.stats.total_files == 10
+        assert tracker.stats.processed_files == 5
+        assert tracker.stats.processed_size == 7
+        assert tracker.stats.renamed_files == 3
+        assert tracker.stats.failed_files == 1
+        assert tracker.stats.duplicates_found == 1
+        assert tracker.progress.tasks[0].completed == 5
+
+    def test_progress_without_refresh_when_redirected(self):
+        """Test that a non-terminal console gets a progress bar without background refresh"""
+        tracker = ProgressTracker(console=Console(file=io.StringIO()))
+        tracker.start_processing(3, "Testing")
+        assert tracker.progress.live.auto_refresh is False
+
+        for _ in range(3):
+            tracker.file_processed(success=True)
+        tracker.stop_processing()
+
+        assert "100%" in tracker.console.file.getvalue()
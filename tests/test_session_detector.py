@@ -0,0 +1,73 @@
+"""
+Tests for SessionDetector
+"""
+
+import os
+import sys
+from datetime import datetime, timedelta
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from modules.session_detector import Session, SessionDetector
+
+
+def make_session(start: datetime, minutes: int, location: dict[str, float] | None = None) -> Session:
+    """Build a detected session spanning the given number of minutes"""
+    return Session(
+        photos=[],
+        photo_count=0,
+        start_time=start,
+        end_time=start + timedelta(minutes=minutes),
+        duration=timedelta(minutes=minutes),
+        cameras_used=(),
+        lenses_used=(),
+        location=location,
+        location_name=None,
+        total_size_mb=0,
+        file_paths=(),
+    )
+
+
+LONDON = {"latitude": 51.5074, "longitude": -0.1278}
+PARIS = {"latitude": 48.8566, "longitude": 2.3522}
+MORNING = datetime(2024, 5, 1, 9, 0)
+
+
+class TestFindSessionForPhoto:
+    """Test cases for SessionDetector.find_session_for_photo"""
+
+    def setup_method(self):
+        self.detector = SessionDetector({"session_detection": {"time_gap_minutes": 30}})
+
+    def test_photo_inside_located_session(self):
+        """Test that a photo taken during a located session at the same place matches it"""
+        session = make_session(MORNING, 60, LONDON)
+        photo = {"datetime_original": MORNING + timedelta(minutes=20), "gps": dict(LONDON)}
+
+        assert self.detector.find_session_for_photo([session], photo) is session
+
+    def test_photo_beyond_location_threshold(self):
+        """Test that a far-away photo falls back to a session without GPS, else matches nothing"""
+        located = make_session(MORNING, 60, LONDON)
+        unlocated = make_session(MORNING, 60)
+        photo = {"datetime_original": MORNING + timedelta(minutes=20), "gps": dict(PARIS)}
+
+        assert self.detector.find_session_for_photo([located, unlocated], photo) is unlocated
+        assert self.detector.find_session_for_photo([located], photo) is None
+
+    def test_photo_without_capture_time(self):
+        """Test that a photo with no usable timestamp matches no session"""
+        session = make_session(MORNING, 60)
+
+        assert self.detector.find_session_for_photo([session], {"file_name": "IMG_0001.jpg"}) is None
+
+    def test_photo_between_overlapping_windows(self):
+        """Test that the session closest in time wins when the photo fits two padded windows"""
+        earlier = make_session(MORNING, 60)
+        later = make_session(MORNING + timedelta(minutes=100), 60)
+        # 25 minutes after the first session ends, 15 minutes before the second starts
+        photo = {"datetime_original": MORNING + timedelta(minutes=85)}
+
+        assert self.detector.find_session_for_photo([earlier, later], photo) is later
+        assert self.detector.find_session_for_photo([later, earlier], photo) is later
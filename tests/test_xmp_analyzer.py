@@ -0,0 +1,66 @@
+"""
+Tests for XMPAnalyzer
+"""
+
+import io
+import os
+import sys
+
+from rich.console import Console
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import modules.xmp_analyzer as xmp_analyzer
+from modules.xmp_analyzer import XMPAnalyzer
+
+SIDECAR = """<x:xmpmeta xmlns:x="adobe:ns:meta/">
+<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#" xmlns:tiff="http://ns.adobe.com/tiff/1.0/">
+<rdf:Description rdf:about=""><tiff:Make>Canon</tiff:Make><tiff:Model>EOS R5</tiff:Model></rdf:Description>
+</rdf:RDF>
+</x:xmpmeta>
+"""
+
+
+def write_sidecars(directory, count: int) -> None:
+    """Write count identical sidecars into directory"""
+    directory.mkdir(parents=True, exist_ok=True)
+    for i in range(count):
+        (directory / f"IMG_{i:04d}.xmp").write_text(SIDECAR, encoding="utf-8")
+
+
+def make_analyzer(**kwargs) -> XMPAnalyzer:
+    """An analyzer whose console output is discarded"""
+    return XMPAnalyzer(console=Console(file=io.StringIO()), **kwargs)
+
+
+class TestXMPAnalyzer:
+    """Test cases for XMPAnalyzer"""
+
+    def test_parallel_parse_interns_fields(self, tmp_path, monkeypatch):
+        """Test that strings parsed in worker processes are interned in the parent"""
+        monkeypatch.setattr(xmp_analyzer, "PARALLEL_PARSE_MIN_FILES", 1)
+        monkeypatch.setattr(os, "process_cpu_count", lambda: 2)
+        write_sidecars(tmp_path / "library", 3 * xmp_analyzer.PARSE_BATCH_SIZE)
+
+        analyzer = make_analyzer()
+        analyzer.analyze_library(str(tmp_path / "library"), str(tmp_path / "reports"))
+
+        assert len(analyzer.photos) == 3 * xmp_analyzer.PARSE_BATCH_SIZE
+        canon, eos_r5 = sys.intern("Canon"), sys.intern("EOS R5")
+        assert all(photo.camera_make is canon for photo in analyzer.photos)
+        assert all(photo.camera_model is eos_r5 for photo in analyzer.photos)
+
+    def test_skip_dirs_default_and_override(self, tmp_path):
+        """Test that skipped directories are excluded by default and searched once the list is overridden"""
+        library = tmp_path / "library"
+        write_sidecars(library, 2)
+        write_sidecars(library / ".cache", 3)
+
+        analyzer = make_analyzer()
+        analyzer.analyze_library(str(library), str(tmp_path / "reports"))
+        assert analyzer.xmp_files_found == 2
+
+        analyzer = make_analyzer(skip_dirs=[])
+        analyzer.analyze_library(str(library), str(tmp_path / "reports"))
+        assert analyzer.xmp_files_found == 5